@@ -0,0 +1,487 @@
+from __future__ import annotations
+
+import atexit
+import heapq
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from .locking import locked
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+def _encode_record(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _legacy_records(raw: Any) -> List[Dict[str, Any]]:
+    """
+    Flatten the layouts attempts.json has used over time: a plain list of
+    attempts, or a dict of attempt lists keyed by student id.
+    """
+
+    if isinstance(raw, dict):
+        records: List[Dict[str, Any]] = []
+        for student_id, attempts in raw.items():
+            for item in attempts or []:
+                if isinstance(item, dict):
+                    records.append({**item, "student_id": item.get("student_id") or student_id})
+        return records
+    if isinstance(raw, list):
+        return [item for item in raw if isinstance(item, dict)]
+    return []
+
+
+class IndexEntry(NamedTuple):
+    """
+    Location of one attempt line in the log plus the columns reads filter on.
+    """
+
+    offset: int
+    length: int
+    student_id: str
+    unit_id: str
+    quiz_type: str
+    created_at: float
+
+    @classmethod
+    def for_record(cls, offset: int, length: int, record: Dict[str, Any]) -> "IndexEntry":
+        try:
+            created_at = float(record.get("created_at") or 0.0)
+        except (TypeError, ValueError):
+            created_at = 0.0
+        return cls(
+            offset,
+            length,
+            str(record.get("student_id") or ""),
+            str(record.get("unit_id") or ""),
+            str(record.get("quiz_type") or ""),
+            created_at,
+        )
+
+
+class AttemptIndex:
+    """
+    Secondary index from student_id, unit_id and quiz_type to attempt lines.
+
+    The index is persisted as a sidecar JSON Lines file that is appended to
+    alongside the log. Each process loads it once and then only reads the new
+    sidecar lines; any part of the log the sidecar does not cover yet (for
+    example after a crash between the two writes) is indexed by parsing just
+    that tail of the log.
+    """
+
+    def __init__(self, log_path: Path, path: Path) -> None:
+        self.log_path = log_path
+        self.path = path
+        self._entries: Dict[int, IndexEntry] = {}
+        self.by_student: Dict[str, List[IndexEntry]] = {}
+        self.by_unit: Dict[str, List[IndexEntry]] = {}
+        self.by_quiz_type: Dict[str, List[IndexEntry]] = {}
+        self._sidecar_pos = 0
+        self._covered_end = 0
+        self._fd: Optional[int] = None
+
+    def reset(self) -> None:
+        self._entries.clear()
+        self.by_student.clear()
+        self.by_unit.clear()
+        self.by_quiz_type.clear()
+        self._sidecar_pos = 0
+        self._covered_end = 0
+        self.close()
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _add(self, entry: IndexEntry) -> bool:
+        if entry.offset in self._entries:
+            return False
+        self._entries[entry.offset] = entry
+        self.by_student.setdefault(entry.student_id, []).append(entry)
+        self.by_unit.setdefault(entry.unit_id, []).append(entry)
+        self.by_quiz_type.setdefault(entry.quiz_type, []).append(entry)
+        return True
+
+    def _advance_coverage(self) -> None:
+        while True:
+            entry = self._entries.get(self._covered_end)
+            if entry is None:
+                return
+            self._covered_end = entry.offset + entry.length
+
+    def record(self, entries: List[IndexEntry]) -> None:
+        """
+        Persist entries for lines that were just appended to the log.
+        """
+
+        if not entries:
+            return
+        payload = b"".join(
+            (json.dumps(list(entry), separators=(",", ":")) + "\n").encode("utf-8")
+            for entry in entries
+        )
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        os.write(self._fd, payload)
+
+    def _read_sidecar(self) -> None:
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size <= self._sidecar_pos:
+            return
+        with self.path.open("rb") as f:
+            f.seek(self._sidecar_pos)
+            chunk = f.read(size - self._sidecar_pos)
+        # Only consume complete lines; a writer may be mid-line.
+        complete = chunk.rfind(b"\n") + 1
+        for line in chunk[:complete].splitlines():
+            try:
+                entry = IndexEntry(*json.loads(line))
+            except (TypeError, ValueError):
+                continue
+            self._add(entry)
+        self._sidecar_pos += complete
+
+    def _index_log_tail(self, log_size: int) -> None:
+        healed: List[IndexEntry] = []
+        with self.log_path.open("rb") as f:
+            f.seek(self._covered_end)
+            offset = self._covered_end
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # in-flight append
+                length = len(line)
+                if offset not in self._entries and line.strip():
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        record = None
+                    if isinstance(record, dict):
+                        entry = IndexEntry.for_record(offset, length, record)
+                        self._add(entry)
+                        healed.append(entry)
+                offset += length
+                if offset >= log_size:
+                    break
+        self._covered_end = offset
+        self.record(healed)
+
+    def refresh(self) -> None:
+        try:
+            log_size = self.log_path.stat().st_size
+        except FileNotFoundError:
+            log_size = 0
+        if log_size < self._covered_end:
+            # The log was replaced underneath us; start over.
+            self.reset()
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+        self._read_sidecar()
+        self._advance_coverage()
+        if self._covered_end < log_size:
+            self._index_log_tail(log_size)
+
+    def entries(
+        self,
+        student_id: Optional[str] = None,
+        unit_id: Optional[str] = None,
+        quiz_type: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> List[IndexEntry]:
+        candidates = [
+            lookup.get(key, [])
+            for lookup, key in (
+                (self.by_student, student_id),
+                (self.by_unit, unit_id),
+                (self.by_quiz_type, quiz_type),
+            )
+            if key is not None
+        ]
+        smallest = min(candidates, key=len) if candidates else list(self._entries.values())
+        selected = [
+            entry
+            for entry in smallest
+            if (student_id is None or entry.student_id == student_id)
+            and (unit_id is None or entry.unit_id == unit_id)
+            and (quiz_type is None or entry.quiz_type == quiz_type)
+            and (since is None or entry.created_at >= since)
+            and (until is None or entry.created_at < until)
+        ]
+        selected.sort(key=lambda entry: entry.offset)
+        return selected
+
+
+class AttemptLog:
+    """
+    Append-only JSON Lines store for attempts.
+
+    Each attempt is one line, so recording a submission costs a single
+    O_APPEND write regardless of how many attempts already exist. Appends are
+    serialized across processes with the log's writer lock; reads never take
+    it and simply ignore a trailing line that is still being written. Writes are
+    fsynced in batches: after ``fsync_every`` appends or ``fsync_interval``
+    seconds, whichever comes first, and once more at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        legacy_path: Optional[Path] = None,
+        fsync_every: int = 32,
+        fsync_interval: float = 1.0,
+    ) -> None:
+        self.path = path
+        self.legacy_path = legacy_path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.index = AttemptIndex(path, path.with_name(path.name + ".idx"))
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._migrated = False
+        atexit.register(self.sync)
+
+    def _ensure_migrated(self) -> None:
+        if self._migrated:
+            return
+        with self._lock, locked(self.path):
+            if not self._migrated:
+                self.migrate_legacy()
+                self._migrated = True
+
+    def migrate_legacy(self) -> int:
+        """
+        One-shot conversion of the legacy attempts.json file into the log.
+
+        Does nothing once the log exists. Returns the number of migrated
+        attempts.
+        """
+
+        if self.path.exists():
+            return 0
+        records: List[Dict[str, Any]] = []
+        if self.legacy_path and self.legacy_path.exists():
+            try:
+                with self.legacy_path.open() as f:
+                    records = _legacy_records(json.load(f))
+            except json.JSONDecodeError:
+                records = []
+        # Any sidecar left behind describes a log that no longer exists.
+        self.index.reset()
+        try:
+            self.index.path.unlink()
+        except FileNotFoundError:
+            pass
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("wb") as f:
+            for record in records:
+                f.write(_encode_record(record))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        return len(records)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self.append_many([record])
+
+    def append_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        records = list(records)
+        if not records:
+            return
+        lines = [_encode_record(record) for record in records]
+        self._ensure_migrated()
+        # The cross-process lock keeps each batch contiguous and makes the
+        # offsets recorded in the index exact.
+        with self._lock, locked(self.path):
+            if self._fd is None:
+                self._fd = os.open(
+                    self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+                )
+                if not self._ends_with_newline():
+                    # Seal a torn line so it cannot swallow the next record.
+                    os.write(self._fd, b"\n")
+            offset = os.lseek(self._fd, 0, os.SEEK_END)
+            entries: List[IndexEntry] = []
+            for record, line in zip(records, lines):
+                entries.append(IndexEntry.for_record(offset, len(line), record))
+                offset += len(line)
+            view = memoryview(b"".join(lines))
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+            self.index.record(entries)
+            self._unsynced += 1
+            if (
+                self._unsynced >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval
+            ):
+                self._sync_locked()
+
+    def _ends_with_newline(self) -> bool:
+        with self.path.open("rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _sync_locked(self) -> None:
+        if self._fd is not None and self._unsynced:
+            os.fsync(self._fd)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self) -> None:
+        with self._lock:
+            self._sync_locked()
+
+    def iter_records(
+        self,
+        student_id: Optional[str] = None,
+        unit_id: Optional[str] = None,
+        quiz_type: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield attempt records in append order, one line at a time.
+
+        ``since`` and ``until`` bound ``created_at`` as a half-open range
+        ``[since, until)``. Without filters the log is scanned sequentially;
+        with filters only the lines the index points at are read and parsed.
+        """
+
+        self._ensure_migrated()
+        if all(value is None for value in (student_id, unit_id, quiz_type, since, until)):
+            yield from self._scan()
+            return
+
+        with self._lock:
+            self.index.refresh()
+            entries = self.index.entries(student_id, unit_id, quiz_type, since, until)
+        if not entries:
+            return
+        with self.path.open("rb") as f:
+            for entry in entries:
+                f.seek(entry.offset)
+                try:
+                    record = json.loads(f.read(entry.length))
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+    def page_records(
+        self,
+        student_id: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        after: Optional[Tuple[float, int]] = None,
+        limit: int = 50,
+        descending: bool = False,
+    ) -> List[Tuple[Tuple[float, int], Dict[str, Any]]]:
+        """
+        Return up to ``limit`` ``(key, record)`` pairs ordered by
+        ``key = (created_at, offset)``, starting strictly after ``after``.
+
+        The page is chosen from index entries alone; only its own lines are
+        read from the log.
+        """
+
+        self._ensure_migrated()
+        with self._lock:
+            self.index.refresh()
+            entries = self.index.entries(student_id, since=since, until=until)
+        if after is not None:
+            if descending:
+                entries = [e for e in entries if (e.created_at, e.offset) < after]
+            else:
+                entries = [e for e in entries if (e.created_at, e.offset) > after]
+        select = heapq.nlargest if descending else heapq.nsmallest
+        entries = select(limit, entries, key=lambda entry: (entry.created_at, entry.offset))
+        if not entries:
+            return []
+        page = []
+        with self.path.open("rb") as f:
+            for entry in entries:
+                f.seek(entry.offset)
+                try:
+                    record = json.loads(f.read(entry.length))
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    page.append(((entry.created_at, entry.offset), record))
+        return page
+
+    def generation(self) -> str:
+        """
+        Identifier that changes whenever the log file is replaced.
+        """
+
+        self._ensure_migrated()
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return ""
+        return f"{stat.st_dev}:{stat.st_ino}"
+
+    def end_cursor(self) -> int:
+        self._ensure_migrated()
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def read_since(self, cursor: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yield ``(cursor, record)`` for every complete line after ``cursor``,
+        where the yielded cursor points just past that record.
+        """
+
+        self._ensure_migrated()
+        try:
+            f = self.path.open("rb")
+        except FileNotFoundError:
+            return
+        with f:
+            f.seek(cursor)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return  # in-flight append
+                cursor += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    yield cursor, record
+
+    def _scan(self) -> Iterator[Dict[str, Any]]:
+        try:
+            f = self.path.open("rb")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn trailing line from an interrupted write.
+                    continue
+                if isinstance(record, dict):
+                    yield record
@@ -0,0 +1,6 @@
+"""
+Benchmarks for the backend.
+
+Each module is runnable from ``src`` with ``python -m backend.benchmarks.<name>``
+and works on a scratch copy of the seed data, never on ``backend/data``.
+"""
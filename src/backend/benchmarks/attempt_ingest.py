@@ -0,0 +1,98 @@
+"""
+Compare attempt ingestion through POST /api/attempts one at a time against
+POST /api/attempts/batch.
+
+    python -m backend.benchmarks.attempt_ingest --attempts 500 --students 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from .common import emit, use_scratch_data_dir
+
+
+def _make_payloads(count: int, students: int, seed: int) -> List[Dict]:
+    from ..repository import load_quizzes
+
+    rng = random.Random(seed)
+    quizzes = [quiz for quiz in load_quizzes().values() if quiz.question_ids]
+    payloads = []
+    for i in range(count):
+        quiz = rng.choice(quizzes)
+        results = [
+            {
+                "question_id": qid,
+                "correct": rng.random() < 0.6,
+                "chosen_answer": "A",
+                "time_sec": round(rng.uniform(5, 90), 1),
+                "used_hint": rng.random() < 0.1,
+            }
+            for qid in quiz.question_ids
+        ]
+        correct = sum(1 for r in results if r["correct"])
+        payloads.append(
+            {
+                "student_id": f"bench-{i % students}",
+                "quiz_id": quiz.id,
+                "quiz_type": quiz.type,
+                "unit_id": quiz.unit_id,
+                "section_id": quiz.section_id,
+                "score_pct": round(correct / len(results) * 100, 1),
+                "created_at": 1_700_000_000 + i,
+                "results": results,
+            }
+        )
+    return payloads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--attempts", type=int, default=500)
+    parser.add_argument("--students", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    use_scratch_data_dir()
+    from ..main import create_app
+
+    client = create_app().test_client()
+    payloads = _make_payloads(args.attempts, args.students, args.seed)
+
+    start = time.perf_counter()
+    for payload in payloads:
+        response = client.post("/api/attempts", json=payload)
+        assert response.status_code == 201, response.get_data(as_text=True)
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for offset in range(0, len(payloads), args.batch_size):
+        chunk = payloads[offset : offset + args.batch_size]
+        response = client.post("/api/attempts/batch", json={"attempts": chunk})
+        assert response.status_code == 201, response.get_data(as_text=True)
+    batch_seconds = time.perf_counter() - start
+
+    emit(
+        {
+            "attempts": args.attempts,
+            "students": args.students,
+            "batch_size": args.batch_size,
+            "single": {
+                "seconds": round(single_seconds, 4),
+                "attempts_per_sec": round(args.attempts / single_seconds, 1),
+            },
+            "batch": {
+                "seconds": round(batch_seconds, 4),
+                "attempts_per_sec": round(args.attempts / batch_seconds, 1),
+            },
+            "speedup": round(single_seconds / batch_seconds, 2),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Report the memory cost per stored answer for loaded attempts.
+
+Compares the original dict-backed dataclasses with the slotted
+``AttemptQuestionResult`` list and the packed ``PackedResults`` layout
+that ``load_attempts`` now produces.
+
+    python -m backend.benchmarks.attempt_memory --attempts 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, List
+
+from .common import emit, use_scratch_data_dir
+
+
+@dataclass
+class _DictResult:
+    question_id: str
+    correct: bool
+    chosen_answer: str
+    time_sec: float
+    used_hint: bool = False
+
+
+@dataclass
+class _DictAttempt:
+    id: str
+    student_id: str
+    quiz_id: str
+    quiz_type: str
+    unit_id: str
+    section_id: str
+    score_pct: float
+    created_at: float
+    results: List[_DictResult] = field(default_factory=list)
+
+
+def _measure(build: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--attempts", type=int, default=20000)
+    parser.add_argument("--results-per-attempt", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    use_scratch_data_dir()
+    from ..models import Attempt, AttemptQuestionResult
+    from ..repository import _deserialize_attempt
+
+    rng = random.Random(args.seed)
+    # f-strings give every record its own id strings, as json.loads does.
+    records = [
+        {
+            "id": f"attempt-{i}",
+            "student_id": f"student-{rng.randrange(500)}",
+            "quiz_id": f"quiz-{rng.randrange(60)}",
+            "quiz_type": rng.choice(["diagnostic", "practice", "mini_quiz", "unit_test"]),
+            "unit_id": f"unit-{rng.randrange(8)}",
+            "section_id": f"section-{rng.randrange(4)}",
+            "score_pct": rng.random() * 100,
+            "created_at": 1_700_000_000 + i,
+            "results": [
+                {
+                    "question_id": f"q{rng.randrange(600)}",
+                    "correct": rng.random() < 0.6,
+                    "chosen_answer": rng.choice(["A", "B", "C", "D", "True", "False"]),
+                    "time_sec": round(rng.uniform(1, 120), 1),
+                    "used_hint": rng.random() < 0.1,
+                }
+                for _ in range(args.results_per_attempt)
+            ],
+        }
+        for i in range(args.attempts)
+    ]
+    answers = args.attempts * args.results_per_attempt
+
+    def legacy():
+        return [
+            _DictAttempt(
+                **{k: v for k, v in r.items() if k != "results"},
+                results=[_DictResult(**x) for x in r["results"]],
+            )
+            for r in records
+        ]
+
+    def slotted():
+        return [
+            Attempt(
+                **{k: v for k, v in r.items() if k != "results"},
+                results=[AttemptQuestionResult(**x) for x in r["results"]],
+            )
+            for r in records
+        ]
+
+    def packed():
+        return [_deserialize_attempt(r) for r in records]
+
+    report = {"attempts": args.attempts, "answers": answers}
+    for name, build in (("dict_dataclasses", legacy), ("slotted", slotted), ("packed", packed)):
+        total = _measure(build)
+        report[name] = {
+            "bytes": total,
+            "bytes_per_answer": round(total / answers, 1),
+        }
+    report["reduction"] = round(
+        report["dict_dataclasses"]["bytes"] / report["packed"]["bytes"], 1
+    )
+    emit(report)
+
+
+if __name__ == "__main__":
+    main()
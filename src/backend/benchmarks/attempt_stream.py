@@ -0,0 +1,110 @@
+"""
+Compare peak memory of a single-pass analytics job over a fully loaded
+attempt list against the lazy ``iter_attempts`` generator, and check that
+time-range pushdown returns the same attempts as filtering in Python.
+
+    python -m backend.benchmarks.attempt_stream --attempts 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+from .common import emit, use_scratch_data_dir
+
+
+def _peak(fn: Callable[[], Any]) -> Tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--attempts", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    use_scratch_data_dir()
+    from ..ml.difficulty import estimate_question_difficulty
+    from ..models import Attempt, AttemptQuestionResult
+    from ..repository import (
+        append_attempts,
+        get_attempts_for_all_students,
+        iter_attempts,
+        load_questions,
+        load_quizzes,
+    )
+
+    rng = random.Random(args.seed)
+    quizzes = [quiz for quiz in load_quizzes().values() if quiz.question_ids]
+    batch = []
+    for i in range(args.attempts):
+        quiz = rng.choice(quizzes)
+        batch.append(
+            Attempt(
+                id=f"stream-{i}",
+                student_id=f"bench-{rng.randrange(200)}",
+                quiz_id=quiz.id,
+                quiz_type=quiz.type,
+                unit_id=quiz.unit_id,
+                section_id=quiz.section_id,
+                score_pct=rng.random() * 100,
+                created_at=1_700_000_000 + i,
+                results=[
+                    AttemptQuestionResult(
+                        question_id=qid,
+                        correct=rng.random() < 0.6,
+                        chosen_answer="A",
+                        time_sec=round(rng.uniform(5, 90), 1),
+                    )
+                    for qid in quiz.question_ids
+                ],
+            )
+        )
+        if len(batch) == 1000:
+            append_attempts(batch)
+            batch = []
+    if batch:
+        append_attempts(batch)
+
+    questions = load_questions()
+    loaded, loaded_peak = _peak(
+        lambda: estimate_question_difficulty(get_attempts_for_all_students(), questions)
+    )
+    streamed, streamed_peak = _peak(
+        lambda: estimate_question_difficulty(iter_attempts(), questions)
+    )
+    assert loaded == streamed
+
+    since = 1_700_000_000 + args.attempts // 4
+    until = since + args.attempts // 2
+    unit_id = quizzes[0].unit_id
+    pushed = [a.id for a in iter_attempts(unit_id=unit_id, since=since, until=until)]
+    expected = [
+        a.id
+        for a in iter_attempts()
+        if a.unit_id == unit_id and since <= a.created_at < until
+    ]
+    assert pushed == expected
+
+    emit(
+        {
+            "attempts": args.attempts,
+            "list_peak_bytes": loaded_peak,
+            "iter_peak_bytes": streamed_peak,
+            "reduction": round(loaded_peak / max(streamed_peak, 1), 1),
+            "range_filter_matches": len(pushed),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
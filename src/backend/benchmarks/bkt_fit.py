@@ -0,0 +1,82 @@
+"""
+Fit BKT parameters on synthetic answers drawn from known per-skill
+parameters and report fit time and how closely the parameters are
+recovered.
+
+    python -m backend.benchmarks.bkt_fit --observations 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import numpy as np
+
+from .common import emit, use_scratch_data_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--observations", type=int, default=1_000_000)
+    parser.add_argument("--skills", type=int, default=20)
+    parser.add_argument("--sequence-length", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=17)
+    args = parser.parse_args()
+
+    use_scratch_data_dir()
+    from ..ml.bkt import Observations, fit_bkt_params
+
+    rng = np.random.default_rng(args.seed)
+    truth = {
+        "prior": rng.uniform(0.1, 0.5, args.skills),
+        "learn": rng.uniform(0.05, 0.3, args.skills),
+        "slip": rng.uniform(0.05, 0.2, args.skills),
+        "guess": rng.uniform(0.1, 0.3, args.skills),
+    }
+
+    length = args.sequence_length
+    n_sequences = args.observations // length
+    seq_skill = rng.integers(0, args.skills, n_sequences)
+    known = rng.random(n_sequences) < truth["prior"][seq_skill]
+    correct = np.empty((n_sequences, length), dtype=bool)
+    for t in range(length):
+        p_correct = np.where(known, 1.0 - truth["slip"][seq_skill], truth["guess"][seq_skill])
+        correct[:, t] = rng.random(n_sequences) < p_correct
+        known |= rng.random(n_sequences) < truth["learn"][seq_skill]
+
+    obs = Observations(
+        skill_ids=[f"skill-{i}" for i in range(args.skills)],
+        skill=np.repeat(seq_skill, length),
+        sequence=np.repeat(np.arange(n_sequences), length),
+        correct=correct.reshape(-1),
+    )
+    result = fit_bkt_params(obs)
+
+    errors = {
+        name: round(
+            float(
+                np.mean(
+                    [
+                        abs(getattr(result.skills[f"skill-{i}"], name) - truth[name][i])
+                        for i in range(args.skills)
+                    ]
+                )
+            ),
+            4,
+        )
+        for name in truth
+    }
+    emit(
+        {
+            "observations": len(obs),
+            "skills": args.skills,
+            "sequences": n_sequences,
+            "iterations": result.iterations,
+            "fit_seconds": result.seconds,
+            "mean_abs_error": errors,
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+SEED_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+CONTENT_FILES = ("units.json", "questions.json", "quizzes.json", "users.json")
+
+
+def use_scratch_data_dir(copy_students: bool = True) -> Path:
+    """
+    Point the backend at a fresh temporary data directory seeded with the
+    content files. Must run before ``backend.repository`` is imported.
+    """
+
+    if "backend.repository" in sys.modules:
+        raise RuntimeError("use_scratch_data_dir() must run before importing the backend")
+    data_dir = Path(tempfile.mkdtemp(prefix="bitbybit-bench-"))
+    files = CONTENT_FILES + (("students.json",) if copy_students else ())
+    for name in files:
+        shutil.copy(SEED_DATA_DIR / name, data_dir / name)
+    os.environ["BITBYBIT_DATA_DIR"] = str(data_dir)
+    return data_dir
+
+
+def timed(fn: Callable[[], Any], repeat: int = 1) -> Dict[str, float]:
+    """
+    Run ``fn`` ``repeat`` times and report total and per-call wall-clock time.
+    """
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = time.perf_counter() - start
+    return {
+        "seconds": round(elapsed, 6),
+        "per_call_ms": round(elapsed / repeat * 1000.0, 4),
+        "calls": repeat,
+    }
+
+
+def emit(results: Dict[str, Any]) -> None:
+    print(json.dumps(results, indent=2, sort_keys=True))
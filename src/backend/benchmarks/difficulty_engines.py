@@ -0,0 +1,120 @@
+"""
+Compare the pure-Python difficulty estimator with the columnar NumPy engine
+and check that both produce identical payloads.
+
+    python -m backend.benchmarks.difficulty_engines --rows 10000 1000000 10000000
+
+The reference implementation needs one dataclass per answer, so it only
+runs up to ``--reference-max-rows``; larger sizes time the columnar engine
+alone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from .common import emit, use_scratch_data_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--questions", type=int, default=2000)
+    parser.add_argument("--results-per-attempt", type=int, default=10)
+    parser.add_argument("--reference-max-rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    use_scratch_data_dir()
+    import numpy as np
+
+    from ..ml.columnar import ResultColumns, estimate_question_difficulty_vectorized
+    from ..ml.difficulty import estimate_question_difficulty
+    from ..models import Attempt, AttemptQuestionResult, Question
+
+    rng = np.random.default_rng(args.seed)
+    question_ids = [f"bench-q{i}" for i in range(args.questions)]
+    question_lookup = {
+        qid: Question(
+            id=qid,
+            unit_id="bench-unit",
+            section_id="bench-section",
+            text=qid,
+            type="mcq",
+            options=["A", "B"],
+            correct_answer="A",
+            difficulty=("easy", "medium", "hard")[i % 3],
+            estimated_time_sec=30 + (i % 4) * 15,
+        )
+        for i, qid in enumerate(question_ids)
+    }
+
+    runs = []
+    for rows in args.rows:
+        codes = rng.integers(0, args.questions, size=rows)
+        correct = rng.random(rows) < 0.65
+        time_sec = np.round(rng.gamma(2.0, 20.0, size=rows), 1)
+        time_sec[rng.random(rows) < 0.05] = 0.0
+        columns = ResultColumns(
+            question_ids=question_ids,
+            question_index=codes.astype(np.int64),
+            correct=correct,
+            time_sec=time_sec,
+        )
+
+        start = time.perf_counter()
+        vectorized = estimate_question_difficulty_vectorized(columns, question_lookup)
+        vectorized_seconds = time.perf_counter() - start
+        run = {
+            "rows": rows,
+            "vectorized_seconds": round(vectorized_seconds, 4),
+            "vectorized_rows_per_sec": round(rows / vectorized_seconds),
+        }
+
+        if rows <= args.reference_max_rows:
+            code_list = codes.tolist()
+            correct_list = correct.tolist()
+            time_list = time_sec.tolist()
+            step = args.results_per_attempt
+            attempts = [
+                Attempt(
+                    id=str(offset),
+                    student_id="bench",
+                    quiz_id="bench-quiz",
+                    quiz_type="practice",
+                    unit_id="bench-unit",
+                    section_id=None,
+                    score_pct=0.0,
+                    results=[
+                        AttemptQuestionResult(
+                            question_id=question_ids[code_list[i]],
+                            correct=correct_list[i],
+                            chosen_answer="A",
+                            time_sec=time_list[i],
+                        )
+                        for i in range(offset, min(offset + step, rows))
+                    ],
+                )
+                for offset in range(0, rows, step)
+            ]
+            start = time.perf_counter()
+            reference = estimate_question_difficulty(attempts, question_lookup)
+            reference_seconds = time.perf_counter() - start
+            if reference != vectorized or list(reference) != list(vectorized):
+                raise SystemExit(f"vectorized output differs from reference at {rows} rows")
+            run.update(
+                {
+                    "reference_seconds": round(reference_seconds, 4),
+                    "reference_rows_per_sec": round(rows / reference_seconds),
+                    "speedup": round(reference_seconds / vectorized_seconds, 1),
+                    "identical": True,
+                }
+            )
+        runs.append(run)
+
+    emit({"questions": args.questions, "runs": runs})
+
+
+if __name__ == "__main__":
+    main()
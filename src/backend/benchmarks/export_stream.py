@@ -0,0 +1,75 @@
+"""
+Stream /api/export/attempts over a synthetic dataset and report throughput
+and peak traced memory, which should stay flat as the dataset grows.
+
+    python -m backend.benchmarks.export_stream --students 5000 \\
+        --attempts-per-student 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from .common import emit
+from .synthetic import add_scale_arguments, generate_dataset, scale_from_args
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_scale_arguments(parser)
+    parser.set_defaults(students=2000, attempts_per_student=100)
+    args = parser.parse_args()
+
+    if "backend.repository" in sys.modules:
+        raise RuntimeError("run this benchmark before importing the backend")
+    data_dir = Path(tempfile.mkdtemp(prefix="bitbybit-bench-"))
+    dataset = generate_dataset(data_dir, scale_from_args(args))
+    os.environ["BITBYBIT_DATA_DIR"] = str(data_dir)
+    os.environ["BITBYBIT_ADMIN_TOKEN"] = "bench"
+
+    from ..main import create_app
+
+    client = create_app().test_client()
+    headers = {"X-Admin-Token": "bench"}
+
+    def export(query: str, trace: bool):
+        gc.collect()
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        response = client.get(f"/api/export/attempts?{query}", headers=headers, buffered=False)
+        size = lines = 0
+        for chunk in response.response:
+            size += len(chunk)
+            lines += chunk.count(b"\n")
+        response.close()
+        elapsed = time.perf_counter() - start
+        result = {"seconds": round(elapsed, 2), "bytes": size}
+        if not query.endswith("gzip=1"):
+            result["lines"] = lines
+            result["lines_per_sec"] = round(lines / elapsed)
+        if trace:
+            result["peak_traced_mb"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+            tracemalloc.stop()
+        return result
+
+    report = {"dataset": dataset}
+    for name, query in (
+        ("attempts", "rows=attempts"),
+        ("results", "rows=results"),
+        ("results_gzip", "rows=results&gzip=1"),
+    ):
+        report[name] = export(query, trace=False)
+    report["peak_traced_mb"] = export("rows=results&gzip=1", trace=True)["peak_traced_mb"]
+    emit(report)
+
+
+if __name__ == "__main__":
+    main()
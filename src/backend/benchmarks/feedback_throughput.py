@@ -0,0 +1,112 @@
+"""
+Feedback generation throughput against a large attempt history.
+
+Each round appends one attempt, as POST /api/attempts does, and then
+generates feedback for it. The report compares three costs:
+
+- rebuilding the full difficulty payload from the maintained aggregate,
+  which feedback used to do after every new attempt;
+- the feedback call itself, which now scores only the attempt's questions;
+- the original full-history recomputation, measured once.
+
+    python -m backend.benchmarks.feedback_throughput --students 5000 \\
+        --attempts-per-student 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .common import emit
+from .synthetic import add_scale_arguments, generate_dataset, scale_from_args
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_scale_arguments(parser)
+    parser.set_defaults(students=5000, attempts_per_student=200)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument(
+        "--skip-full-history",
+        action="store_true",
+        help="do not time the original full-history recomputation",
+    )
+    args = parser.parse_args()
+
+    if "backend.repository" in sys.modules:
+        raise RuntimeError("run this benchmark before importing the backend")
+    scale = scale_from_args(args)
+    data_dir = Path(tempfile.mkdtemp(prefix="bitbybit-bench-"))
+    start = time.perf_counter()
+    dataset = generate_dataset(data_dir, scale)
+    generate_seconds = time.perf_counter() - start
+    os.environ["BITBYBIT_DATA_DIR"] = str(data_dir)
+
+    from ..ml import estimate_question_difficulty, generate_personalized_feedback
+    from ..ml.difficulty import current_question_difficulty, question_difficulty, question_stats
+    from ..repository import (
+        append_attempt,
+        iter_attempts,
+        load_attempts,
+        load_questions,
+        load_student,
+    )
+
+    start = time.perf_counter()
+    question_stats.refresh()
+    catch_up_seconds = time.perf_counter() - start
+
+    rng = random.Random(scale.seed)
+    student_ids = [f"student-{rng.randint(1, scale.students)}" for _ in range(50)]
+    samples = [
+        (load_student(student_id), attempt)
+        for student_id in student_ids
+        for attempt in load_attempts(student_id)[-20:]
+    ]
+
+    rebuild_seconds = 0.0
+    feedback_seconds = 0.0
+    for round_index in range(args.rounds):
+        student, attempt = samples[round_index % len(samples)]
+        append_attempt(attempt)
+
+        question_ids = [result.question_id for result in attempt.results]
+        start = time.perf_counter()
+        full = current_question_difficulty()
+        rebuild_seconds += time.perf_counter() - start
+        present = [qid for qid in question_ids if qid in full]
+
+        # Append again so feedback also sees a fresh difficulty version.
+        append_attempt(attempt)
+        start = time.perf_counter()
+        generate_personalized_feedback(student, attempt)
+        feedback_seconds += time.perf_counter() - start
+        if round_index < 50:
+            # The per-question path must agree with the full payload.
+            full = current_question_difficulty()
+            assert question_difficulty(question_ids) == {qid: full[qid] for qid in present}
+
+    report = {
+        "dataset": dataset,
+        "generate_seconds": round(generate_seconds, 2),
+        "view_catch_up_seconds": round(catch_up_seconds, 2),
+        "rounds": args.rounds,
+        "full_payload_rebuild_ms": round(rebuild_seconds / args.rounds * 1000.0, 4),
+        "feedback_ms": round(feedback_seconds / args.rounds * 1000.0, 4),
+        "feedback_per_sec": round(args.rounds / feedback_seconds, 1),
+    }
+    if not args.skip_full_history:
+        start = time.perf_counter()
+        estimate_question_difficulty(iter_attempts(), load_questions())
+        report["original_full_history_ms"] = round((time.perf_counter() - start) * 1000.0, 1)
+    emit(report)
+
+
+if __name__ == "__main__":
+    main()
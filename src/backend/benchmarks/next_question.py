@@ -0,0 +1,124 @@
+"""
+Latency of ``pick_next_question`` as the question bank grows, compared with
+the original scan that scored and sorted every question on each call.
+
+Both strategies are run with the same random seed for every query and must
+return the same question.
+
+    python -m backend.benchmarks.next_question --sizes 1000 10000 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from .common import emit
+from .synthetic import Scale, generate_dataset
+
+
+def _scan_pick(student, unit_id: Optional[str] = None, section_id: Optional[str] = None):
+    """
+    The original full-scan implementation, kept here as the reference.
+    """
+
+    from ..repository import load_questions
+
+    all_questions = list(load_questions().values())
+    if unit_id:
+        all_questions = [q for q in all_questions if q.unit_id == unit_id]
+    if section_id:
+        all_questions = [q for q in all_questions if q.section_id == section_id]
+    if not all_questions:
+        return None
+
+    def mastery_score(q) -> float:
+        if not q.skill_ids:
+            return 50.0
+        vals = []
+        for s_id in q.skill_ids:
+            mastery = student.mastery_by_skill.get(s_id)
+            vals.append(mastery.pct if mastery else 0.0)
+        return sum(vals) / len(vals)
+
+    preferred = student.preferred_difficulty
+    scored = []
+    for q in all_questions:
+        base = mastery_score(q)
+        if q.difficulty == preferred:
+            base -= 10.0
+        scored.append((base, q))
+    scored.sort(key=lambda t: t[0])
+    top_n = [q for _, q in scored[: min(10, len(scored))]]
+    return random.choice(top_n)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    if "backend.repository" in sys.modules:
+        raise RuntimeError("run this benchmark before importing the backend")
+    data_dir = Path(tempfile.mkdtemp(prefix="bitbybit-bench-"))
+    os.environ["BITBYBIT_DATA_DIR"] = str(data_dir)
+
+    from ..models import SkillMastery, StudentState
+    from ..recommender import pick_next_question
+    from ..repository import load_questions
+
+    report = {}
+    for size in args.sizes:
+        scale = Scale(students=10, attempts_per_student=0)
+        sections = scale.units * scale.sections_per_unit
+        scale.questions_per_section = max(1, size // sections)
+        generate_dataset(data_dir, scale)
+        questions = list(load_questions().values())
+
+        rng = random.Random(args.seed)
+        skills = sorted({skill for q in questions for skill in q.skill_ids})
+        student = StudentState(student_id="bench", name="Bench", preferred_difficulty="hard")
+        for skill in rng.sample(skills, len(skills) // 2):
+            total = rng.randint(1, 20)
+            student.mastery_by_skill[skill] = SkillMastery(skill, rng.randint(0, total), total)
+
+        start = time.perf_counter()
+        pick_next_question(student)
+        build_ms = (time.perf_counter() - start) * 1000.0
+
+        queries = []
+        for _ in range(args.calls):
+            q = rng.choice(questions)
+            queries.append(rng.choice([(None, None), (q.unit_id, None), (q.unit_id, q.section_id)]))
+
+        timings = {}
+        picks = {}
+        for name, fn in (("scan", _scan_pick), ("indexed", pick_next_question)):
+            chosen = []
+            start = time.perf_counter()
+            for i, (unit_id, section_id) in enumerate(queries):
+                random.seed(args.seed + i)
+                chosen.append(fn(student, unit_id=unit_id, section_id=section_id).id)
+            timings[name] = (time.perf_counter() - start) / len(queries) * 1000.0
+            picks[name] = chosen
+        assert picks["scan"] == picks["indexed"], "indexed pick differs from the full scan"
+
+        report[str(len(questions))] = {
+            "index_build_ms": round(build_ms, 2),
+            "scan_ms": round(timings["scan"], 4),
+            "indexed_ms": round(timings["indexed"], 4),
+            "speedup": round(timings["scan"] / timings["indexed"], 1),
+        }
+    emit(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Simulate a class opening the same quiz at once: per-request time with the
+payload cache disabled (the payload is rebuilt every time), a cached 200
+and a 304 revalidation.
+
+    python -m backend.benchmarks.quiz_payloads --class-size 500 \\
+        --questions-per-quiz 25
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from .common import emit, timed
+from .synthetic import Scale, generate_dataset
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--class-size", type=int, default=500)
+    parser.add_argument("--questions-per-quiz", type=int, default=25)
+    args = parser.parse_args()
+
+    if "backend.repository" in sys.modules:
+        raise RuntimeError("run this benchmark before importing the backend")
+    data_dir = Path(tempfile.mkdtemp(prefix="bitbybit-bench-"))
+    scale = Scale(
+        students=1,
+        attempts_per_student=0,
+        questions_per_section=max(12, args.questions_per_quiz),
+        questions_per_quiz=args.questions_per_quiz,
+    )
+    generate_dataset(data_dir, scale)
+    os.environ["BITBYBIT_DATA_DIR"] = str(data_dir)
+
+    from ..main import create_app
+
+    # The unit test quiz holds twice as many questions as the section quizzes.
+    url = "/api/quizzes/unit-test-1"
+    os.environ["BITBYBIT_PAYLOAD_CACHE_SIZE"] = "0"
+    uncached_client = create_app().test_client()
+    del os.environ["BITBYBIT_PAYLOAD_CACHE_SIZE"]
+    client = create_app().test_client()
+
+    first = client.get(url)
+    assert first.status_code == 200 and first.data == uncached_client.get(url).data
+    etag = first.headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    emit(
+        {
+            "class_size": args.class_size,
+            "payload_bytes": len(first.data),
+            "uncached_200": timed(lambda: uncached_client.get(url), args.class_size),
+            "cached_200": timed(lambda: client.get(url), args.class_size),
+            "revalidated_304": timed(
+                lambda: client.get(url, headers={"If-None-Match": etag}), args.class_size
+            ),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
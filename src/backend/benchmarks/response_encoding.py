@@ -0,0 +1,100 @@
+"""
+Bandwidth and encoding time of the largest JSON responses on a synthetic
+roster: indented (the old debug-mode default) versus compact versus
+columnar, each with and without gzip, plus end-to-end request time.
+
+    python -m backend.benchmarks.response_encoding --students 5000 \\
+        --attempts-per-student 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from .common import emit, timed
+from .synthetic import add_scale_arguments, generate_dataset, scale_from_args
+
+
+def _encode(fn: Callable[[], bytes], repeat: int) -> Dict[str, Any]:
+    body = fn()
+    return {"bytes": len(body), "ms": timed(fn, repeat)["per_call_ms"]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_scale_arguments(parser)
+    parser.set_defaults(students=5000, attempts_per_student=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if "backend.repository" in sys.modules:
+        raise RuntimeError("run this benchmark before importing the backend")
+    data_dir = Path(tempfile.mkdtemp(prefix="bitbybit-bench-"))
+    dataset = generate_dataset(data_dir, scale_from_args(args))
+    os.environ["BITBYBIT_DATA_DIR"] = str(data_dir)
+
+    from ..main import create_app
+    from ..response_encoding import columnar
+
+    app = create_app()
+    client = app.test_client()
+    endpoints = {
+        "teacher_overview": "/api/teacher/overview",
+        "students": "/api/students",
+        "attempt_history": "/api/attempts/student-1",
+    }
+
+    report: Dict[str, Any] = {"dataset": dataset}
+    for name, url in endpoints.items():
+        payload = client.get(url).get_json()
+        if isinstance(payload, list):
+            as_columnar = columnar(payload)
+        else:
+            as_columnar = {
+                key: columnar(value) if isinstance(value, list) else value
+                for key, value in payload.items()
+            }
+        variants = {
+            "indented": lambda: json.dumps(payload, indent=2, sort_keys=True).encode(),
+            "compact": lambda: json.dumps(
+                payload, separators=(",", ":"), sort_keys=True
+            ).encode(),
+            "columnar": lambda: json.dumps(
+                as_columnar, separators=(",", ":"), sort_keys=True
+            ).encode(),
+        }
+        entry: Dict[str, Any] = {}
+        for variant, encode in variants.items():
+            entry[variant] = _encode(encode, args.repeat)
+            entry[variant + "_gzip"] = _encode(
+                lambda encode=encode: gzip.compress(encode(), compresslevel=6, mtime=0),
+                args.repeat,
+            )
+
+        def request(query: str, headers: Dict[str, str]) -> None:
+            response = client.get(url + query, headers=headers)
+            assert response.status_code == 200
+
+        entry["request_ms"] = {}
+        for label, query, headers in (
+            ("identity", "", {}),
+            ("gzip", "", {"Accept-Encoding": "gzip"}),
+            ("columnar_gzip", "?encoding=columnar", {"Accept-Encoding": "gzip"}),
+        ):
+            request(query, headers)  # warm up
+            entry["request_ms"][label] = timed(
+                lambda q=query, h=headers: request(q, h), args.repeat
+            )["per_call_ms"]
+        report[name] = entry
+    emit(report)
+
+
+if __name__ == "__main__":
+    main()
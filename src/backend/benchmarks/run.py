@@ -0,0 +1,287 @@
+"""
+Benchmark every Flask endpoint and ``ml`` entry point against a synthetic
+dataset and emit the timings as JSON.
+
+    python -m backend.benchmarks.run --students 1000 --attempts-per-student 50 \\
+        --output bench.json [--compare previous.json]
+
+Each benchmark reports the first (cold) call separately from ``--repeat``
+warm calls. With ``--compare`` the warm per-call times are also printed as
+ratios against an earlier run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from .common import emit, timed
+from .synthetic import add_scale_arguments, generate_dataset, scale_from_args
+
+Benchmark = Tuple[str, Callable[[], Any], int]
+
+
+def _measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    start = time.perf_counter()
+    fn()
+    cold = time.perf_counter() - start
+    result = timed(fn, repeat) if repeat else {}
+    result["cold_ms"] = round(cold * 1000.0, 4)
+    return result
+
+
+def _endpoint_benchmarks(
+    client, ids: Dict[str, List[str]], rng: random.Random, repeat: int
+) -> List[Benchmark]:
+    students = itertools.cycle(ids["students"])
+    units = itertools.cycle(ids["units"])
+    quizzes = itertools.cycle(ids["quizzes"])
+    quiz_lookup = ids["quiz_payloads"]
+
+    def get(path: Callable[[], str]) -> Callable[[], Any]:
+        def call():
+            response = client.get(path())
+            assert response.status_code < 500, (path, response.status_code)
+
+        return call
+
+    def post(path: str, body: Callable[[], Any]) -> Callable[[], Any]:
+        def call():
+            response = client.post(path, json=body())
+            assert response.status_code < 500, (path, response.status_code)
+
+        return call
+
+    def attempt_payload() -> Dict[str, Any]:
+        quiz = quiz_lookup[next(quizzes)]
+        results = [
+            {
+                "question_id": qid,
+                "correct": rng.random() < 0.6,
+                "chosen_answer": "A",
+                "time_sec": round(rng.uniform(5, 90), 1),
+            }
+            for qid in quiz["question_ids"]
+        ]
+        return {
+            "student_id": next(students),
+            "quiz_id": quiz["id"],
+            "quiz_type": quiz["type"],
+            "unit_id": quiz["unit_id"],
+            "section_id": quiz["section_id"],
+            "score_pct": round(sum(r["correct"] for r in results) / len(results) * 100, 1),
+            "results": results,
+        }
+
+    return [
+        ("GET /api/health", get(lambda: "/api/health"), repeat),
+        ("GET /api/catalog/stats", get(lambda: "/api/catalog/stats"), repeat),
+        ("GET /api/units", get(lambda: "/api/units"), repeat),
+        ("GET /api/units/<unit_id>", get(lambda: f"/api/units/{next(units)}"), repeat),
+        ("GET /api/quizzes/<quiz_id>", get(lambda: f"/api/quizzes/{next(quizzes)}"), repeat),
+        ("GET /api/students", get(lambda: "/api/students"), repeat),
+        (
+            "GET /api/student/<id>/state",
+            get(lambda: f"/api/student/{next(students)}/state"),
+            repeat,
+        ),
+        (
+            "GET /api/student/<id>/next-activity",
+            get(lambda: f"/api/student/{next(students)}/next-activity"),
+            repeat,
+        ),
+        ("GET /api/attempts/<id>", get(lambda: f"/api/attempts/{next(students)}"), repeat),
+        (
+            "GET /api/student/<id>/diagnostic-results/<unit_id>",
+            get(lambda: f"/api/student/{next(students)}/diagnostic-results/{next(units)}"),
+            repeat,
+        ),
+        ("GET /api/teacher/overview", get(lambda: "/api/teacher/overview"), repeat),
+        (
+            "GET /api/teacher/students/<id>",
+            get(lambda: f"/api/teacher/students/{next(students)}"),
+            repeat,
+        ),
+        (
+            "POST /api/next-question",
+            post(
+                "/api/next-question",
+                lambda: {"student_id": next(students), "unit_id": next(units)},
+            ),
+            repeat,
+        ),
+        (
+            "POST /api/student/<id>/state",
+            lambda: client.post(
+                f"/api/student/{next(students)}/state", json={"preferred_difficulty": "medium"}
+            ),
+            repeat,
+        ),
+        ("POST /api/attempts", post("/api/attempts", attempt_payload), repeat),
+        (
+            "POST /api/attempts/batch",
+            post(
+                "/api/attempts/batch",
+                lambda: {"attempts": [attempt_payload() for _ in range(50)]},
+            ),
+            max(1, repeat // 5),
+        ),
+    ]
+
+
+def _ml_benchmarks(ids: Dict[str, List[str]], repeat: int) -> List[Benchmark]:
+    from ..ml import (
+        current_question_difficulty,
+        estimate_question_difficulty,
+        generate_personalized_feedback,
+        recommend_next_activity,
+        replay_skill_states,
+        update_student_skill_state,
+    )
+    from ..ml.columnar import ResultColumns, estimate_question_difficulty_vectorized
+    from ..repository import (
+        attempt_store,
+        iter_attempts,
+        load_attempts,
+        load_questions,
+        load_student,
+        load_units,
+    )
+
+    students = itertools.cycle(ids["students"])
+
+    def with_student(fn: Callable[[Any, List[Any]], Any]) -> Callable[[], Any]:
+        def call():
+            student_id = next(students)
+            fn(load_student(student_id), load_attempts(student_id))
+
+        return call
+
+    heavy = max(1, repeat // 10)
+    return [
+        (
+            "estimate_question_difficulty (full history)",
+            lambda: estimate_question_difficulty(iter_attempts(), load_questions()),
+            heavy,
+        ),
+        (
+            "estimate_question_difficulty_vectorized (full history)",
+            lambda: estimate_question_difficulty_vectorized(
+                ResultColumns.from_records(attempt_store.iter_records()), load_questions()
+            ),
+            heavy,
+        ),
+        ("current_question_difficulty", current_question_difficulty, repeat),
+        (
+            "update_student_skill_state",
+            with_student(
+                lambda student, attempts: update_student_skill_state(
+                    student.student_id, attempts, None
+                )
+            ),
+            repeat,
+        ),
+        (
+            "recommend_next_activity",
+            with_student(
+                lambda student, attempts: recommend_next_activity(student, attempts, load_units())
+            ),
+            repeat,
+        ),
+        (
+            "generate_personalized_feedback",
+            with_student(
+                lambda student, attempts: attempts
+                and generate_personalized_feedback(student, attempts[-1])
+            ),
+            repeat,
+        ),
+        (
+            "replay_skill_states (in-process, dry run)",
+            lambda: replay_skill_states(workers=1, write=False),
+            1,
+        ),
+    ]
+
+
+def _compare(current: Dict[str, Any], previous: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    ratios: Dict[str, Dict[str, float]] = {}
+    for group in ("endpoints", "ml"):
+        for name, result in current.get(group, {}).items():
+            before = previous.get(group, {}).get(name, {}).get("per_call_ms")
+            after = result.get("per_call_ms")
+            if before and after:
+                ratios.setdefault(group, {})[name] = round(after / before, 3)
+    return ratios
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    add_scale_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=20, help="warm calls per benchmark")
+    parser.add_argument("--output", type=Path, help="also write the results to this file")
+    parser.add_argument("--compare", type=Path, help="earlier results to compare against")
+    args = parser.parse_args()
+
+    if "backend.repository" in sys.modules:
+        raise RuntimeError("the benchmark runner must start before the backend is imported")
+    scale = scale_from_args(args)
+    data_dir = Path(tempfile.mkdtemp(prefix="bitbybit-bench-"))
+    start = time.perf_counter()
+    dataset = generate_dataset(data_dir, scale)
+    generate_seconds = time.perf_counter() - start
+    os.environ["BITBYBIT_DATA_DIR"] = str(data_dir)
+
+    from ..main import create_app
+    from ..repository import load_quizzes, load_units
+
+    rng = random.Random(scale.seed)
+    ids = {
+        "students": [
+            f"student-{i}"
+            for i in rng.sample(range(1, scale.students + 1), min(50, scale.students))
+        ],
+        "units": [unit.id for unit in load_units()],
+        "quizzes": sorted(load_quizzes()),
+        "quiz_payloads": {quiz_id: quiz.to_dict() for quiz_id, quiz in load_quizzes().items()},
+    }
+    client = create_app().test_client()
+
+    results: Dict[str, Any] = {
+        "scale": vars(scale),
+        "dataset": dataset,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "storage": os.environ.get("BITBYBIT_STORAGE") or "json",
+        },
+        "generate_seconds": round(generate_seconds, 3),
+        "ml": {},
+        "endpoints": {},
+    }
+    # ML first, so the cold numbers include building the maintained views.
+    for name, fn, repeat in _ml_benchmarks(ids, args.repeat):
+        results["ml"][name] = _measure(fn, repeat)
+    for name, fn, repeat in _endpoint_benchmarks(client, ids, rng, args.repeat):
+        results["endpoints"][name] = _measure(fn, repeat)
+
+    if args.compare:
+        results["compare"] = _compare(results, json.loads(args.compare.read_text()))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2, sort_keys=True))
+    emit(results)
+
+
+if __name__ == "__main__":
+    main()
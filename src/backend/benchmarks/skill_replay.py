@@ -0,0 +1,105 @@
+"""
+Time the bulk knowledge-tracing replay in-process and on a process pool,
+and check both produce the same skill states as replaying each student
+with ``update_student_skill_state``.
+
+    python -m backend.benchmarks.skill_replay --students 2000 --attempts 40000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+
+from .common import emit, use_scratch_data_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--attempts", type=int, default=40000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+
+    use_scratch_data_dir()
+    from ..ml import replay_skill_states, update_student_skill_state
+    from ..models import Attempt, AttemptQuestionResult, StudentState
+    from ..repository import (
+        append_attempts,
+        get_all_students,
+        iter_attempts,
+        load_quizzes,
+        save_students,
+        student_buffer,
+    )
+
+    rng = random.Random(args.seed)
+    student_ids = [f"bench-{i}" for i in range(args.students)]
+    save_students([StudentState(student_id=sid, name=sid) for sid in student_ids])
+    student_buffer.flush()
+
+    quizzes = [quiz for quiz in load_quizzes().values() if quiz.question_ids]
+    batch = []
+    for i in range(args.attempts):
+        quiz = rng.choice(quizzes)
+        batch.append(
+            Attempt(
+                id=f"replay-{i}",
+                student_id=rng.choice(student_ids),
+                quiz_id=quiz.id,
+                quiz_type=quiz.type,
+                unit_id=quiz.unit_id,
+                section_id=quiz.section_id,
+                score_pct=0.0,
+                # Out of order on purpose: the replay must sort by created_at.
+                created_at=1_700_000_000 + rng.random() * 1e6,
+                results=[
+                    AttemptQuestionResult(
+                        question_id=qid,
+                        correct=rng.random() < 0.6,
+                        chosen_answer="A",
+                        time_sec=30.0,
+                    )
+                    for qid in quiz.question_ids
+                ],
+            )
+        )
+        if len(batch) == 1000:
+            append_attempts(batch)
+            batch = []
+    if batch:
+        append_attempts(batch)
+
+    histories = {}
+    for attempt in iter_attempts():
+        histories.setdefault(attempt.student_id, []).append(attempt)
+    expected = {
+        sid: update_student_skill_state(sid, attempts, None)
+        for sid, attempts in histories.items()
+    }
+
+    inline = replay_skill_states(workers=1, write=False)
+    pooled = replay_skill_states(workers=args.workers, write=True)
+    actual = {
+        student.student_id: student.skill_mastery
+        for student in get_all_students()
+        if student.student_id in expected
+    }
+    assert actual == expected, "replayed skill states differ from per-student updates"
+
+    emit(
+        {
+            "students": pooled.students,
+            "attempts": pooled.attempts,
+            "answers": pooled.answers,
+            "in_process": inline.to_dict(),
+            "pool": pooled.to_dict(),
+            "speedup": round(inline.seconds / pooled.seconds, 2) if pooled.seconds else None,
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Multi-process write stress test for the storage layer.
+
+Several worker processes concurrently append attempts, save their own
+students and create new students. Afterwards every attempt, student and
+index entry must be present and the data files must still parse.
+
+    python -m backend.benchmarks.stress_writes --workers 8 --attempts 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import time
+from collections import Counter
+
+from .common import emit, use_scratch_data_dir
+
+
+def _worker(worker_id: int, attempts: int) -> None:
+    from ..models import Attempt, AttemptQuestionResult, StudentState
+    from ..repository import append_attempt, create_student, save_student, student_buffer
+
+    for i in range(attempts):
+        student_id = f"stress-{worker_id}-{i % 5}"
+        append_attempt(
+            Attempt(
+                id=f"{worker_id}-{i}",
+                student_id=student_id,
+                quiz_id="stress-quiz",
+                quiz_type="practice",
+                unit_id=f"unit-{i % 3}",
+                section_id=None,
+                score_pct=float(i % 100),
+                results=[
+                    AttemptQuestionResult(
+                        question_id=f"q{i % 7}",
+                        correct=bool(i % 2),
+                        chosen_answer="A",
+                        time_sec=1.0,
+                    )
+                ],
+            )
+        )
+        save_student(StudentState(student_id=student_id, name=f"Stress {worker_id}-{i % 5}"))
+        if i % 20 == 0:
+            create_student(name=f"Created {worker_id}-{i}")
+    # multiprocessing children skip atexit handlers, so flush explicitly.
+    student_buffer.flush()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--attempts", type=int, default=200)
+    args = parser.parse_args()
+
+    data_dir = use_scratch_data_dir()
+    students_before = len(json.loads((data_dir / "students.json").read_text()))
+
+    ctx = multiprocessing.get_context("spawn")
+    start = time.perf_counter()
+    processes = [
+        ctx.Process(target=_worker, args=(worker_id, args.attempts))
+        for worker_id in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - start
+    if any(process.exitcode != 0 for process in processes):
+        raise SystemExit("a worker process failed")
+
+    from ..repository import load_attempts, get_all_students
+
+    attempts = load_attempts()
+    ids = Counter(attempt.id for attempt in attempts)
+    expected_ids = {
+        f"{worker_id}-{i}" for worker_id in range(args.workers) for i in range(args.attempts)
+    }
+    lost = expected_ids - set(ids)
+    duplicated = [attempt_id for attempt_id, count in ids.items() if count > 1]
+
+    per_student_mismatches = []
+    for worker_id in range(args.workers):
+        for slot in range(5):
+            student_id = f"stress-{worker_id}-{slot}"
+            indexed = len(load_attempts(student_id))
+            scanned = sum(1 for attempt in attempts if attempt.student_id == student_id)
+            if indexed != scanned:
+                per_student_mismatches.append(student_id)
+
+    students = {student.student_id for student in get_all_students()}
+    saved_expected = {
+        f"stress-{worker_id}-{slot}" for worker_id in range(args.workers) for slot in range(5)
+    }
+    created_expected = args.workers * len(range(0, args.attempts, 20))
+    created = len(students) - students_before - len(saved_expected & students)
+
+    report = {
+        "workers": args.workers,
+        "attempts_per_worker": args.attempts,
+        "seconds": round(elapsed, 3),
+        "attempts_stored": len(attempts),
+        "attempts_lost": len(lost),
+        "attempts_duplicated": len(duplicated),
+        "index_mismatches": len(per_student_mismatches),
+        "saved_students_missing": len(saved_expected - students),
+        "created_students": created,
+        "created_students_expected": created_expected,
+    }
+    emit(report)
+    if (
+        lost
+        or duplicated
+        or per_student_mismatches
+        or saved_expected - students
+        or created != created_expected
+    ):
+        raise SystemExit("stress test lost or corrupted writes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Measure save_student latency with write-through versus the write-behind
+buffer on a large roster.
+
+    python -m backend.benchmarks.student_saves --roster 5000 --saves 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+
+from .common import emit, use_scratch_data_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--roster", type=int, default=5000)
+    parser.add_argument("--saves", type=int, default=500)
+    args = parser.parse_args()
+
+    data_dir = use_scratch_data_dir(copy_students=False)
+    from ..models import StudentState
+
+    roster = {
+        f"student-{i}": StudentState(
+            student_id=f"student-{i}",
+            name=f"Student {i}",
+            skill_mastery={
+                f"skill-{k}": {"p_mastery": 0.5, "n_observations": 4, "recent_correct": 1}
+                for k in range(8)
+            },
+        ).to_dict()
+        for i in range(args.roster)
+    }
+    (data_dir / "students.json").write_text(json.dumps(roster, indent=2))
+
+    from ..repository import load_student, save_student, student_buffer
+
+    def run(interval: float) -> dict:
+        student_buffer.interval = interval
+        latencies = []
+        for i in range(args.saves):
+            student = load_student(f"student-{i % args.roster}")
+            student.last_activity = f"bench-{interval}-{i}"
+            start = time.perf_counter()
+            save_student(student)
+            latencies.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        flushed = student_buffer.flush()
+        flush_seconds = time.perf_counter() - start
+        latencies.sort()
+        return {
+            "mean_ms": round(statistics.mean(latencies) * 1000, 4),
+            "p50_ms": round(latencies[len(latencies) // 2] * 1000, 4),
+            "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 4),
+            "final_flush_rows": flushed,
+            "final_flush_ms": round(flush_seconds * 1000, 2),
+        }
+
+    write_through = run(0)
+    write_behind = run(3600)  # no background flush during the measurement
+    persisted = json.loads((data_dir / "students.json").read_text())
+    assert persisted[f"student-{(args.saves - 1) % args.roster}"]["last_activity"].startswith(
+        "bench-3600"
+    )
+
+    emit(
+        {
+            "roster": args.roster,
+            "saves": args.saves,
+            "write_through": write_through,
+            "write_behind": write_behind,
+            "mean_speedup": round(write_through["mean_ms"] / write_behind["mean_ms"], 1),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+Seeded generator for school-scale datasets.
+
+Writes units, questions, quizzes, students, users and an attempt log into a
+data directory, building every record from the dataclasses in ``models.py``
+so the files match what the backend reads and writes. The same arguments
+and seed always produce the same files.
+
+    python -m backend.benchmarks.synthetic --out /tmp/school \\
+        --students 10000 --attempts-per-student 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+from ..attempt_log import _encode_record
+from ..models import (
+    Attempt,
+    AttemptQuestionResult,
+    Question,
+    Quiz,
+    StudentState,
+    Unit,
+    User,
+)
+
+DIFFICULTY_OFFSET = {"easy": 1.0, "medium": 0.0, "hard": -1.0}
+START_TIME = 1_700_000_000.0
+
+
+@dataclass
+class Scale:
+    students: int = 1000
+    attempts_per_student: int = 50
+    units: int = 6
+    sections_per_unit: int = 3
+    questions_per_section: int = 12
+    skills_per_section: int = 2
+    questions_per_quiz: int = 5
+    seed: int = 42
+
+
+def _build_content(scale: Scale, rng: random.Random):
+    units: List[Unit] = []
+    questions: List[Question] = []
+    quizzes: List[Quiz] = []
+    for u in range(1, scale.units + 1):
+        unit_id = f"unit-{u}"
+        sections = []
+        unit_questions: List[str] = []
+        for s in range(1, scale.sections_per_unit + 1):
+            section_id = f"{u}.{s}"
+            skills = [f"skill-{u}-{s}-{k}" for k in range(1, scale.skills_per_section + 1)]
+            section_questions = []
+            for n in range(1, scale.questions_per_section + 1):
+                question_type = "boolean" if rng.random() < 0.2 else "mcq"
+                options = ["True", "False"] if question_type == "boolean" else ["A", "B", "C", "D"]
+                question = Question(
+                    id=f"q-{u}-{s}-{n}",
+                    unit_id=unit_id,
+                    section_id=section_id,
+                    text=f"Synthetic question {n} for section {section_id}",
+                    type=question_type,
+                    options=options,
+                    correct_answer=rng.choice(options),
+                    skill_ids=[rng.choice(skills)],
+                    difficulty=rng.choice(["easy", "medium", "hard"]),
+                    estimated_time_sec=rng.choice([30, 45, 60, 90]),
+                )
+                questions.append(question)
+                section_questions.append(question.id)
+            unit_questions.extend(section_questions)
+            practice_id = f"practice-{u}-{s}"
+            mini_id = f"mini-{u}-{s}"
+            for quiz_id, quiz_type, title in (
+                (practice_id, "practice", "Practice"),
+                (mini_id, "mini_quiz", "Mini Quiz"),
+            ):
+                quizzes.append(
+                    Quiz(
+                        id=quiz_id,
+                        title=f"{title} {section_id}",
+                        unit_id=unit_id,
+                        section_id=section_id,
+                        type=quiz_type,
+                        question_ids=rng.sample(
+                            section_questions,
+                            min(scale.questions_per_quiz, len(section_questions)),
+                        ),
+                    )
+                )
+            sections.append(
+                {
+                    "id": section_id,
+                    "title": f"Section {section_id}",
+                    "summary": f"Synthetic section {section_id}.",
+                    "practiceQuizId": practice_id,
+                    "miniQuizId": mini_id,
+                }
+            )
+        for quiz_id, quiz_type, title in (
+            (f"diag-{u}", "diagnostic", "Diagnostic"),
+            (f"unit-test-{u}", "unit_test", "Unit Test"),
+        ):
+            quizzes.append(
+                Quiz(
+                    id=quiz_id,
+                    title=f"Unit {u} {title}",
+                    unit_id=unit_id,
+                    section_id=None,
+                    type=quiz_type,
+                    question_ids=rng.sample(
+                        unit_questions, min(scale.questions_per_quiz * 2, len(unit_questions))
+                    ),
+                )
+            )
+        units.append(
+            Unit(
+                id=unit_id,
+                title=f"Unit {u}",
+                description=f"Synthetic unit {u}.",
+                sections=sections,
+                diagnostic_quiz_id=f"diag-{u}",
+                comprehensive_quiz_id=f"unit-test-{u}",
+            )
+        )
+    return units, questions, quizzes
+
+
+def generate_dataset(out: Path, scale: Scale) -> Dict[str, int]:
+    """
+    Write a complete data directory to ``out`` and return record counts.
+    """
+
+    rng = random.Random(scale.seed)
+    out.mkdir(parents=True, exist_ok=True)
+    units, questions, quizzes = _build_content(scale, rng)
+    questions_by_id = {question.id: question for question in questions}
+
+    students: Dict[str, Dict] = {}
+    users: List[Dict] = [
+        User(
+            id="user-teacher",
+            email="teacher@example.com",
+            password="password123",
+            role="teacher",
+        ).to_dict()
+    ]
+    attempts = 0
+    answers = 0
+    with (out / "attempts.jsonl").open("wb") as log:
+        for i in range(1, scale.students + 1):
+            student_id = f"student-{i}"
+            students[student_id] = StudentState(
+                student_id=student_id,
+                name=f"Student {i:05d}",
+                email=f"{student_id}@example.edu",
+                grade_level=rng.choice(["9", "10", "11"]),
+            ).to_dict()
+            users.append(
+                User(
+                    id=f"user-{i}",
+                    email=f"{student_id}@example.edu",
+                    password="password123",
+                    role="student",
+                    student_id=student_id,
+                ).to_dict()
+            )
+            ability = rng.gauss(0.0, 1.0)
+            created_at = START_TIME + rng.random() * 86400
+            for n in range(scale.attempts_per_student):
+                quiz = rng.choice(quizzes)
+                # Students improve a little with every attempt.
+                skill = ability + n / max(scale.attempts_per_student, 1)
+                results = []
+                for question_id in quiz.question_ids:
+                    question = questions_by_id[question_id]
+                    logit = skill + DIFFICULTY_OFFSET[question.difficulty]
+                    correct = rng.random() < 1.0 / (1.0 + math.exp(-logit))
+                    results.append(
+                        AttemptQuestionResult(
+                            question_id=question_id,
+                            correct=correct,
+                            chosen_answer=question.correct_answer
+                            if correct
+                            else rng.choice(
+                                [o for o in question.options if o != question.correct_answer]
+                            ),
+                            time_sec=round(question.estimated_time_sec * rng.uniform(0.4, 1.8), 1),
+                            used_hint=rng.random() < 0.1,
+                        )
+                    )
+                correct_count = sum(1 for r in results if r.correct)
+                created_at += rng.uniform(60, 3 * 86400)
+                attempt = Attempt(
+                    id=f"attempt-{i}-{n}",
+                    student_id=student_id,
+                    quiz_id=quiz.id,
+                    quiz_type=quiz.type,
+                    unit_id=quiz.unit_id,
+                    section_id=quiz.section_id,
+                    score_pct=round(correct_count / len(results) * 100, 1) if results else 0.0,
+                    created_at=created_at,
+                    results=results,
+                )
+                log.write(_encode_record(attempt.to_dict()))
+                attempts += 1
+                answers += len(results)
+
+    for name, payload in (
+        ("units.json", [unit.to_dict() for unit in units]),
+        ("questions.json", [question.to_dict() for question in questions]),
+        ("quizzes.json", [quiz.to_dict() for quiz in quizzes]),
+        ("students.json", students),
+        ("users.json", users),
+    ):
+        (out / name).write_text(json.dumps(payload, indent=2))
+
+    return {
+        "units": len(units),
+        "questions": len(questions),
+        "quizzes": len(quizzes),
+        "students": len(students),
+        "attempts": attempts,
+        "answers": answers,
+    }
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = Scale()
+    for name in Scale.__dataclass_fields__:
+        parser.add_argument(
+            "--" + name.replace("_", "-"),
+            type=int,
+            default=getattr(defaults, name),
+        )
+
+
+def scale_from_args(args: argparse.Namespace) -> Scale:
+    return Scale(**{name: getattr(args, name) for name in Scale.__dataclass_fields__})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--out", type=Path, required=True, help="data directory to write")
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+    counts = generate_dataset(args.out, scale_from_args(args))
+    print(json.dumps(counts, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+Signature = Optional[Tuple[int, int]]
+
+
+def _file_signature(path: Path) -> Signature:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass
+class _CatalogEntry:
+    signature: Signature
+    value: Any
+
+
+class CatalogCache:
+    """
+    Parse each content file once and keep the built objects in memory until
+    the file's mtime or size changes.
+
+    Values handed out by the cache are shared between callers, so they must be
+    treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Path, _CatalogEntry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        path: Path,
+        load: Callable[[Path], Any],
+        build: Callable[[Any], Any],
+    ) -> Any:
+        signature = _file_signature(path)
+        entry = self._entries.get(path)
+        if entry is not None and entry.signature == signature:
+            self.hits += 1
+            return entry.value
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.signature == signature:
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+            value = build(load(path))
+            # Cache under the signature seen before loading, so a write that
+            # lands mid-load is picked up on the next call. The only re-stat
+            # is for a missing file, which the loader may have created.
+            if signature is None:
+                signature = _file_signature(path)
+            self._entries[path] = _CatalogEntry(signature, value)
+            return value
+
+    def version(self, *paths: Path) -> Tuple[Signature, ...]:
+        """
+        Return a token that changes whenever any of the given files changes.
+        """
+
+        return tuple(_file_signature(path) for path in paths)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+        }
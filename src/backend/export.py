@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .repository import iter_attempts
+
+EXPORT_ROWS = ("attempts", "results")
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_export_records(
+    rows: str = "attempts",
+    student_id: Optional[str] = None,
+    unit_id: Optional[str] = None,
+    quiz_type: Optional[str] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield export records one at a time: whole attempts, or with
+    ``rows="results"`` one flattened record per answered question.
+    """
+
+    if rows not in EXPORT_ROWS:
+        raise ValueError(f"unknown export rows: {rows!r}")
+    for attempt in iter_attempts(student_id, unit_id, quiz_type, since, until):
+        record = attempt.to_dict()
+        if rows == "attempts":
+            yield record
+            continue
+        results = record.pop("results")
+        record = {"attempt_id": record.pop("id"), **record}
+        for result in results:
+            yield {**record, **result}
+
+
+def ndjson_chunks(records: Iterable[Dict[str, Any]], gzip: bool = False) -> Iterator[bytes]:
+    """
+    Encode records as NDJSON, optionally gzip-compressed, in chunks of
+    roughly ``CHUNK_SIZE`` bytes so memory stays flat however many records
+    there are.
+    """
+
+    compressor = zlib.compressobj(wbits=31) if gzip else None
+    buffer = []
+    size = 0
+    for record in records:
+        line = json.dumps(record, separators=(",", ":")).encode() + b"\n"
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK_SIZE:
+            chunk = b"".join(buffer)
+            buffer.clear()
+            size = 0
+            if compressor is not None:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+    chunk = b"".join(buffer)
+    if compressor is not None:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+_thread_locks: Dict[Path, threading.RLock] = {}
+_thread_locks_guard = threading.Lock()
+_held = threading.local()
+
+
+def _thread_lock(path: Path) -> threading.RLock:
+    with _thread_locks_guard:
+        lock = _thread_locks.get(path)
+        if lock is None:
+            lock = _thread_locks[path] = threading.RLock()
+        return lock
+
+
+def lock_path(path: Path) -> Path:
+    return path.with_name(path.name + ".lock")
+
+
+@contextmanager
+def locked(path: Path) -> Iterator[None]:
+    """
+    Hold the writer lock for ``path`` across threads and processes.
+
+    The lock lives on a ``<name>.lock`` sidecar so it survives ``path`` being
+    replaced by ``atomic_write``. Only writers take it; readers rely on
+    ``atomic_write`` always leaving a complete file in place. Where ``fcntl``
+    is unavailable this degrades to an in-process lock.
+    """
+
+    held = getattr(_held, "paths", None)
+    if held is None:
+        held = _held.paths = set()
+    if path in held:
+        # Re-entrant use from the same thread; flock would deadlock on itself.
+        yield
+        return
+    with _thread_lock(path):
+        held.add(path)
+        try:
+            if fcntl is None:
+                yield
+                return
+            fd = os.open(lock_path(path), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                os.close(fd)  # releases the flock
+        finally:
+            held.discard(path)
+
+
+def atomic_write(path: Path, data: Union[str, bytes]) -> None:
+    """
+    Replace ``path`` with ``data`` so readers see either the old or the new
+    contents, never a truncated file, even if the process dies mid-write.
+    """
+
+    payload = data.encode("utf-8") if isinstance(data, str) else data
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
@@ -1,21 +1,37 @@
 from __future__ import annotations
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, jsonify, request, send_file
 from flask_cors import CORS
+import hmac
+import os
+import random
+import time
 import uuid
-from typing import Dict
-
-from .models import Attempt, AttemptQuestionResult, SkillMastery, StudentState
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import metrics
+from .export import EXPORT_ROWS, iter_export_records, ndjson_chunks
+from .models import Attempt, AttemptQuestionResult, StudentState
+from .payload_cache import PayloadCache
+from .profiling import RequestProfiler
+from .response_encoding import accepts_gzip, columnar, gzip_response
 from .repository import (
+    DATA_DIR,
+    catalog,
+    content_version,
     load_units,
     load_unit,
     load_quiz,
     load_questions,
     load_student,
     save_student,
+    save_students,
+    student_transaction,
     load_attempts,
+    page_attempts,
     append_attempt,
-    get_attempts_for_all_students,
+    append_attempts,
     get_next_activity_for_student,
     compute_teacher_student_summaries,
     compute_teacher_unit_summaries,
@@ -25,27 +41,400 @@ from .repository import (
     get_user_by_email,
 )
 from .recommender import pick_next_question
+from .request_memo import memo_stats
 from .ml import (
     update_student_skill_state,
+    mastery_by_skill_from_state,
     generate_personalized_feedback,
     recommend_next_activity,
-    estimate_question_difficulty,
+    current_question_difficulty,
 )
 
 
+def _text_field(payload: Dict, key: str, optional: bool = False) -> Optional[str]:
+    value = payload.get(key) if optional else payload[key]
+    if value is None and optional:
+        return None
+    if not isinstance(value, str):
+        raise ValueError(key)
+    return value
+
+
+def _number_field(payload: Dict, key: str, default: Optional[float] = None) -> float:
+    value = payload[key] if default is None else payload.get(key, default)
+    # float() also accepts numeric strings, which older clients send; it
+    # would accept true/false too, which are never meaningful numbers here.
+    if isinstance(value, bool):
+        raise ValueError(key)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(key) from None
+
+
+def _attempt_from_payload(payload: Dict, allow_created_at: bool = False) -> Attempt:
+    """
+    Build an Attempt from a request body; raises KeyError on missing fields
+    and ValueError, carrying the field name, on fields of the wrong type.
+    """
+
+    results = payload.get("results", [])
+    if not isinstance(results, list) or not all(isinstance(r, dict) for r in results):
+        raise ValueError("results")
+
+    attempt = Attempt(
+        id=str(uuid.uuid4()),
+        student_id=_text_field(payload, "student_id"),
+        quiz_id=_text_field(payload, "quiz_id"),
+        quiz_type=_text_field(payload, "quiz_type"),
+        unit_id=_text_field(payload, "unit_id"),
+        section_id=_text_field(payload, "section_id", optional=True),
+        score_pct=_number_field(payload, "score_pct"),
+        results=[
+            AttemptQuestionResult(
+                question_id=_text_field(r, "question_id"),
+                correct=bool(r["correct"]),
+                chosen_answer=r["chosen_answer"],
+                time_sec=_number_field(r, "time_sec", default=0.0),
+                used_hint=bool(r.get("used_hint", False)),
+            )
+            for r in results
+        ],
+    )
+    if allow_created_at and payload.get("created_at") is not None:
+        attempt.created_at = _number_field(payload, "created_at")
+    return attempt
+
+
+def _apply_attempts_to_student(student_id: str, attempts: List[Attempt]) -> StudentState:
+    """
+    Fold new attempts into the student's skill state and last-activity fields.
+    The caller is responsible for saving the returned student.
+    """
+
+    student = load_student(student_id)
+    if not student:
+        student = StudentState(
+            student_id=student_id,
+            name=f"Student {student_id}",
+        )
+    updated_skill_state = update_student_skill_state(
+        student_id,
+        attempts,
+        student.skill_mastery,
+    )
+    student.skill_mastery = updated_skill_state
+    student.mastery_by_skill = mastery_by_skill_from_state(updated_skill_state)
+    latest = max(attempts, key=lambda a: a.created_at or 0.0)
+    if latest.unit_id:
+        student.last_unit_id = latest.unit_id
+    if latest.section_id:
+        student.last_section_id = latest.section_id
+    student.last_activity = latest.quiz_type
+    return student
+
+
+def _update_student_fields(student_id: str, payload: Dict) -> StudentState:
+    """
+    Apply a profile update to the stored student and save it. Call inside
+    ``student_transaction`` so the read and the write are not interleaved
+    with another writer.
+    """
+
+    student = load_student(student_id) or StudentState(
+        student_id=student_id,
+        name=payload.get("name", f"Student {student_id}"),
+    )
+    if "name" in payload:
+        student.name = payload["name"]
+    if "grade_level" in payload:
+        student.grade_level = payload["grade_level"]
+    if "preferred_difficulty" in payload:
+        student.preferred_difficulty = payload["preferred_difficulty"]
+    if "last_unit_id" in payload:
+        student.last_unit_id = payload["last_unit_id"] or None
+    if "last_section_id" in payload:
+        student.last_section_id = payload["last_section_id"] or None
+    if "last_activity" in payload:
+        student.last_activity = payload["last_activity"] or None
+    if "avatar_url" in payload:
+        student.avatar_url = payload["avatar_url"] or None
+    if "avatar_name" in payload:
+        student.avatar_name = payload["avatar_name"] or None
+    save_student(student)
+    return student
+
+
+HISTORY_PAGE_ARGS = ("limit", "cursor", "since", "until", "fields", "order")
+HISTORY_PAGE_MAX = 500
+
+
+def _history_page_options() -> Optional[Dict]:
+    """
+    Parse pagination arguments for attempt history endpoints. Returns None
+    when none are given, so callers keep returning the full history.
+    Raises ValueError on malformed values.
+    """
+
+    args = request.args
+    if not any(name in args for name in HISTORY_PAGE_ARGS):
+        return None
+    fields = args.get("fields", "full")
+    order = args.get("order", "asc")
+    if fields not in ("full", "summary") or order not in ("asc", "desc"):
+        raise ValueError("unsupported fields or order")
+    return {
+        "limit": max(1, min(int(args.get("limit", 50)), HISTORY_PAGE_MAX)),
+        "cursor": args.get("cursor") or None,
+        "since": float(args["since"]) if "since" in args else None,
+        "until": float(args["until"]) if "until" in args else None,
+        "summary": fields == "summary",
+        "newest_first": order == "desc",
+    }
+
+
+def _attempt_payload(attempt: Attempt, summary: bool = False) -> Dict:
+    payload = attempt.to_dict()
+    if summary:
+        del payload["results"]
+    return payload
+
+
+def _records(rows: List[Dict]):
+    """
+    Return a list of records as-is, or column by column when the client
+    asked for ?encoding=columnar.
+    """
+
+    return columnar(rows) if request.args.get("encoding") == "columnar" else rows
+
+
+def _is_admin_request(token: str) -> bool:
+    """
+    True when the request carries the admin token in ``X-Admin-Token``.
+    Always false while no token is configured. The token is never read from
+    the query string, which would leak it into access logs.
+    """
+
+    if not token:
+        return False
+    supplied = request.headers.get("X-Admin-Token") or ""
+    return hmac.compare_digest(supplied.encode("utf-8"), token.encode("utf-8"))
+
+
 def create_app() -> Flask:
     app = Flask(__name__)
+    if metrics.ENABLED:
+        app.json = metrics.TimedJSONProvider(app)
+    # No pretty-printing, even in debug mode.
+    app.json.compact = True
 
     # Allow the Vite dev server to talk to this API
     CORS(
         app,
         resources={r"/api/*": {"origins": ["http://127.0.0.1:5173", "http://localhost:5173"]}},
     )
+    app.config.setdefault(
+        "REQUEST_MEMO_HEADER", os.environ.get("BITBYBIT_REQUEST_MEMO_HEADER") == "1"
+    )
+    app.config.setdefault("ADMIN_TOKEN", os.environ.get("BITBYBIT_ADMIN_TOKEN") or "")
+    app.config.setdefault(
+        "PROFILE_SAMPLE_RATE", float(os.environ.get("BITBYBIT_PROFILE_SAMPLE_RATE") or 0.0)
+    )
+    app.config.setdefault(
+        "PROFILE_DIR", Path(os.environ.get("BITBYBIT_PROFILE_DIR") or DATA_DIR / "profiles")
+    )
+    app.config.setdefault("PROFILE_KEEP", int(os.environ.get("BITBYBIT_PROFILE_KEEP") or 50))
+    profiler = RequestProfiler(app.config["PROFILE_DIR"], app.config["PROFILE_KEEP"])
+    app.config.setdefault(
+        "GZIP_MIN_BYTES", int(os.environ.get("BITBYBIT_GZIP_MIN_BYTES") or 1024)
+    )
+    app.config.setdefault("GZIP_LEVEL", int(os.environ.get("BITBYBIT_GZIP_LEVEL") or 6))
+    app.config.setdefault(
+        "PAYLOAD_CACHE_SIZE", int(os.environ.get("BITBYBIT_PAYLOAD_CACHE_SIZE") or 256)
+    )
+    payload_cache = PayloadCache(app.config["PAYLOAD_CACHE_SIZE"])
+
+    def cached_json(key, build):
+        """
+        Serve ``build()`` as JSON from the payload cache with a strong ETag,
+        answering 304 when the client already holds the current version.
+        ``build`` returning None means not found and yields None here.
+        """
+
+        def serialize():
+            value = build()
+            # Same bytes jsonify would produce, compact or indented.
+            return None if value is None else app.json.response(value).get_data()
+
+        payload = payload_cache.get(key, content_version(), serialize)
+        if payload is None:
+            return None
+        response = Response(payload.body, mimetype=app.json.mimetype)
+        response.set_etag(payload.etag)
+        # Let browsers keep the body but revalidate before reusing it.
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    # Registered first so it runs after every other after_request hook.
+    @app.after_request
+    def compress_response(response):
+        return gzip_response(
+            response,
+            accepts_gzip(request.accept_encodings),
+            app.config["GZIP_MIN_BYTES"],
+            app.config["GZIP_LEVEL"],
+        )
+
+    @app.after_request
+    def add_request_memo_header(response):
+        # Debug aid: how many repeated loads the request-scoped memo saved.
+        if app.debug or app.config["REQUEST_MEMO_HEADER"]:
+            stats = memo_stats()
+            response.headers["X-Request-Memo"] = f"saved={stats['hits']}; loaded={stats['misses']}"
+        return response
+
+    if metrics.ENABLED:
+
+        @app.before_request
+        def start_request_timer():
+            g._request_started = time.perf_counter()
+
+        @app.after_request
+        def record_request_metrics(response):
+            elapsed = time.perf_counter() - g.get("_request_started", time.perf_counter())
+            endpoint = request.url_rule.rule if request.url_rule else "<unmatched>"
+            metrics.registry.observe_request(request.method, endpoint, response.status_code, elapsed)
+            response.headers["Server-Timing"] = metrics.server_timing_header(elapsed)
+            return response
+
+    @app.before_request
+    def start_request_profile():
+        # Admins opt in per request with X-Profile: 1 (or ?profile=1); a
+        # configurable fraction of all other traffic is sampled.
+        requested = request.headers.get("X-Profile") == "1" or request.args.get("profile") == "1"
+        if requested and _is_admin_request(app.config["ADMIN_TOKEN"]):
+            trigger = "admin"
+        elif random.random() < app.config["PROFILE_SAMPLE_RATE"]:
+            trigger = "sampled"
+        else:
+            return
+        g._profile = profiler.start()
+        g._profile_trigger = trigger
+
+    @app.after_request
+    def save_request_profile(response):
+        profile = g.pop("_profile", None)
+        if profile is None:
+            return response
+        profiler.stop(profile)
+        profile_id = profiler.save(
+            profile,
+            {
+                "method": request.method,
+                "path": request.path,
+                "endpoint": request.url_rule.rule if request.url_rule else None,
+                "status": response.status_code,
+                "trigger": g._profile_trigger,
+            },
+        )
+        if g._profile_trigger == "admin":
+            response.headers["X-Profile-Id"] = profile_id
+        return response
+
+    @app.teardown_request
+    def discard_request_profile(exc):
+        # after_request is skipped when a view raises; release the profiler.
+        profile = g.pop("_profile", None)
+        if profile is not None:
+            profiler.stop(profile)
+
+    @app.get("/api/admin/profiles")
+    def api_admin_profiles():
+        if not _is_admin_request(app.config["ADMIN_TOKEN"]):
+            return jsonify({"error": "forbidden"}), 403
+        return jsonify({"profiles": profiler.list()})
+
+    @app.get("/api/admin/profiles/<profile_id>")
+    def api_admin_profile(profile_id: str):
+        """
+        Download a stored profile as a pstats file, or as text with
+        ?format=text[&sort=cumulative|tottime|calls][&limit=40].
+        """
+
+        if not _is_admin_request(app.config["ADMIN_TOKEN"]):
+            return jsonify({"error": "forbidden"}), 403
+        path = profiler.path(profile_id)
+        if path is None:
+            return jsonify({"error": "profile_not_found"}), 404
+        if request.args.get("format") != "text":
+            return send_file(path, as_attachment=True, download_name=path.name)
+        try:
+            report = profiler.report(
+                profile_id,
+                limit=int(request.args.get("limit", 40)),
+                sort=request.args.get("sort", "cumulative"),
+            )
+        except (KeyError, ValueError):
+            return jsonify({"error": "invalid_report_options"}), 400
+        return Response(report, content_type="text/plain; charset=utf-8")
+
+    @app.get("/api/export/attempts")
+    def api_export_attempts():
+        """
+        Stream stored attempts as NDJSON for research exports. Filters:
+        student_id, unit_id, quiz_type, since, until; ?rows=results emits one
+        flattened line per answered question. Gzip-compressed when the
+        client accepts it or asks with ?gzip=1.
+        """
+
+        if not _is_admin_request(app.config["ADMIN_TOKEN"]):
+            return jsonify({"error": "forbidden"}), 403
+        args = request.args
+        rows = args.get("rows", "attempts")
+        try:
+            if rows not in EXPORT_ROWS:
+                raise ValueError(rows)
+            since = float(args["since"]) if "since" in args else None
+            until = float(args["until"]) if "until" in args else None
+        except ValueError:
+            return jsonify({"error": "invalid_export_request"}), 400
+        records = iter_export_records(
+            rows,
+            student_id=args.get("student_id") or None,
+            unit_id=args.get("unit_id") or None,
+            quiz_type=args.get("quiz_type") or None,
+            since=since,
+            until=until,
+        )
+        gzip = args.get("gzip") == "1" or accepts_gzip(request.accept_encodings)
+        response = Response(ndjson_chunks(records, gzip), mimetype="application/x-ndjson")
+        response.headers["Content-Disposition"] = f"attachment; filename={rows}.ndjson"
+        response.vary.add("Accept-Encoding")
+        if gzip:
+            response.headers["Content-Encoding"] = "gzip"
+        return response
 
     @app.get("/api/health")
     def health():
         return jsonify({"status": "ok"})
 
+    @app.get("/api/catalog/stats")
+    def api_catalog_stats():
+        """Expose content cache hit/miss counters for profiling."""
+
+        return jsonify({**catalog.stats(), "payloads": payload_cache.stats()})
+
+    @app.get("/api/metrics")
+    def api_metrics():
+        """Prometheus scrape endpoint; enable with BITBYBIT_METRICS=1."""
+
+        if not metrics.ENABLED:
+            return jsonify({"error": "metrics_disabled"}), 404
+        return Response(
+            metrics.registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
+
     @app.post("/api/auth/login")
     def api_auth_login():
         payload = request.get_json(force=True) or {}
@@ -69,15 +458,18 @@ def create_app() -> Flask:
 
     @app.get("/api/units")
     def api_units():
-        units = [u.to_dict() for u in load_units()]
-        return jsonify(units)
+        return cached_json(("units",), lambda: [u.to_dict() for u in load_units()])
 
     @app.get("/api/units/<unit_id>")
     def api_unit(unit_id: str):
-        unit = load_unit(unit_id)
-        if not unit:
+        def build():
+            unit = load_unit(unit_id)
+            return unit.to_dict() if unit else None
+
+        response = cached_json(("unit", unit_id), build)
+        if response is None:
             return jsonify({"error": "unit_not_found"}), 404
-        return jsonify(unit.to_dict())
+        return response
 
     @app.get("/api/quizzes/<quiz_id>")
     def api_quiz(quiz_id: str):
@@ -85,18 +477,23 @@ def create_app() -> Flask:
         Return quiz with a "questions" array so the frontend
         does not have to fetch questions separately.
         """
-        quiz = load_quiz(quiz_id)
-        if not quiz:
-            return jsonify({"error": "quiz_not_found"}), 404
 
-        all_questions = load_questions()
-        question_objects = [
-            all_questions[qid] for qid in quiz.question_ids if qid in all_questions
-        ]
-
-        payload = quiz.to_dict()
-        payload["questions"] = [q.to_dict() for q in question_objects]
-        return jsonify(payload)
+        def build():
+            quiz = load_quiz(quiz_id)
+            if not quiz:
+                return None
+            all_questions = load_questions()
+            question_objects = [
+                all_questions[qid] for qid in quiz.question_ids if qid in all_questions
+            ]
+            payload = quiz.to_dict()
+            payload["questions"] = [q.to_dict() for q in question_objects]
+            return payload
+
+        response = cached_json(("quiz", quiz_id), build)
+        if response is None:
+            return jsonify({"error": "quiz_not_found"}), 404
+        return response
 
     @app.get("/api/student/<student_id>/state")
     def api_get_student_state(student_id: str):
@@ -125,33 +522,32 @@ def create_app() -> Flask:
     @app.post("/api/student/<student_id>/state")
     def api_update_student_state(student_id: str):
         payload = request.get_json(force=True) or {}
-        student = load_student(student_id) or StudentState(
-            student_id=student_id,
-            name=payload.get("name", f"Student {student_id}"),
-        )
-        if "name" in payload:
-            student.name = payload["name"]
-        if "grade_level" in payload:
-            student.grade_level = payload["grade_level"]
-        if "preferred_difficulty" in payload:
-            student.preferred_difficulty = payload["preferred_difficulty"]
-        if "last_unit_id" in payload:
-            student.last_unit_id = payload["last_unit_id"] or None
-        if "last_section_id" in payload:
-            student.last_section_id = payload["last_section_id"] or None
-        if "last_activity" in payload:
-            student.last_activity = payload["last_activity"] or None
-        if "avatar_url" in payload:
-            student.avatar_url = payload["avatar_url"] or None
-        if "avatar_name" in payload:
-            student.avatar_name = payload["avatar_name"] or None
-        save_student(student)
+        with student_transaction():
+            student = _update_student_fields(student_id, payload)
         return jsonify(student.to_dict())
 
     @app.get("/api/attempts/<student_id>")
     def api_attempts(student_id: str):
-        attempts = [a.to_dict() for a in load_attempts(student_id)]
-        return jsonify(attempts)
+        """
+        Full history as a list, or one page with ?limit=&cursor=&since=
+        &until=&fields=summary&order=desc as {"attempts", "next_cursor"}.
+        """
+
+        try:
+            options = _history_page_options()
+            if options is None:
+                return jsonify(_records([a.to_dict() for a in load_attempts(student_id)]))
+            attempts, next_cursor = page_attempts(student_id, **options)
+        except ValueError:
+            return jsonify({"error": "invalid_page_request"}), 400
+        return jsonify(
+            {
+                "attempts": _records(
+                    [_attempt_payload(a, options["summary"]) for a in attempts]
+                ),
+                "next_cursor": next_cursor,
+            }
+        )
 
     @app.get("/api/students")
     def api_students():
@@ -165,7 +561,7 @@ def create_app() -> Flask:
             }
             for student in get_all_students()
         ]
-        return jsonify({"students": students})
+        return jsonify({"students": _records(students)})
 
     @app.post("/api/students")
     def api_create_student_record():
@@ -185,7 +581,8 @@ def create_app() -> Flask:
     def api_teacher_overview():
         """Return aggregated stats for the teacher dashboard."""
 
-        raw_student_summaries = compute_teacher_student_summaries()
+        roster = get_all_students()
+        raw_student_summaries = compute_teacher_student_summaries(roster)
         student_summaries = [summary.to_dict() for summary in raw_student_summaries]
         unit_summaries = [
             summary.to_dict() for summary in compute_teacher_unit_summaries()
@@ -215,9 +612,7 @@ def create_app() -> Flask:
 
         # Surface hardest questions so teachers can see where students struggle.
         questions_lookup = load_questions()
-        question_difficulty = estimate_question_difficulty(
-            get_attempts_for_all_students(), questions_lookup
-        )
+        question_difficulty = current_question_difficulty()
         hardest_questions = [
             {
                 "question_id": qid,
@@ -239,7 +634,7 @@ def create_app() -> Flask:
 
         # Summarize skill mastery across the class.
         skill_totals: Dict[str, Dict[str, float]] = {}
-        for student in get_all_students():
+        for student in roster:
             for skill_id, data in (student.skill_mastery or {}).items():
                 entry = skill_totals.setdefault(
                     skill_id, {"total": 0.0, "count": 0}
@@ -265,23 +660,39 @@ def create_app() -> Flask:
         return jsonify(
             {
                 "summary": summary_payload,
-                "students": student_summaries,
-                "units": unit_summaries,
-                "difficulty_insights": hardest_questions,
-                "skill_mastery_snapshot": skill_mastery_snapshot,
+                "students": _records(student_summaries),
+                "units": _records(unit_summaries),
+                "difficulty_insights": _records(hardest_questions),
+                "skill_mastery_snapshot": _records(skill_mastery_snapshot),
             }
         )
 
     @app.get("/api/teacher/students/<student_id>")
     def api_teacher_student_detail(student_id: str):
-        """Return detail for a single student so teachers can drill down."""
+        """
+        Return detail for a single student so teachers can drill down. The
+        attempts list accepts the same paging arguments as /api/attempts.
+        """
 
+        try:
+            options = _history_page_options()
+        except ValueError:
+            return jsonify({"error": "invalid_page_request"}), 400
         student = load_student(student_id)
         if not student:
             student = StudentState(student_id=student_id, name=f"Student {student_id}")
             save_student(student)
-        attempts = [attempt.to_dict() for attempt in load_attempts(student_id)]
-        mastery_lookup = compute_unit_mastery_for_student(student_id)
+        if options is None:
+            student_attempts = load_attempts(student_id)
+            attempts = [attempt.to_dict() for attempt in student_attempts]
+            mastery_lookup = compute_unit_mastery_for_student(student_id, student_attempts)
+        else:
+            try:
+                page, next_cursor = page_attempts(student_id, **options)
+            except ValueError:
+                return jsonify({"error": "invalid_page_request"}), 400
+            attempts = [_attempt_payload(a, options["summary"]) for a in page]
+            mastery_lookup = compute_unit_mastery_for_student(student_id)
         units = {unit.id: unit.title for unit in load_units()}
         unit_mastery = [
             {
@@ -291,13 +702,14 @@ def create_app() -> Flask:
             }
             for unit_id, mastery in mastery_lookup.items()
         ]
-        return jsonify(
-            {
-                "student": student.to_dict(),
-                "attempts": attempts,
-                "unit_mastery": unit_mastery,
-            }
-        )
+        payload = {
+            "student": student.to_dict(),
+            "attempts": _records(attempts),
+            "unit_mastery": unit_mastery,
+        }
+        if options is not None:
+            payload["next_cursor"] = next_cursor
+        return jsonify(payload)
 
     @app.get("/api/student/<student_id>/diagnostic-results/<unit_id>")
     def api_student_diagnostic_results(student_id: str, unit_id: str):
@@ -325,9 +737,7 @@ def create_app() -> Flask:
         )
         quiz = load_quiz(diagnostic_quiz_id) if diagnostic_quiz_id else None
         questions_lookup = load_questions()
-        difficulty_lookup = estimate_question_difficulty(
-            get_attempts_for_all_students(), questions_lookup
-        )
+        difficulty_lookup = current_question_difficulty()
         feedback_text = generate_personalized_feedback(student, attempt)
 
         questions_payload = []
@@ -386,58 +796,19 @@ def create_app() -> Flask:
     @app.post("/api/attempts")
     def api_create_attempt():
         payload = request.get_json(force=True) or {}
+        if not isinstance(payload, dict):
+            return jsonify({"error": "invalid_attempt"}), 400
         try:
-            attempt = Attempt(
-                id=str(uuid.uuid4()),
-                student_id=payload["student_id"],
-                quiz_id=payload["quiz_id"],
-                quiz_type=payload["quiz_type"],
-                unit_id=payload["unit_id"],
-                section_id=payload.get("section_id"),
-                score_pct=float(payload["score_pct"]),
-                results=[
-                    AttemptQuestionResult(
-                        question_id=r["question_id"],
-                        correct=bool(r["correct"]),
-                        chosen_answer=r["chosen_answer"],
-                        time_sec=float(r.get("time_sec", 0)),
-                        used_hint=bool(r.get("used_hint", False)),
-                    )
-                    for r in payload.get("results", [])
-                ],
-            )
+            attempt = _attempt_from_payload(payload)
         except KeyError as e:
             return jsonify({"error": f"missing_field_{e}"}), 400
+        except ValueError as e:
+            return jsonify({"error": f"invalid_field_{e}"}), 400
 
         append_attempt(attempt)
-        student = load_student(attempt.student_id)
-        if not student:
-            student = StudentState(
-                student_id=attempt.student_id,
-                name=f"Student {attempt.student_id}",
-            )
-        updated_skill_state = update_student_skill_state(
-            attempt.student_id,
-            [attempt],
-            student.skill_mastery,
-        )
-        student.skill_mastery = updated_skill_state
-        mastery_by_skill = {}
-        for skill_id, data in updated_skill_state.items():
-            total = int(data.get("n_observations", 0))
-            correct_estimate = int(round(data.get("p_mastery", 0.0) * total))
-            mastery_by_skill[skill_id] = SkillMastery(
-                skill_id=skill_id,
-                correct=correct_estimate,
-                total=total,
-            )
-        student.mastery_by_skill = mastery_by_skill
-        if attempt.unit_id:
-            student.last_unit_id = attempt.unit_id
-        if attempt.section_id:
-            student.last_section_id = attempt.section_id
-        student.last_activity = attempt.quiz_type
-        save_student(student)
+        with student_transaction():
+            student = _apply_attempts_to_student(attempt.student_id, [attempt])
+            save_student(student)
 
         feedback_text = generate_personalized_feedback(student, attempt)
         response_payload = attempt.to_dict()
@@ -445,6 +816,65 @@ def create_app() -> Flask:
         response_payload["skill_mastery"] = student.skill_mastery
         return jsonify(response_payload), 201
 
+    @app.post("/api/attempts/batch")
+    def api_create_attempts_batch():
+        """
+        Ingest many attempts at once, e.g. when an offline tablet syncs.
+
+        Attempts are persisted in one write and each student's skill state is
+        updated once, replaying their attempts in created_at order. Items may
+        carry the created_at they were taken at. Feedback for each attempt
+        reflects the student's state after the whole batch.
+        """
+
+        payload = request.get_json(force=True) or {}
+        items = payload.get("attempts") if isinstance(payload, dict) else None
+        if not isinstance(items, list) or not items:
+            return jsonify({"error": "attempts_required"}), 400
+
+        attempts: List[Attempt] = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                return jsonify({"error": "invalid_attempt", "index": index}), 400
+            try:
+                attempts.append(_attempt_from_payload(item, allow_created_at=True))
+            except KeyError as e:
+                return jsonify({"error": f"missing_field_{e}", "index": index}), 400
+            except ValueError as e:
+                return jsonify({"error": f"invalid_field_{e}", "index": index}), 400
+
+        append_attempts(attempts)
+
+        attempts_by_student: Dict[str, List[Attempt]] = {}
+        for attempt in attempts:
+            attempts_by_student.setdefault(attempt.student_id, []).append(attempt)
+        with student_transaction():
+            students: Dict[str, StudentState] = {
+                student_id: _apply_attempts_to_student(student_id, student_attempts)
+                for student_id, student_attempts in attempts_by_student.items()
+            }
+            save_students(list(students.values()))
+
+        attempts_payload = []
+        for attempt in attempts:
+            entry = attempt.to_dict()
+            entry["personalized_feedback"] = generate_personalized_feedback(
+                students[attempt.student_id], attempt
+            )
+            attempts_payload.append(entry)
+        return (
+            jsonify(
+                {
+                    "attempts": attempts_payload,
+                    "skill_mastery": {
+                        student_id: student.skill_mastery
+                        for student_id, student in students.items()
+                    },
+                }
+            ),
+            201,
+        )
+
     @app.post("/api/next-question")
     def api_next_question():
         payload = request.get_json(force=True) or {}
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import functools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+from flask import g, has_request_context
+from flask.json.provider import DefaultJSONProvider
+
+T = TypeVar("T")
+
+# Instrumentation is wired in at import time, so when this is off the
+# decorated functions are the original functions and cost nothing extra.
+ENABLED = os.environ.get("BITBYBIT_METRICS") == "1"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """
+    Process-local counters for instrumented functions and HTTP requests,
+    rendered in the Prometheus text exposition format.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # function -> [calls, seconds, bytes_read, bytes_written]
+        self._functions: Dict[str, List[float]] = {}
+        # (method, endpoint, status) -> [requests, seconds]
+        self._requests: Dict[Tuple[str, str, str], List[float]] = {}
+
+    def observe(
+        self, name: str, seconds: float = 0.0, bytes_read: int = 0, bytes_written: int = 0
+    ) -> None:
+        with self._lock:
+            entry = self._functions.get(name)
+            if entry is None:
+                entry = self._functions[name] = [0, 0.0, 0, 0]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] += bytes_read
+            entry[3] += bytes_written
+
+    def observe_request(self, method: str, endpoint: str, status: int, seconds: float) -> None:
+        key = (method, endpoint, str(status))
+        with self._lock:
+            entry = self._requests.get(key)
+            if entry is None:
+                entry = self._requests[key] = [0, 0.0]
+            entry[0] += 1
+            entry[1] += seconds
+
+    def render(self) -> str:
+        with self._lock:
+            functions = {name: list(entry) for name, entry in self._functions.items()}
+            requests = {key: list(entry) for key, entry in self._requests.items()}
+
+        lines = [
+            "# HELP bitbybit_function_duration_seconds Time spent in instrumented functions.",
+            "# TYPE bitbybit_function_duration_seconds summary",
+        ]
+        for name, (calls, seconds, _, _) in sorted(functions.items()):
+            label = f'function="{_escape(name)}"'
+            lines.append(f"bitbybit_function_duration_seconds_count{{{label}}} {int(calls)}")
+            lines.append(f"bitbybit_function_duration_seconds_sum{{{label}}} {seconds:.6f}")
+        for metric, index, help_text in (
+            ("bitbybit_io_read_bytes_total", 2, "Bytes read by instrumented functions."),
+            ("bitbybit_io_written_bytes_total", 3, "Bytes written by instrumented functions."),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for name, entry in sorted(functions.items()):
+                if entry[index]:
+                    lines.append(f'{metric}{{function="{_escape(name)}"}} {int(entry[index])}')
+        lines.append("# HELP bitbybit_http_request_duration_seconds Time spent handling HTTP requests.")
+        lines.append("# TYPE bitbybit_http_request_duration_seconds summary")
+        for (method, endpoint, status), (count, seconds) in sorted(requests.items()):
+            label = (
+                f'method="{_escape(method)}",endpoint="{_escape(endpoint)}",status="{status}"'
+            )
+            lines.append(f"bitbybit_http_request_duration_seconds_count{{{label}}} {int(count)}")
+            lines.append(f"bitbybit_http_request_duration_seconds_sum{{{label}}} {seconds:.6f}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._functions.clear()
+            self._requests.clear()
+
+
+registry = MetricsRegistry()
+
+
+def _add_server_timing(name: str, seconds: float) -> None:
+    if not has_request_context():
+        return
+    timings = g.get("_server_timing")
+    if timings is None:
+        timings = g._server_timing = {}
+    entry = timings.get(name)
+    if entry is None:
+        timings[name] = [1, seconds]
+    else:
+        entry[0] += 1
+        entry[1] += seconds
+
+
+def record(name: str, seconds: float = 0.0, bytes_read: int = 0, bytes_written: int = 0) -> None:
+    """
+    Record one call of ``name``. Callers should check ``ENABLED`` first when
+    computing the arguments costs anything.
+    """
+
+    registry.observe(name, seconds, bytes_read, bytes_written)
+    _add_server_timing(name, seconds)
+
+
+def instrumented(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Count calls to the decorated function and time them. When metrics are
+    disabled the function is returned unchanged.
+    """
+
+    def decorate(fn: Callable[..., T]) -> Callable[..., T]:
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorate
+
+
+def server_timing_header(total_seconds: float) -> str:
+    """
+    Format this request's timings for a ``Server-Timing`` header. Nested
+    calls are included in their callers' durations.
+    """
+
+    parts = []
+    for name, (calls, seconds) in (g.get("_server_timing") or {}).items():
+        parts.append(f'{name};dur={seconds * 1000.0:.2f};desc="{int(calls)}x"')
+    parts.append(f"total;dur={total_seconds * 1000.0:.2f}")
+    return ", ".join(parts)
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that records response serialization as ``json_dumps``.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        start = time.perf_counter()
+        text = super().dumps(obj, **kwargs)
+        record("json_dumps", time.perf_counter() - start, bytes_written=len(text))
+        return text
@@ -0,0 +1,114 @@
+"""
+Maintenance commands for the ML layer.
+
+Run from ``src`` with ``python -m backend.ml <command>``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from typing import List, Optional
+
+from ..repository import iter_attempts, load_questions
+from .bkt import BKT_PARAMS_PATH, Observations, fit_bkt_params, save_bkt_params
+from .difficulty import (
+    current_question_difficulty,
+    estimate_question_difficulty,
+    question_stats,
+)
+from .replay import replay_skill_states
+
+
+def rebuild_difficulty(args: argparse.Namespace) -> None:
+    question_stats.rebuild()
+    print(
+        f"Rebuilt statistics for {len(question_stats.state)} questions "
+        f"up to cursor {question_stats.cursor}"
+    )
+    if not args.verify:
+        return
+    expected = estimate_question_difficulty(iter_attempts(), load_questions())
+    actual = current_question_difficulty()
+    mismatched = sorted(
+        qid for qid in set(actual) | set(expected) if actual.get(qid) != expected.get(qid)
+    )
+    if mismatched:
+        raise SystemExit(f"Mismatch for {len(mismatched)} questions: {mismatched[:10]}")
+    print("Aggregate matches full recomputation.")
+
+
+def fit_bkt(args: argparse.Namespace) -> None:
+    observations = Observations.from_attempts(iter_attempts(), load_questions())
+    result = fit_bkt_params(observations, max_sequence_length=args.max_sequence_length)
+    print(
+        f"Fitted {len(result.skills)} skills from {len(observations)} observations "
+        f"in {result.iterations} iterations ({result.seconds}s)"
+    )
+    if args.dry_run:
+        print(json.dumps(result.to_json()["skills"], indent=2, sort_keys=True))
+        return
+    save_bkt_params(result)
+    print(f"Wrote {BKT_PARAMS_PATH}")
+
+
+def replay_skills(args: argparse.Namespace) -> None:
+    report = replay_skill_states(workers=args.workers, write=not args.dry_run)
+    print(json.dumps(report.to_dict(), indent=2, sort_keys=True))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m backend.ml")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser(
+        "rebuild-difficulty",
+        help="replay every stored attempt into the question difficulty aggregate",
+    )
+    rebuild.add_argument(
+        "--verify",
+        action="store_true",
+        help="compare the rebuilt aggregate with a full recomputation",
+    )
+    rebuild.set_defaults(handler=rebuild_difficulty)
+
+    fit = commands.add_parser(
+        "fit-bkt",
+        help="fit per-skill Bayesian Knowledge Tracing parameters from every stored attempt",
+    )
+    fit.add_argument(
+        "--max-sequence-length",
+        type=int,
+        default=200,
+        help="answers used per student and skill (default: %(default)s)",
+    )
+    fit.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="print the fitted parameters instead of writing bkt_params.json",
+    )
+    fit.set_defaults(handler=fit_bkt)
+
+    replay = commands.add_parser(
+        "replay-skills",
+        help="recompute every student's skill mastery from their full attempt history",
+    )
+    replay.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes (default: CPU count; 1 runs in-process)",
+    )
+    replay.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="replay and report without saving the students",
+    )
+    replay.set_defaults(handler=replay_skills)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
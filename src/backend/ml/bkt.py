@@ -0,0 +1,387 @@
+"""
+Bayesian Knowledge Tracing with per-skill parameters.
+
+Each skill has its own prior, learn, slip and guess probabilities. They are
+fitted offline from the whole attempt history with ``fit_bkt_params`` and
+stored in ``data/bkt_params.json``; skills without fitted parameters use
+``DEFAULT_PARAMS``. The online update touches only the skills an attempt
+covers.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from ..locking import atomic_write
+from ..models import Attempt, Question
+from ..repository import DATA_DIR, catalog, load_questions
+
+BKT_PARAMS_PATH = DATA_DIR / "bkt_params.json"
+MAX_SLIP = 0.3
+MAX_GUESS = 0.3
+
+
+@dataclass(frozen=True)
+class BKTParams:
+    prior: float
+    learn: float
+    slip: float
+    guess: float
+
+
+DEFAULT_PARAMS = BKTParams(prior=0.3, learn=0.15, slip=0.1, guess=0.2)
+
+
+def _read_params_file(path: Path) -> Dict[str, Any]:
+    try:
+        with path.open() as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _build_params(raw: Dict[str, Any]) -> Tuple[BKTParams, Mapping[str, BKTParams]]:
+    fields = ("prior", "learn", "slip", "guess")
+    default = raw.get("default") or {}
+    default_params = BKTParams(
+        **{name: float(default.get(name, getattr(DEFAULT_PARAMS, name))) for name in fields}
+    )
+    skills = {
+        skill_id: BKTParams(**{name: float(data[name]) for name in fields})
+        for skill_id, data in (raw.get("skills") or {}).items()
+        if all(name in data for name in fields)
+    }
+    return default_params, skills
+
+
+def load_bkt_params() -> Tuple[BKTParams, Mapping[str, BKTParams]]:
+    """
+    Return ``(default, per_skill)`` from ``bkt_params.json``, cached until
+    the file changes.
+    """
+
+    return catalog.get(BKT_PARAMS_PATH, _read_params_file, _build_params)
+
+
+def _posterior(p_mastery: float, correct: bool, params: BKTParams) -> float:
+    if correct:
+        known = p_mastery * (1.0 - params.slip)
+        unknown = (1.0 - p_mastery) * params.guess
+    else:
+        known = p_mastery * params.slip
+        unknown = (1.0 - p_mastery) * (1.0 - params.guess)
+    p_known = known / (known + unknown) if known + unknown > 0 else p_mastery
+    return p_known + (1.0 - p_known) * params.learn
+
+
+def update_skill_state_bkt(
+    attempts: Iterable[Attempt],
+    current_state: Optional[Dict[str, Dict[str, float]]],
+    questions: Mapping[str, Question],
+) -> Dict[str, Dict[str, float]]:
+    """
+    BKT counterpart of the rule-based update in ``knowledge_tracing``; the
+    returned state has the same shape.
+    """
+
+    from .knowledge_tracing import _get_skill_ids
+
+    default, per_skill = load_bkt_params()
+    skill_state: Dict[str, Dict[str, float]] = {
+        skill_id: {
+            "p_mastery": float(data.get("p_mastery", per_skill.get(skill_id, default).prior)),
+            "n_observations": int(data.get("n_observations", 0)),
+            "recent_correct": int(data.get("recent_correct", 0)),
+        }
+        for skill_id, data in (current_state or {}).items()
+    }
+
+    for attempt in sorted(attempts or [], key=lambda a: a.created_at or 0.0):
+        for result in attempt.results or []:
+            question = questions.get(result.question_id)
+            for skill_id in _get_skill_ids(question, attempt):
+                params = per_skill.get(skill_id, default)
+                state = skill_state.setdefault(
+                    skill_id,
+                    {"p_mastery": params.prior, "n_observations": 0, "recent_correct": 0},
+                )
+                p_mastery = _posterior(float(state["p_mastery"]), result.correct, params)
+                if result.correct:
+                    state["recent_correct"] = min(5, state.get("recent_correct", 0) + 1)
+                else:
+                    state["recent_correct"] = 0
+                state["p_mastery"] = round(min(0.995, max(0.01, p_mastery)), 4)
+                state["n_observations"] = state.get("n_observations", 0) + 1
+
+    return skill_state
+
+
+@dataclass
+class Observations:
+    """
+    One row per (student, skill) answer: ``sequence`` identifies the
+    student/skill pair and rows of a sequence are in chronological order.
+    """
+
+    skill_ids: List[str]
+    skill: np.ndarray
+    sequence: np.ndarray
+    correct: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.correct.shape[0])
+
+    @classmethod
+    def from_attempts(
+        cls,
+        attempts: Iterable[Attempt],
+        questions: Optional[Mapping[str, Question]] = None,
+    ) -> "Observations":
+        from .knowledge_tracing import _get_skill_ids
+
+        if questions is None:
+            questions = load_questions()
+        histories: Dict[str, List[Attempt]] = {}
+        for attempt in attempts:
+            histories.setdefault(attempt.student_id, []).append(attempt)
+
+        skill_codes: Dict[str, int] = {}
+        sequence_codes: Dict[Tuple[str, str], int] = {}
+        skill: List[int] = []
+        sequence: List[int] = []
+        correct: List[bool] = []
+        for student_id, history in histories.items():
+            history.sort(key=lambda a: a.created_at or 0.0)
+            for attempt in history:
+                for result in attempt.results:
+                    question = questions.get(result.question_id)
+                    for skill_id in _get_skill_ids(question, attempt):
+                        code = skill_codes.setdefault(skill_id, len(skill_codes))
+                        key = (student_id, skill_id)
+                        skill.append(code)
+                        sequence.append(sequence_codes.setdefault(key, len(sequence_codes)))
+                        correct.append(bool(result.correct))
+        return cls(
+            skill_ids=list(skill_codes),
+            skill=np.asarray(skill, dtype=np.int64),
+            sequence=np.asarray(sequence, dtype=np.int64),
+            correct=np.asarray(correct, dtype=bool),
+        )
+
+
+@dataclass
+class FitResult:
+    default: BKTParams
+    skills: Dict[str, BKTParams]
+    observations: Dict[str, int]
+    iterations: int
+    log_likelihood: float
+    seconds: float
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "default": asdict(self.default),
+            "skills": {
+                skill_id: {
+                    **{name: round(value, 4) for name, value in asdict(params).items()},
+                    "n_observations": self.observations.get(skill_id, 0),
+                }
+                for skill_id, params in self.skills.items()
+            },
+            "fitted_at": time.time(),
+            "iterations": self.iterations,
+            "log_likelihood": round(self.log_likelihood, 3),
+        }
+
+
+def _time_major(obs: Observations, max_sequence_length: int):
+    """
+    Reorder rows so step ``t`` of every sequence is contiguous.
+
+    Sequences are ranked longest first, so the sequences still active at step
+    ``t`` are always ranks ``0 .. active[t] - 1`` and occupy
+    ``offsets[t] : offsets[t] + active[t]``. No padding is needed.
+    """
+
+    n_sequences = int(obs.sequence.max()) + 1
+    order = np.argsort(obs.sequence, kind="stable")
+    lengths = np.bincount(obs.sequence, minlength=n_sequences)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    position = np.arange(order.shape[0]) - starts[obs.sequence[order]]
+    keep = position < max_sequence_length
+    order, position = order[keep], position[keep]
+    lengths = np.minimum(lengths, max_sequence_length)
+
+    rank = np.empty(n_sequences, dtype=np.int64)
+    rank[np.argsort(-lengths, kind="stable")] = np.arange(n_sequences)
+    steps = int(lengths.max())
+    active = np.bincount(lengths, minlength=steps + 1)[::-1].cumsum()[::-1][1:]
+    offsets = np.concatenate(([0], np.cumsum(active)[:-1]))
+
+    flat = offsets[position] + rank[obs.sequence[order]]
+    skill = np.empty(flat.shape[0], dtype=np.int64)
+    correct = np.empty(flat.shape[0], dtype=bool)
+    skill[flat] = obs.skill[order]
+    correct[flat] = obs.correct[order]
+    return skill, correct, active.tolist(), offsets.tolist()
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray, fallback: np.ndarray) -> np.ndarray:
+    return np.where(denominator > 0, numerator / np.maximum(denominator, 1e-12), fallback)
+
+
+def fit_bkt_params(
+    obs: Observations,
+    max_iterations: int = 50,
+    tolerance: float = 1e-5,
+    max_sequence_length: int = 200,
+    min_observations: int = 30,
+) -> FitResult:
+    """
+    Fit per-skill BKT parameters with expectation-maximization.
+
+    Forward-backward runs over every student/skill sequence at once: the
+    Python loop is over sequence steps, and each step is a handful of NumPy
+    operations across all sequences active at that step. Sequences are
+    truncated to ``max_sequence_length`` answers, which bounds the loop
+    without losing the early answers where learning shows up. Skills with
+    fewer than ``min_observations`` answers keep the default parameters.
+    """
+
+    start = time.perf_counter()
+    if not len(obs):
+        return FitResult(DEFAULT_PARAMS, {}, {}, 0, 0.0, 0.0)
+
+    skill, correct, active, offsets = _time_major(obs, max_sequence_length)
+    n_skills = len(obs.skill_ids)
+    n_rows = skill.shape[0]
+    counts = np.bincount(skill, minlength=n_skills)
+    first = slice(0, active[0])
+    first_counts = np.bincount(skill[first], minlength=n_skills)
+    correct_f = correct.astype(np.float64)
+
+    prior = np.full(n_skills, DEFAULT_PARAMS.prior)
+    learn = np.full(n_skills, DEFAULT_PARAMS.learn)
+    slip = np.full(n_skills, DEFAULT_PARAMS.slip)
+    guess = np.full(n_skills, DEFAULT_PARAMS.guess)
+
+    alpha = np.empty(n_rows)
+    scale = np.empty(n_rows)
+    beta1 = np.empty(n_rows)
+    beta0 = np.empty(n_rows)
+    xi = np.zeros(n_rows)
+    from_unknown = np.zeros(n_rows)
+    previous = -np.inf
+    log_likelihood = previous
+    iterations = 0
+
+    for iterations in range(1, max_iterations + 1):
+        row_learn = learn[skill]
+        e1 = np.where(correct, 1.0 - slip[skill], slip[skill])
+        e0 = np.where(correct, guess[skill], 1.0 - guess[skill])
+
+        # Forward pass: alpha is P(known | answers so far).
+        for t, (offset, n) in enumerate(zip(offsets, active)):
+            rows = slice(offset, offset + n)
+            if t == 0:
+                p = prior[skill[rows]]
+            else:
+                before = alpha[offsets[t - 1] : offsets[t - 1] + n]
+                p = before + (1.0 - before) * row_learn[rows]
+            known = p * e1[rows]
+            scale[rows] = known + (1.0 - p) * e0[rows]
+            alpha[rows] = known / scale[rows]
+
+        # Backward pass, scaled by the forward normalizers.
+        for t in range(len(active) - 1, -1, -1):
+            offset, n = offsets[t], active[t]
+            n_next = active[t + 1] if t + 1 < len(active) else 0
+            b1 = np.ones(n)
+            b0 = np.ones(n)
+            if n_next:
+                nxt = slice(offsets[t + 1], offsets[t + 1] + n_next)
+                stay = e0[nxt] * beta0[nxt]
+                move = e1[nxt] * beta1[nxt]
+                b1[:n_next] = move / scale[nxt]
+                b0[:n_next] = ((1.0 - row_learn[nxt]) * stay + row_learn[nxt] * move) / scale[nxt]
+                unknown_now = 1.0 - alpha[offset : offset + n_next]
+                xi[nxt] = unknown_now * row_learn[nxt] * move / scale[nxt]
+            beta1[offset : offset + n] = b1
+            beta0[offset : offset + n] = b0
+
+        gamma1 = alpha * beta1
+        gamma0 = (1.0 - alpha) * beta0
+        total = gamma1 + gamma0
+        gamma1 /= total
+        gamma0 /= total
+        # Rows after the first in each sequence: gamma0 of the preceding row.
+        for t in range(1, len(active)):
+            n = active[t]
+            from_unknown[offsets[t] : offsets[t] + n] = gamma0[offsets[t - 1] : offsets[t - 1] + n]
+
+        prior = np.clip(
+            _ratio(np.bincount(skill[first], weights=gamma1[first], minlength=n_skills), first_counts, prior),
+            0.01,
+            0.99,
+        )
+        learn = np.clip(
+            _ratio(
+                np.bincount(skill, weights=xi, minlength=n_skills),
+                np.bincount(skill, weights=from_unknown, minlength=n_skills),
+                learn,
+            ),
+            0.001,
+            0.5,
+        )
+        guess = np.clip(
+            _ratio(
+                np.bincount(skill, weights=gamma0 * correct_f, minlength=n_skills),
+                np.bincount(skill, weights=gamma0, minlength=n_skills),
+                guess,
+            ),
+            0.001,
+            MAX_GUESS,
+        )
+        slip = np.clip(
+            _ratio(
+                np.bincount(skill, weights=gamma1 * (1.0 - correct_f), minlength=n_skills),
+                np.bincount(skill, weights=gamma1, minlength=n_skills),
+                slip,
+            ),
+            0.001,
+            MAX_SLIP,
+        )
+
+        log_likelihood = float(np.log(scale).sum())
+        if log_likelihood - previous < tolerance * n_rows:
+            break
+        previous = log_likelihood
+
+    skills = {
+        skill_id: BKTParams(
+            prior=float(prior[code]),
+            learn=float(learn[code]),
+            slip=float(slip[code]),
+            guess=float(guess[code]),
+        )
+        for code, skill_id in enumerate(obs.skill_ids)
+        if counts[code] >= min_observations
+    }
+    return FitResult(
+        default=DEFAULT_PARAMS,
+        skills=skills,
+        observations={skill_id: int(counts[code]) for code, skill_id in enumerate(obs.skill_ids)},
+        iterations=iterations,
+        log_likelihood=log_likelihood,
+        seconds=round(time.perf_counter() - start, 3),
+    )
+
+
+def save_bkt_params(result: FitResult, path: Path = BKT_PARAMS_PATH) -> None:
+    atomic_write(path, json.dumps(result.to_json(), indent=2, sort_keys=True))
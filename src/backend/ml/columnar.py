@@ -0,0 +1,117 @@
+"""
+Columnar difficulty estimation for offline recalibration jobs.
+
+``estimate_question_difficulty`` in ``difficulty.py`` stays the reference
+implementation; the engine here produces the same payload from flat NumPy
+arrays so it can chew through millions of answer rows.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+from ..models import Attempt, Question
+from .difficulty import _difficulty_from_stats
+
+
+@dataclass
+class ResultColumns:
+    """
+    One row per answered question: ``question_ids[question_index[i]]`` was
+    answered ``correct[i]`` in ``time_sec[i]`` seconds.
+    """
+
+    question_ids: List[str]
+    question_index: np.ndarray
+    correct: np.ndarray
+    time_sec: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.question_index.shape[0])
+
+    @classmethod
+    def from_attempts(cls, attempts: Iterable[Attempt]) -> "ResultColumns":
+        return cls._build(
+            (result.question_id, result.correct, result.time_sec)
+            for attempt in attempts or []
+            for result in attempt.results or []
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "ResultColumns":
+        """
+        Build columns straight from stored attempt dicts, e.g.
+        ``attempt_store.iter_records()``, without creating dataclasses.
+        """
+
+        return cls._build(
+            (
+                r.get("question_id", ""),
+                bool(r.get("correct", False)),
+                float(r.get("time_sec", 0)),
+            )
+            for record in records
+            for r in record.get("results") or []
+        )
+
+    @classmethod
+    def _build(cls, rows) -> "ResultColumns":
+        codes: Dict[str, int] = {}
+        question_index: List[int] = []
+        correct: List[bool] = []
+        time_sec: List[float] = []
+        for question_id, is_correct, seconds in rows:
+            if not question_id:
+                continue
+            code = codes.get(question_id)
+            if code is None:
+                code = codes[question_id] = len(codes)
+            question_index.append(code)
+            correct.append(bool(is_correct))
+            time_sec.append(float(seconds or 0.0))
+        return cls(
+            question_ids=list(codes),
+            question_index=np.asarray(question_index, dtype=np.int64),
+            correct=np.asarray(correct, dtype=bool),
+            time_sec=np.asarray(time_sec, dtype=np.float64),
+        )
+
+
+def estimate_question_difficulty_vectorized(
+    columns: ResultColumns,
+    question_lookup: Optional[Mapping[str, Question]] = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Same output as ``estimate_question_difficulty`` for the same answers.
+
+    The per-row work is three ``bincount`` passes plus one ``minimum.at`` to
+    find each question's first row. ``bincount`` adds weights
+    in input order, so the time sums match the reference loop bit for bit.
+    Only the per-question scoring runs in Python, which is O(questions).
+    """
+
+    n_questions = len(columns.question_ids)
+    index = columns.question_index
+    totals = np.bincount(index, minlength=n_questions)
+    corrects = np.bincount(index, weights=columns.correct.astype(np.float64), minlength=n_questions)
+    # The reference skips zero times and clamps negatives (and NaN) to zero.
+    times = np.where(columns.time_sec > 0, columns.time_sec, 0.0)
+    time_sums = np.bincount(index, weights=times, minlength=n_questions)
+
+    # Emit questions in first-seen order, as the reference does.
+    first_rows = np.full(n_questions, index.shape[0], dtype=np.int64)
+    np.minimum.at(first_rows, index, np.arange(index.shape[0], dtype=np.int64))
+    present = np.flatnonzero(totals)
+    order = present[np.argsort(first_rows[present], kind="stable")]
+
+    stats: Dict[str, Dict[str, float]] = {}
+    for code in order.tolist():
+        stats[columns.question_ids[code]] = {
+            "correct": float(corrects[code]),
+            "total": float(totals[code]),
+            "time": float(time_sums[code]),
+        }
+    return _difficulty_from_stats(stats, question_lookup)
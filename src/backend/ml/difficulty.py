@@ -1,8 +1,18 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, Mapping, Optional
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
+from .. import metrics
 from ..models import Attempt, Question
+from ..repository import (
+    DATA_DIR,
+    STORAGE_ENGINE,
+    attempt_store,
+    content_version,
+    load_questions,
+)
+from ..request_memo import request_memoized
+from ..views import AttemptView
 
 SMOOTHING = 1.0
 BASE_DIFFICULTY = {
@@ -20,6 +30,75 @@ def _difficulty_label(score: float) -> str:
     return "hard"
 
 
+def _accumulate(
+    stats: Dict[str, Dict[str, float]],
+    question_id: str,
+    correct: bool,
+    time_sec: float,
+) -> None:
+    if not question_id:
+        return
+    entry = stats.setdefault(question_id, {"correct": 0.0, "total": 0.0, "time": 0.0})
+    entry["total"] += 1.0
+    if correct:
+        entry["correct"] += 1.0
+    if time_sec:
+        entry["time"] += max(0.0, float(time_sec))
+
+
+def _difficulty_from_stats(
+    stats: Mapping[str, Dict[str, float]],
+    question_lookup: Optional[Mapping[str, Question]] = None,
+) -> Dict[str, Dict[str, float]]:
+    stats = dict(stats)
+    if question_lookup:
+        for qid in question_lookup.keys():
+            stats.setdefault(qid, {"correct": 0.0, "total": 0.0, "time": 0.0})
+
+    results: Dict[str, Dict[str, float]] = {}
+    for qid, entry in stats.items():
+        results[qid] = _difficulty_entry(entry, question_lookup.get(qid) if question_lookup else None)
+    return results
+
+
+def _difficulty_entry(entry: Mapping[str, float], question: Optional[Question]) -> Dict[str, float]:
+    total = entry["total"]
+    correct = entry["correct"]
+    avg_time = entry["time"] / total if total else None
+
+    base = 0.5
+    if question:
+        base = BASE_DIFFICULTY.get(question.difficulty, 0.5)
+
+    if total == 0:
+        difficulty_score = base
+        p_correct = max(0.0, min(1.0, 1.0 - base))
+    else:
+        p_correct = (correct + SMOOTHING) / (total + 2 * SMOOTHING)
+        difficulty_score = 1.0 - p_correct
+
+    if avg_time is not None and question:
+        expected = max(15.0, float(question.estimated_time_sec or 60))
+        ratio = min(avg_time / expected, 3.0)
+        difficulty_score = max(
+            0.0,
+            min(1.0, difficulty_score * 0.8 + (ratio - 1.0) * 0.25 + base * 0.2),
+        )
+    else:
+        difficulty_score = max(0.0, min(1.0, difficulty_score * 0.7 + base * 0.3))
+
+    payload: Dict[str, float] = {
+        "difficulty": round(difficulty_score, 3),
+        "p_correct": round(p_correct, 3),
+        "n_attempts": int(total),
+        "level": _difficulty_label(difficulty_score),
+    }
+    if avg_time is not None and total > 0:
+        payload["avg_time_sec"] = round(avg_time, 1)
+    return payload
+
+
+@metrics.instrumented("ml.estimate_difficulty")
 def estimate_question_difficulty(
     attempt_history: Iterable[Attempt],
     question_lookup: Optional[Mapping[str, Question]] = None,
@@ -33,56 +112,90 @@ def estimate_question_difficulty(
     stats: Dict[str, Dict[str, float]] = {}
     for attempt in attempt_history or []:
         for result in attempt.results or []:
-            qid = result.question_id
-            if not qid:
-                continue
-            entry = stats.setdefault(qid, {"correct": 0.0, "total": 0.0, "time": 0.0})
-            entry["total"] += 1.0
-            if result.correct:
-                entry["correct"] += 1.0
-            if result.time_sec:
-                entry["time"] += max(0.0, float(result.time_sec))
+            _accumulate(stats, result.question_id, result.correct, result.time_sec)
 
-    if question_lookup:
-        for qid in question_lookup.keys():
-            stats.setdefault(qid, {"correct": 0.0, "total": 0.0, "time": 0.0})
+    return _difficulty_from_stats(stats, question_lookup)
 
-    results: Dict[str, Dict[str, float]] = {}
-    for qid, entry in stats.items():
-        total = entry["total"]
-        correct = entry["correct"]
-        avg_time = entry["time"] / total if total else None
-
-        base = 0.5
-        if question_lookup and qid in question_lookup:
-            q = question_lookup[qid]
-            base = BASE_DIFFICULTY.get(q.difficulty, 0.5)
-
-        if total == 0:
-            difficulty_score = base
-            p_correct = max(0.0, min(1.0, 1.0 - base))
-        else:
-            p_correct = (correct + SMOOTHING) / (total + 2 * SMOOTHING)
-            difficulty_score = 1.0 - p_correct
-
-        if avg_time is not None and question_lookup and qid in question_lookup:
-            expected = max(15.0, float(question_lookup[qid].estimated_time_sec or 60))
-            ratio = min(avg_time / expected, 3.0)
-            difficulty_score = max(
-                0.0,
-                min(1.0, difficulty_score * 0.8 + (ratio - 1.0) * 0.25 + base * 0.2),
+
+class QuestionStatsView(AttemptView):
+    """
+    Running per-question correct/total/time sums over every stored attempt.
+    """
+
+    def empty_state(self) -> Dict[str, Dict[str, float]]:
+        return {}
+
+    def apply(self, record: Dict[str, Any]) -> None:
+        for r in record.get("results") or []:
+            _accumulate(
+                self.state,
+                r.get("question_id", ""),
+                bool(r.get("correct", False)),
+                float(r.get("time_sec", 0)),
             )
-        else:
-            difficulty_score = max(0.0, min(1.0, difficulty_score * 0.7 + base * 0.3))
-
-        payload: Dict[str, float] = {
-            "difficulty": round(difficulty_score, 3),
-            "p_correct": round(p_correct, 3),
-            "n_attempts": int(total),
-            "level": _difficulty_label(difficulty_score),
-        }
-        if avg_time is not None and total > 0:
-            payload["avg_time_sec"] = round(avg_time, 1)
-        results[qid] = payload
 
-    return results
+
+question_stats = QuestionStatsView(
+    attempt_store, DATA_DIR / f"question_stats_{STORAGE_ENGINE}.snapshot.json"
+)
+_current_cache: Dict[str, Any] = {"key": None, "value": None}
+
+
+@request_memoized
+def current_difficulty_version() -> Tuple:
+    """
+    Token that changes whenever ``current_question_difficulty`` would return
+    different values.
+    """
+
+    question_stats.refresh()
+    return (question_stats.version, content_version())
+
+
+@request_memoized
+@metrics.instrumented("ml.current_difficulty")
+def current_question_difficulty() -> Dict[str, Dict[str, float]]:
+    """
+    Same payload as ``estimate_question_difficulty`` over every stored attempt
+    and the full question bank, served from the maintained aggregate.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+
+    key = current_difficulty_version()
+    if _current_cache["key"] != key:
+        questions = load_questions()
+        with question_stats.read() as stats:
+            value = _difficulty_from_stats(stats, questions)
+        _current_cache["value"] = value
+        _current_cache["key"] = key
+    return _current_cache["value"]
+
+
+def question_difficulty(question_ids: Iterable[str]) -> Dict[str, Dict[str, float]]:
+    """
+    The ``current_question_difficulty`` entries for just ``question_ids``.
+
+    Entries are scored straight from the maintained aggregate, so the cost
+    is O(len(question_ids)) instead of rebuilding the payload for the whole
+    question bank after every new attempt. Ids without an entry there are
+    left out.
+    """
+
+    key = current_difficulty_version()
+    if _current_cache["key"] == key:
+        full = _current_cache["value"]
+        return {qid: full[qid] for qid in question_ids if qid in full}
+
+    questions = load_questions()
+    entries: Dict[str, Dict[str, float]] = {}
+    with question_stats.read() as stats:
+        for qid in question_ids:
+            question = questions.get(qid)
+            entry = stats.get(qid)
+            if entry is None:
+                if question is None:
+                    continue
+                entry = {"correct": 0.0, "total": 0.0, "time": 0.0}
+            entries[qid] = _difficulty_entry(entry, question)
+    return entries
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
 from collections import Counter, defaultdict
-from typing import Dict
+from typing import Any, Dict, Mapping, Tuple
 
+from .. import metrics
 from ..models import Attempt, StudentState
-from ..repository import load_questions, get_attempts_for_all_students
-from .difficulty import estimate_question_difficulty
+from ..repository import content_version, load_questions
+from .difficulty import question_difficulty
+
+# question -> skill ids, rebuilt only when units, quizzes or questions change.
+_question_skills_cache: Dict[str, Any] = {"key": None, "value": {}}
 
 
 def _pretty_skill_name(skill_id: str) -> str:
     return skill_id.replace("_", " ").replace("-", " ").title()
 
 
+def _question_skills() -> Mapping[str, Tuple[str, ...]]:
+    key = content_version()
+    if _question_skills_cache["key"] != key:
+        _question_skills_cache["value"] = {
+            qid: tuple(question.skill_ids) if question.skill_ids else (question.unit_id,)
+            for qid, question in load_questions().items()
+        }
+        _question_skills_cache["key"] = key
+    return _question_skills_cache["value"]
+
+
+@metrics.instrumented("ml.personalized_feedback")
 def generate_personalized_feedback(
     student_state: StudentState,
     last_attempt: Attempt,
@@ -24,19 +40,15 @@ def generate_personalized_feedback(
     if not last_attempt or not last_attempt.results:
         return "Thanks for submitting your work. Keep going — every attempt helps us personalize your path."
 
-    questions = load_questions()
-    all_attempts = get_attempts_for_all_students()
-    difficulty_lookup = estimate_question_difficulty(all_attempts, questions)
+    question_skills = _question_skills()
+    fallback_skills = (last_attempt.unit_id or "general",)
+    difficulty_lookup = question_difficulty(
+        result.question_id for result in last_attempt.results
+    )
 
     skill_scores: Dict[str, Counter] = defaultdict(Counter)
     for result in last_attempt.results:
-        question = questions.get(result.question_id)
-        skill_ids = (
-            question.skill_ids
-            if question and question.skill_ids
-            else [question.unit_id if question else last_attempt.unit_id or "general"]
-        )
-        for skill_id in skill_ids:
+        for skill_id in question_skills.get(result.question_id, fallback_skills):
             skill_scores[skill_id]["count"] += 1
             if result.correct:
                 skill_scores[skill_id]["correct"] += 1
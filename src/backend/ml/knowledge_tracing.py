@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, Optional
+import os
+from typing import Dict, Iterable, Mapping, Optional
 
-from ..models import Attempt
+from .. import metrics
+from ..models import Attempt, Question, SkillMastery
 from ..repository import load_questions
 
 DEFAULT_PRIOR = 0.3
 LEARN_RATE = 0.25
 FORGET_RATE = 0.1
+# "rule" (the fixed-rate update below) or "bkt" (per-skill fitted parameters).
+KNOWLEDGE_TRACING_MODE = (os.environ.get("BITBYBIT_KNOWLEDGE_TRACING") or "rule").strip().lower()
+if KNOWLEDGE_TRACING_MODE not in {"rule", "bkt"}:
+    raise ValueError(f"Unknown BITBYBIT_KNOWLEDGE_TRACING mode: {KNOWLEDGE_TRACING_MODE!r}")
 
 
 def _get_skill_ids(question, attempt: Attempt) -> Iterable[str]:
@@ -20,17 +26,28 @@ def _get_skill_ids(question, attempt: Attempt) -> Iterable[str]:
     return [attempt.unit_id or "general"]
 
 
+@metrics.instrumented("ml.update_skill_state")
 def update_student_skill_state(
     student_id: str,
     attempts: Iterable[Attempt],
     current_state: Optional[Dict[str, Dict[str, float]]],
+    questions: Optional[Mapping[str, Question]] = None,
 ) -> Dict[str, Dict[str, float]]:
     """
     Apply a low-parameter Bayesian-inspired update rule to the student's skill
     estimates based on the provided attempts.
+
+    Pass ``questions`` to reuse one catalog lookup across many students.
+    With ``BITBYBIT_KNOWLEDGE_TRACING=bkt`` the update uses Bayesian
+    Knowledge Tracing instead (see ``bkt.py``).
     """
 
-    questions = load_questions()
+    if questions is None:
+        questions = load_questions()
+    if KNOWLEDGE_TRACING_MODE == "bkt":
+        from .bkt import update_skill_state_bkt
+
+        return update_skill_state_bkt(attempts, current_state, questions)
     skill_state: Dict[str, Dict[str, float]] = {
         skill_id: {
             "p_mastery": float(data.get("p_mastery", DEFAULT_PRIOR)),
@@ -75,3 +92,22 @@ def update_student_skill_state(
                 state["n_observations"] = state.get("n_observations", 0) + 1
 
     return skill_state
+
+
+def mastery_by_skill_from_state(
+    skill_state: Mapping[str, Mapping[str, float]],
+) -> Dict[str, SkillMastery]:
+    """
+    Summarize a skill state as the correct/total counts shown on dashboards.
+    """
+
+    mastery_by_skill: Dict[str, SkillMastery] = {}
+    for skill_id, data in skill_state.items():
+        total = int(data.get("n_observations", 0))
+        correct_estimate = int(round(data.get("p_mastery", 0.0) * total))
+        mastery_by_skill[skill_id] = SkillMastery(
+            skill_id=skill_id,
+            correct=correct_estimate,
+            total=total,
+        )
+    return mastery_by_skill
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from .. import metrics
 from ..models import Attempt, StudentState, Unit
-from ..repository import (
-    load_questions,
-    load_quizzes,
-    get_attempts_for_all_students,
-)
-from .difficulty import estimate_question_difficulty
+from ..repository import content_version, load_questions, load_quizzes
+from .difficulty import current_difficulty_version, question_difficulty
 
 
 @dataclass
@@ -22,14 +19,29 @@ class CandidateQuiz:
     avg_difficulty: float
 
 
-def _build_skill_index(units: Iterable[Unit]) -> Dict[str, List[CandidateQuiz]]:
+@dataclass(frozen=True)
+class _QuizSlot:
+    """
+    Content-only part of a candidate: everything except its difficulty.
+    """
+
+    unit_id: str
+    section_id: Optional[str]
+    quiz_id: str
+    activity: str
+    question_ids: Tuple[str, ...]
+
+
+# skill -> quiz slots, rebuilt only when units, quizzes or questions change.
+_skill_index_cache: Dict[str, Any] = {"key": None, "value": {}}
+# quiz -> average difficulty, dropped whenever difficulty statistics change.
+_quiz_difficulty_cache: Dict[str, Any] = {"key": None, "value": {}}
+
+
+def _build_skill_slots(units: Iterable[Unit]) -> Dict[str, List[_QuizSlot]]:
     questions = load_questions()
     quizzes = load_quizzes()
-    difficulty_lookup = estimate_question_difficulty(
-        get_attempts_for_all_students(), questions
-    )
-
-    skill_to_candidates: Dict[str, List[CandidateQuiz]] = {}
+    skill_to_slots: Dict[str, List[_QuizSlot]] = {}
 
     def register_candidate(
         unit: Unit,
@@ -42,32 +54,15 @@ def _build_skill_index(units: Iterable[Unit]) -> Dict[str, List[CandidateQuiz]]:
         quiz = quizzes.get(quiz_id)
         if not quiz:
             return
-        question_ids = quiz.question_ids or []
+        question_ids = tuple(quiz.question_ids or [])
         skills_for_quiz = set()
-        total_difficulty = 0.0
-        diff_count = 0
         for qid in question_ids:
             question = questions.get(qid)
             if question:
                 skills_for_quiz.update(question.skill_ids or [question.unit_id])
-            diff_entry = difficulty_lookup.get(qid)
-            if diff_entry:
-                total_difficulty += diff_entry["difficulty"]
-                diff_count += 1
-        avg_difficulty = (
-            total_difficulty / diff_count if diff_count else 0.5
-        )
+        slot = _QuizSlot(unit.id, section_id, quiz_id, activity, question_ids)
         for skill_id in skills_for_quiz:
-            skill_to_candidates.setdefault(skill_id, []).append(
-                CandidateQuiz(
-                    unit_id=unit.id,
-                    section_id=section_id,
-                    quiz_id=quiz_id,
-                    activity=activity,
-                    skill_id=skill_id,
-                    avg_difficulty=avg_difficulty,
-                )
-            )
+            skill_to_slots.setdefault(skill_id, []).append(slot)
 
     for unit in units:
         diagnostic_quiz = unit.diagnostic_quiz_id
@@ -84,7 +79,58 @@ def _build_skill_index(units: Iterable[Unit]) -> Dict[str, List[CandidateQuiz]]:
             if section.get("miniQuizId"):
                 register_candidate(unit, section["miniQuizId"], section_id, "mini_quiz")
 
-    return skill_to_candidates
+    return skill_to_slots
+
+
+def _skill_slots(units: List[Unit]) -> Dict[str, List[_QuizSlot]]:
+    key = (content_version(), tuple(unit.id for unit in units))
+    if _skill_index_cache["key"] != key:
+        _skill_index_cache["value"] = _build_skill_slots(units)
+        _skill_index_cache["key"] = key
+    return _skill_index_cache["value"]
+
+
+def _quiz_avg_difficulty(slot: _QuizSlot) -> float:
+    version = current_difficulty_version()
+    if _quiz_difficulty_cache["key"] != version:
+        _quiz_difficulty_cache["value"] = {}
+        _quiz_difficulty_cache["key"] = version
+    averages: Dict[str, float] = _quiz_difficulty_cache["value"]
+    if slot.quiz_id not in averages:
+        # Only this quiz's questions: rebuilding the whole bank's payload
+        # here would cost a full recompute after every new attempt.
+        difficulty_lookup = question_difficulty(slot.question_ids)
+        total_difficulty = 0.0
+        diff_count = 0
+        for qid in slot.question_ids:
+            diff_entry = difficulty_lookup.get(qid)
+            if diff_entry:
+                total_difficulty += diff_entry["difficulty"]
+                diff_count += 1
+        averages[slot.quiz_id] = total_difficulty / diff_count if diff_count else 0.5
+    return averages[slot.quiz_id]
+
+
+def _candidates_for_skill(units: List[Unit], skill_id: str) -> List[CandidateQuiz]:
+    return [
+        CandidateQuiz(
+            unit_id=slot.unit_id,
+            section_id=slot.section_id,
+            quiz_id=slot.quiz_id,
+            activity=slot.activity,
+            skill_id=skill_id,
+            avg_difficulty=_quiz_avg_difficulty(slot),
+        )
+        for slot in _skill_slots(units).get(skill_id, [])
+    ]
+
+
+def _build_skill_index(units: Iterable[Unit]) -> Dict[str, List[CandidateQuiz]]:
+    units = list(units)
+    return {
+        skill_id: _candidates_for_skill(units, skill_id)
+        for skill_id in _skill_slots(units)
+    }
 
 
 def _target_difficulty(p_mastery: float) -> float:
@@ -95,6 +141,7 @@ def _target_difficulty(p_mastery: float) -> float:
     return 0.7
 
 
+@metrics.instrumented("ml.recommend_next_activity")
 def recommend_next_activity(
     student_state: StudentState,
     attempts: Iterable[Attempt],
@@ -154,8 +201,7 @@ def recommend_next_activity(
     skill_candidates.sort(key=lambda entry: entry[0])
     focus_mastery, focus_skill_id, focus_meta = skill_candidates[0]
 
-    candidates_by_skill = _build_skill_index(units)
-    candidate_quizzes = candidates_by_skill.get(focus_skill_id)
+    candidate_quizzes = _candidates_for_skill(units, focus_skill_id)
     if not candidate_quizzes:
         return None
 
@@ -0,0 +1,122 @@
+"""
+Bulk knowledge-tracing replay.
+
+After tuning the constants in ``knowledge_tracing`` every student's skill
+state has to be recomputed from their full history. ``replay_skill_states``
+does that for the whole roster in one pass: it streams the attempt store
+once, groups attempts by student, replays each history on a process pool
+and writes every student back with a single save.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models import Attempt
+from ..repository import (
+    get_all_students,
+    iter_attempts,
+    load_questions,
+    save_students,
+    student_buffer,
+)
+from .knowledge_tracing import mastery_by_skill_from_state, update_student_skill_state
+
+Shard = List[Tuple[str, List[Attempt]]]
+
+
+@dataclass
+class ReplayReport:
+    students: int
+    attempts: int
+    answers: int
+    skipped_attempts: int
+    workers: int
+    seconds: float
+    written: bool
+
+    @property
+    def attempts_per_sec(self) -> float:
+        return round(self.attempts / self.seconds, 1) if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["attempts_per_sec"] = self.attempts_per_sec
+        return data
+
+
+def _replay_shard(shard: Shard) -> List[Tuple[str, Dict[str, Dict[str, float]]]]:
+    questions = load_questions()
+    return [
+        (student_id, update_student_skill_state(student_id, attempts, None, questions))
+        for student_id, attempts in shard
+    ]
+
+
+def _shard(histories: Dict[str, List[Attempt]], count: int) -> List[Shard]:
+    # Deal the longest histories out first so shards end up similar in size.
+    ordered = sorted(histories.items(), key=lambda item: len(item[1]), reverse=True)
+    shards: List[Shard] = [[] for _ in range(min(count, len(ordered)))]
+    for i, item in enumerate(ordered):
+        shards[i % len(shards)].append(item)
+    return shards
+
+
+def replay_skill_states(workers: Optional[int] = None, write: bool = True) -> ReplayReport:
+    """
+    Recompute ``skill_mastery`` and ``mastery_by_skill`` for every student
+    from scratch.
+
+    Students without any stored attempts keep their current state, and
+    attempts for ids missing from the roster are counted as skipped. With
+    ``workers`` of 1 the replay runs in-process. Run it while the API is
+    idle: saves made during the replay are overwritten.
+    """
+
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    roster = {student.student_id: student for student in get_all_students()}
+
+    histories: Dict[str, List[Attempt]] = {}
+    attempts = answers = skipped = 0
+    for attempt in iter_attempts():
+        if attempt.student_id not in roster:
+            skipped += 1
+            continue
+        histories.setdefault(attempt.student_id, []).append(attempt)
+        attempts += 1
+        answers += len(attempt.results)
+
+    states: Dict[str, Dict[str, Dict[str, float]]] = {}
+    if workers <= 1 or len(histories) < 2:
+        workers = 1
+        states.update(_replay_shard(list(histories.items())))
+    else:
+        shards = _shard(histories, workers * 4)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for replayed in pool.map(_replay_shard, shards):
+                states.update(replayed)
+
+    updated = []
+    for student_id, skill_state in states.items():
+        student = roster[student_id]
+        student.skill_mastery = skill_state
+        student.mastery_by_skill = mastery_by_skill_from_state(skill_state)
+        updated.append(student)
+    if write and updated:
+        save_students(updated)
+        student_buffer.flush()
+
+    return ReplayReport(
+        students=len(updated),
+        attempts=attempts,
+        answers=answers,
+        skipped_attempts=skipped,
+        workers=workers,
+        seconds=round(time.perf_counter() - start, 3),
+        written=write and bool(updated),
+    )
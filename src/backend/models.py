@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional, Literal
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Literal, Sequence
+import sys
 import time
 
 
@@ -11,7 +13,7 @@ QuizType = Literal["diagnostic", "practice", "mini_quiz", "unit_test"]
 ActivityType = QuizType
 
 
-@dataclass
+@dataclass(frozen=True)
 class Question:
     id: str
     unit_id: str
@@ -28,7 +30,7 @@ class Question:
         return asdict(self)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Quiz:
     id: str
     title: str
@@ -88,7 +90,7 @@ class StudentState:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AttemptQuestionResult:
     question_id: str
     correct: bool
@@ -97,10 +99,89 @@ class AttemptQuestionResult:
     used_hint: bool = False
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            "question_id": self.question_id,
+            "correct": self.correct,
+            "chosen_answer": self.chosen_answer,
+            "time_sec": self.time_sec,
+            "used_hint": self.used_hint,
+        }
 
 
-@dataclass
+_CORRECT = 1
+_USED_HINT = 2
+
+
+def _intern(value: Any) -> Any:
+    # Ids and answers repeat across thousands of attempts; share one string
+    # per value. Non-string answers (numbers, booleans, null) are kept as-is.
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class PackedResults(Sequence[AttemptQuestionResult]):
+    """
+    Read-only struct-of-arrays storage for an attempt's results.
+
+    Question ids and chosen answers are interned strings shared across
+    attempts, times live in an ``array('d')`` and the two booleans share one
+    byte, so a stored answer costs a few dozen bytes instead of a full
+    dataclass instance. Indexing and iteration hand out
+    ``AttemptQuestionResult`` objects built on demand.
+    """
+
+    __slots__ = ("_question_ids", "_answers", "_time_sec", "_flags")
+
+    def __init__(self, results: Iterable[AttemptQuestionResult] = ()) -> None:
+        question_ids: List[Any] = []
+        answers: List[Any] = []
+        self._time_sec = array("d")
+        self._flags = array("B")
+        for r in results:
+            question_ids.append(_intern(r.question_id))
+            answers.append(_intern(r.chosen_answer))
+            self._time_sec.append(r.time_sec)
+            self._flags.append(
+                (_CORRECT if r.correct else 0) | (_USED_HINT if r.used_hint else 0)
+            )
+        self._question_ids = tuple(question_ids)
+        self._answers = tuple(answers)
+
+    def __len__(self) -> int:
+        return len(self._question_ids)
+
+    def _result(self, i: int) -> AttemptQuestionResult:
+        flags = self._flags[i]
+        return AttemptQuestionResult(
+            question_id=self._question_ids[i],
+            correct=bool(flags & _CORRECT),
+            chosen_answer=self._answers[i],
+            time_sec=self._time_sec[i],
+            used_hint=bool(flags & _USED_HINT),
+        )
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._result(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("result index out of range")
+        return self._result(index)
+
+    def __iter__(self) -> Iterator[AttemptQuestionResult]:
+        for i in range(len(self._question_ids)):
+            yield self._result(i)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"PackedResults({list(self)!r})"
+
+
+@dataclass(slots=True)
 class Attempt:
     id: str
     student_id: str
@@ -110,21 +191,29 @@ class Attempt:
     section_id: Optional[str]
     score_pct: float
     created_at: float = field(default_factory=time.time)
-    results: List[AttemptQuestionResult] = field(default_factory=list)
+    results: Sequence[AttemptQuestionResult] = field(default_factory=list)
 
     def to_dict(self) -> Dict:
-        data = asdict(self)
         results_list: List[Dict] = []
         for r in self.results:
             if hasattr(r, "to_dict"):
                 results_list.append(r.to_dict())  # AttemptQuestionResult
             else:
                 results_list.append(r)
-        data["results"] = results_list
-        return data
+        return {
+            "id": self.id,
+            "student_id": self.student_id,
+            "quiz_id": self.quiz_id,
+            "quiz_type": self.quiz_type,
+            "unit_id": self.unit_id,
+            "section_id": self.section_id,
+            "score_pct": self.score_pct,
+            "created_at": self.created_at,
+            "results": results_list,
+        }
 
 
-@dataclass
+@dataclass(frozen=True)
 class Unit:
     id: str
     title: str
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CachedPayload:
+    body: bytes
+    etag: str
+
+
+class PayloadCache:
+    """
+    Bounded LRU of serialized response bodies.
+
+    Each entry remembers the content version it was built from; a lookup
+    with a different version rebuilds the entry in place, so stale payloads
+    are never served and old versions do not pile up.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Any, CachedPayload]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        key: Hashable,
+        version: Any,
+        build: Callable[[], Optional[bytes]],
+    ) -> Optional[CachedPayload]:
+        """
+        Return the payload for ``key`` at ``version``, calling ``build`` for
+        the serialized body on a miss. When ``build`` returns None nothing is
+        cached and None is returned.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        body = build()
+        if body is None:
+            return None
+        payload = CachedPayload(body, hashlib.blake2b(body, digest_size=16).hexdigest())
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (version, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+        }
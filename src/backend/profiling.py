@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .locking import atomic_write
+
+PROFILE_ID = re.compile(r"^[0-9]+-[0-9a-f]{8}$")
+
+
+class RequestProfiler:
+    """
+    Capture ``cProfile`` profiles of individual requests and keep the most
+    recent ``keep`` of them in ``directory``.
+
+    Only one request is profiled at a time: the interpreter allows a single
+    active profiler, so a request that arrives while another is being
+    profiled simply runs unprofiled.
+    """
+
+    def __init__(self, directory: Path, keep: int = 50) -> None:
+        self.directory = directory
+        self.keep = keep
+        self._busy = threading.Lock()
+
+    def start(self) -> Optional[cProfile.Profile]:
+        if not self._busy.acquire(blocking=False):
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler (e.g. a debugger) already owns the hook.
+            self._busy.release()
+            return None
+        return profile
+
+    def stop(self, profile: cProfile.Profile) -> None:
+        profile.disable()
+        self._busy.release()
+
+    def save(self, profile: cProfile.Profile, meta: Dict[str, Any]) -> str:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profile_id = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+        stats_path = self.directory / f"{profile_id}.prof"
+        tmp_path = stats_path.with_name(f".{stats_path.name}.tmp")
+        profile.dump_stats(tmp_path)
+        os.replace(tmp_path, stats_path)
+        atomic_write(
+            self.directory / f"{profile_id}.json",
+            json.dumps({"id": profile_id, "captured_at": time.time(), **meta}),
+        )
+        self._prune()
+        return profile_id
+
+    def _prune(self) -> None:
+        metas = sorted(self.directory.glob("*.json"), key=lambda path: path.name)
+        for meta_path in metas[: max(0, len(metas) - self.keep)]:
+            for path in (meta_path, meta_path.with_suffix(".prof")):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def list(self) -> List[Dict[str, Any]]:
+        profiles = []
+        for meta_path in sorted(self.directory.glob("*.json"), reverse=True):
+            try:
+                profiles.append(json.loads(meta_path.read_text()))
+            except (OSError, ValueError):
+                continue
+        return profiles
+
+    def path(self, profile_id: str) -> Optional[Path]:
+        if not PROFILE_ID.match(profile_id):
+            return None
+        path = self.directory / f"{profile_id}.prof"
+        return path if path.exists() else None
+
+    def report(self, profile_id: str, limit: int = 40, sort: str = "cumulative") -> Optional[str]:
+        """
+        Render a stored profile as ``pstats`` text, sorted by ``sort``.
+        """
+
+        path = self.path(profile_id)
+        if path is None:
+            return None
+        out = io.StringIO()
+        stats = pstats.Stats(str(path), stream=out)
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
@@ -1,10 +1,91 @@
 from __future__ import annotations
 
+import heapq
 import random
-from typing import Optional
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .models import Question, StudentState
-from .repository import load_questions
+from .repository import content_version, load_questions
+
+TOP_N = 10
+
+PartitionKey = Tuple[Optional[str], Optional[str]]
+
+
+@dataclass(frozen=True)
+class _QuestionGroup:
+    """
+    Questions in one partition that always score the same: they share
+    their skills and difficulty. ``positions`` index into the question bank
+    in its original order, ascending.
+    """
+
+    skill_ids: Tuple[str, ...]
+    difficulty: Optional[str]
+    positions: Tuple[int, ...]
+
+
+@dataclass
+class _CandidateIndex:
+    questions: List[Question]
+    # (unit_id, section_id) -> groups; either part is None when unfiltered.
+    partitions: Dict[PartitionKey, List[_QuestionGroup]]
+
+
+# Rebuilt only when units, quizzes or questions change.
+_index_cache: Dict[str, Any] = {"key": None, "value": None}
+
+
+def _build_index() -> _CandidateIndex:
+    questions = list(load_questions().values())
+    members: Dict[PartitionKey, Dict[Tuple[Tuple[str, ...], Optional[str]], List[int]]] = {}
+    for position, q in enumerate(questions):
+        signature = (tuple(q.skill_ids or ()), q.difficulty)
+        # A set: for sectionless questions the section keys repeat the
+        # unfiltered ones, and a question must join each partition once.
+        for key in {
+            (None, None),
+            (q.unit_id, None),
+            (None, q.section_id),
+            (q.unit_id, q.section_id),
+        }:
+            members.setdefault(key, {}).setdefault(signature, []).append(position)
+    partitions = {
+        key: [
+            _QuestionGroup(skill_ids, difficulty, tuple(positions))
+            for (skill_ids, difficulty), positions in groups.items()
+        ]
+        for key, groups in members.items()
+    }
+    return _CandidateIndex(questions, partitions)
+
+
+def _candidate_index() -> _CandidateIndex:
+    version = content_version()
+    if _index_cache["key"] != version:
+        _index_cache["value"] = _build_index()
+        _index_cache["key"] = version
+    return _index_cache["value"]
+
+
+def _lowest_positions(
+    scored_groups: List[Tuple[float, _QuestionGroup]], limit: int
+) -> Iterator[int]:
+    """
+    Yield up to ``limit`` question positions in the order a stable sort by
+    score would produce: ascending score, ties broken by original position.
+    """
+
+    scored_groups.sort(key=lambda entry: entry[0])
+    remaining = limit
+    for _, tied in groupby(scored_groups, key=lambda entry: entry[0]):
+        for position in heapq.merge(*(group.positions for _, group in tied)):
+            yield position
+            remaining -= 1
+            if not remaining:
+                return
 
 
 def pick_next_question(
@@ -17,33 +98,32 @@ def pick_next_question(
     - filter by unit and section if provided
     - prefer questions whose skills have lower mastery
     - within that, respect preferred difficulty if possible
-    """
-    all_questions = list(load_questions().values())
-    if unit_id:
-        all_questions = [q for q in all_questions if q.unit_id == unit_id]
-    if section_id:
-        all_questions = [q for q in all_questions if q.section_id == section_id]
 
-    if not all_questions:
+    Questions are scored per group of identical skills and difficulty, so
+    the cost follows the number of groups in the partition rather than the
+    size of the question bank.
+    """
+    index = _candidate_index()
+    groups = index.partitions.get((unit_id or None, section_id or None))
+    if not groups:
         return None
 
-    def mastery_score(q: Question) -> float:
-        if not q.skill_ids:
+    def mastery_score(skill_ids: Tuple[str, ...]) -> float:
+        if not skill_ids:
             return 50.0
         vals = []
-        for s_id in q.skill_ids:
+        for s_id in skill_ids:
             mastery = student.mastery_by_skill.get(s_id)
             vals.append(mastery.pct if mastery else 0.0)
         return sum(vals) / len(vals)
 
     preferred = student.preferred_difficulty
     scored = []
-    for q in all_questions:
-        base = mastery_score(q)
-        if q.difficulty == preferred:
+    for group in groups:
+        base = mastery_score(group.skill_ids)
+        if group.difficulty == preferred:
             base -= 10.0
-        scored.append((base, q))
+        scored.append((base, group))
 
-    scored.sort(key=lambda t: t[0])
-    top_n = [q for _, q in scored[: min(10, len(scored))]]
+    top_n = [index.questions[position] for position in _lowest_positions(scored, TOP_N)]
     return random.choice(top_n)
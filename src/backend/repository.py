@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import base64
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
 import time
+from contextlib import contextmanager
 from datetime import datetime
 
+from .attempt_log import AttemptLog
+from .catalog import CatalogCache
+from . import metrics
+from .locking import atomic_write, locked
+from . import request_memo
+from .request_memo import request_memoized
+from .sqlite_store import SQLiteStore
+from .views import AttemptView
+from .write_behind import WriteBehindBuffer
 from .models import (
     Question,
     Quiz,
@@ -14,31 +27,51 @@ from .models import (
     SkillMastery,
     Attempt,
     AttemptQuestionResult,
+    PackedResults,
     NextActivity,
     TeacherStudentSummary,
     TeacherUnitSummary,
     User,
+    _intern,
 )
 
 
 BASE_DIR = Path(__file__).resolve().parent
-DATA_DIR = BASE_DIR / "data"
+DATA_DIR = Path(os.environ.get("BITBYBIT_DATA_DIR") or BASE_DIR / "data")
 DATA_DIR.mkdir(exist_ok=True)
 
 
 def _load_json(path: Path, default):
     if not path.exists():
-        path.write_text(json.dumps(default, indent=2))
+        with locked(path):
+            if not path.exists():
+                atomic_write(path, json.dumps(default, indent=2))
         return default
+    start = time.perf_counter()
+    raw = b""
     try:
-        with path.open() as f:
-            return json.load(f)
+        with path.open("rb") as f:
+            raw = f.read()
+        return json.loads(raw)
     except json.JSONDecodeError:
         return default
+    finally:
+        if metrics.ENABLED:
+            metrics.record("load_json", time.perf_counter() - start, bytes_read=len(raw))
 
 
 def _save_json(path: Path, data) -> None:
-    path.write_text(json.dumps(data, indent=2))
+    """
+    Atomically replace a JSON file. Callers doing read-modify-write must hold
+    ``locked(path)`` around both the read and this call.
+    """
+
+    start = time.perf_counter()
+    payload = json.dumps(data, indent=2).encode("utf-8")
+    with locked(path):
+        atomic_write(path, payload)
+    if metrics.ENABLED:
+        metrics.record("save_json", time.perf_counter() - start, bytes_written=len(payload))
 
 
 UNITS_PATH = DATA_DIR / "units.json"
@@ -46,9 +79,38 @@ QUESTIONS_PATH = DATA_DIR / "questions.json"
 QUIZZES_PATH = DATA_DIR / "quizzes.json"
 STUDENTS_PATH = DATA_DIR / "students.json"
 USERS_PATH = DATA_DIR / "users.json"
-ATTEMPTS_PATH = DATA_DIR / "attempts.json"
+ATTEMPTS_PATH = DATA_DIR / "attempts.json"  # legacy layout, migrated on first use
+ATTEMPTS_LOG_PATH = DATA_DIR / "attempts.jsonl"
 MASTERY_QUIZ_TYPES = {"mini_quiz", "unit_test"}
 
+# Students, users and attempts live in the JSON files above unless the SQLite
+# engine is selected; units, quizzes and questions always stay in JSON.
+STORAGE_ENGINE = (os.environ.get("BITBYBIT_STORAGE") or "json").strip().lower()
+SQLITE_PATH = Path(os.environ.get("BITBYBIT_SQLITE_PATH") or DATA_DIR / "bitbybit.sqlite3")
+if STORAGE_ENGINE not in {"json", "sqlite"}:
+    raise ValueError(f"Unknown BITBYBIT_STORAGE engine: {STORAGE_ENGINE!r}")
+
+# Units, quizzes and questions are authored content that rarely changes, so
+# they are parsed once and reused until the underlying file changes.
+catalog = CatalogCache()
+
+attempt_log = AttemptLog(ATTEMPTS_LOG_PATH, legacy_path=ATTEMPTS_PATH)
+sqlite_store: Optional[SQLiteStore] = (
+    SQLiteStore(SQLITE_PATH) if STORAGE_ENGINE == "sqlite" else None
+)
+attempt_store = sqlite_store or attempt_log
+
+# Student saves write through by default. A positive interval buffers them in
+# memory and group-commits them in the background; the buffer is per process,
+# so only enable it when a single backend process owns the data directory.
+STUDENT_FLUSH_INTERVAL = float(os.environ.get("BITBYBIT_STUDENT_FLUSH_INTERVAL") or 0.0)
+STUDENT_FLUSH_MAX_DIRTY = int(os.environ.get("BITBYBIT_STUDENT_FLUSH_MAX_DIRTY") or 100)
+student_buffer = WriteBehindBuffer(
+    lambda rows: _write_student_rows(rows),
+    interval=STUDENT_FLUSH_INTERVAL,
+    max_dirty=STUDENT_FLUSH_MAX_DIRTY,
+)
+
 
 def _coerce_skill_mastery(skill_id: str, raw_value: Any) -> SkillMastery:
     """
@@ -71,23 +133,58 @@ def _coerce_skill_mastery(skill_id: str, raw_value: Any) -> SkillMastery:
     )
 
 
+def _build_units(raw: List[Dict[str, Any]]) -> Tuple[Tuple[Unit, ...], Mapping[str, Unit]]:
+    units = tuple(Unit(**u) for u in raw)
+    by_id: Dict[str, Unit] = {}
+    for unit in units:
+        by_id.setdefault(unit.id, unit)
+    return units, MappingProxyType(by_id)
+
+
+def _build_questions(raw: List[Dict[str, Any]]) -> Mapping[str, Question]:
+    return MappingProxyType({q["id"]: Question(**q) for q in raw})
+
+
+def _build_quizzes(raw: List[Dict[str, Any]]) -> Mapping[str, Quiz]:
+    return MappingProxyType({q["id"]: Quiz(**q) for q in raw})
+
+
+def _load_catalog_file(path: Path):
+    return _load_json(path, [])
+
+
+@request_memoized
+def _units_index() -> Tuple[Tuple[Unit, ...], Mapping[str, Unit]]:
+    return catalog.get(UNITS_PATH, _load_catalog_file, _build_units)
+
+
+@request_memoized
+def content_version() -> Tuple:
+    """
+    Token that changes whenever units, quizzes or questions change on disk.
+    """
+
+    return catalog.version(UNITS_PATH, QUIZZES_PATH, QUESTIONS_PATH)
+
+
 def load_units() -> List[Unit]:
-    raw = _load_json(UNITS_PATH, [])
-    return [Unit(**u) for u in raw]
+    units, _ = _units_index()
+    return list(units)
 
 
 def load_unit(unit_id: str) -> Optional[Unit]:
-    return next((u for u in load_units() if u.id == unit_id), None)
+    _, by_id = _units_index()
+    return by_id.get(unit_id)
 
 
-def load_questions() -> Dict[str, Question]:
-    raw = _load_json(QUESTIONS_PATH, [])
-    return {q["id"]: Question(**q) for q in raw}
+@request_memoized
+def load_questions() -> Mapping[str, Question]:
+    return catalog.get(QUESTIONS_PATH, _load_catalog_file, _build_questions)
 
 
-def load_quizzes() -> Dict[str, Quiz]:
-    raw = _load_json(QUIZZES_PATH, [])
-    return {q["id"]: Quiz(**q) for q in raw}
+@request_memoized
+def load_quizzes() -> Mapping[str, Quiz]:
+    return catalog.get(QUIZZES_PATH, _load_catalog_file, _build_quizzes)
 
 
 def load_quiz(quiz_id: str) -> Optional[Quiz]:
@@ -124,28 +221,46 @@ def _deserialize_student_state(data: Dict[str, Any]) -> StudentState:
     )
 
 
+@request_memoized
+def _student_rows() -> Dict[str, Dict[str, Any]]:
+    return _load_json(STUDENTS_PATH, {})
+
+
+@request_memoized
+def _stored_student_row(student_id: str) -> Optional[Dict[str, Any]]:
+    if sqlite_store:
+        return sqlite_store.load_student(student_id)
+    return _student_rows().get(student_id)
+
+
 def load_student(student_id: str) -> Optional[StudentState]:
-    raw = _load_json(STUDENTS_PATH, {})
-    data = raw.get(student_id)
+    data = student_buffer.get(student_id)
+    if data is None:
+        data = _stored_student_row(student_id)
     if not data:
         return None
     return _deserialize_student_state(data)
 
 
+@metrics.instrumented("get_all_students")
 def get_all_students() -> List[StudentState]:
     """
     Return every student stored in students.json.
     """
 
-    raw = _load_json(STUDENTS_PATH, {})
-    students = [_deserialize_student_state(data) for data in raw.values()]
+    if sqlite_store:
+        rows = {data["student_id"]: data for data in sqlite_store.all_students()}
+    else:
+        rows = dict(_student_rows())
+    rows.update(student_buffer.pending())
+    students = [_deserialize_student_state(data) for data in rows.values()]
     students.sort(key=lambda s: s.name.lower())
     return students
 
 
-def _next_student_id(raw: Dict[str, Any]) -> str:
+def _next_student_id(existing_ids: List[str]) -> str:
     max_index = 1
-    for key in raw.keys():
+    for key in existing_ids:
         if key.startswith("student-"):
             try:
                 idx = int(key.split("-", 1)[1])
@@ -160,8 +275,19 @@ def create_student(name: str, email: Optional[str] = None) -> StudentState:
     Create a new demo student entry with default data.
     """
 
-    raw = _load_json(STUDENTS_PATH, {})
-    student_id = _next_student_id(raw) if raw else "student-2"
+    # Allocating an id needs every existing student on disk.
+    student_buffer.flush()
+    if sqlite_store:
+        return _create_student(name, email, sqlite_store.student_ids(), {})
+    with locked(STUDENTS_PATH):
+        raw = _load_json(STUDENTS_PATH, {})
+        return _create_student(name, email, list(raw.keys()), raw)
+
+
+def _create_student(
+    name: str, email: Optional[str], existing_ids: List[str], raw: Dict[str, Any]
+) -> StudentState:
+    student_id = _next_student_id(existing_ids) if existing_ids else "student-2"
     normalized_name = name.strip() or f"Student {student_id}"
     fallback_email = email or f"{student_id}@example.edu"
     state = StudentState(
@@ -175,70 +301,183 @@ def create_student(name: str, email: Optional[str] = None) -> StudentState:
         avatar_url=None,
         avatar_name=None,
     )
-    raw[student_id] = state.to_dict()
-    _save_json(STUDENTS_PATH, raw)
+    if sqlite_store:
+        sqlite_store.save_student(state.to_dict())
+    else:
+        raw[student_id] = state.to_dict()
+        _save_json(STUDENTS_PATH, raw)
+    request_memo.invalidate()
     return state
 
 
+@contextmanager
+def student_transaction() -> Iterator[None]:
+    """
+    Hold the students writer lock across a read-modify-write of student
+    records, so concurrent writers in other processes cannot interleave and
+    lose updates. Loads inside the block bypass the request memo.
+    """
+
+    with locked(STUDENTS_PATH):
+        request_memo.invalidate()
+        yield
+
+
 def save_student(state: StudentState) -> None:
-    raw = _load_json(STUDENTS_PATH, {})
-    raw[state.student_id] = state.to_dict()
-    _save_json(STUDENTS_PATH, raw)
+    save_students([state])
 
 
-def load_attempts(student_id: Optional[str] = None) -> List[Attempt]:
-    raw = _load_json(ATTEMPTS_PATH, [])
-
-    # normalize to a list of attempt dicts
-    if isinstance(raw, dict):
-        if student_id:
-            items = raw.get(student_id, [])
-        else:
-            items = [a for attempts in raw.values() for a in attempts]
+def save_students(states: List[StudentState]) -> None:
+    """
+    Persist several students with a single write, or queue them in the
+    write-behind buffer when it is enabled.
+    """
+
+    if student_buffer.enabled:
+        for state in states:
+            student_buffer.put(state.student_id, state.to_dict())
     else:
-        items = raw
+        _write_student_rows([state.to_dict() for state in states])
+    request_memo.invalidate()
+
+
+def _write_student_rows(rows: List[Dict[str, Any]]) -> None:
+    if sqlite_store:
+        sqlite_store.save_students(rows)
+        return
+    with locked(STUDENTS_PATH):
+        raw = _load_json(STUDENTS_PATH, {})
+        for data in rows:
+            raw[data["student_id"]] = data
+        _save_json(STUDENTS_PATH, raw)
+
+
+def _deserialize_attempt(item: Dict[str, Any], student_id: Optional[str] = None) -> Attempt:
+    results = PackedResults(
+        r
+        if isinstance(r, AttemptQuestionResult)
+        else AttemptQuestionResult(
+            question_id=r.get("question_id", ""),
+            correct=bool(r.get("correct", False)),
+            chosen_answer=r.get("chosen_answer", ""),
+            time_sec=float(r.get("time_sec", 0)),
+            used_hint=bool(r.get("used_hint", False)),
+        )
+        for r in item.get("results", [])
+    )
 
-    attempts: List[Attempt] = []
-    for item in items:
-        if student_id and item.get("student_id") != student_id:
-            continue
+    section_id = item.get("section_id")
+    return Attempt(
+        id=item.get("id", ""),
+        student_id=_intern(item.get("student_id") or (student_id or "")),
+        quiz_id=_intern(item.get("quiz_id", "")),
+        quiz_type=_intern(item.get("quiz_type", "")),
+        unit_id=_intern(item.get("unit_id", "")),
+        section_id=_intern(section_id) if section_id else section_id,
+        score_pct=float(item.get("score_pct", 0)),
+        created_at=float(item.get("created_at", time.time())),
+        results=results,
+    )
 
-        results: List[AttemptQuestionResult] = []
-        for r in item.get("results", []):
-            if isinstance(r, AttemptQuestionResult):
-                results.append(r)
-            else:
-                results.append(
-                    AttemptQuestionResult(
-                        question_id=r.get("question_id", ""),
-                        correct=bool(r.get("correct", False)),
-                        chosen_answer=r.get("chosen_answer", ""),
-                        time_sec=float(r.get("time_sec", 0)),
-                        used_hint=bool(r.get("used_hint", False)),
-                    )
-                )
 
-        attempts.append(
-            Attempt(
-                id=item.get("id", ""),
-                student_id=item.get("student_id") or (student_id or ""),
-                quiz_id=item.get("quiz_id", ""),
-                quiz_type=item.get("quiz_type", ""),
-                unit_id=item.get("unit_id", ""),
-                section_id=item.get("section_id"),
-                score_pct=float(item.get("score_pct", 0)),
-                created_at=float(item.get("created_at", time.time())),
-                results=results,
-            )
-        )
+def iter_attempts(
+    student_id: Optional[str] = None,
+    unit_id: Optional[str] = None,
+    quiz_type: Optional[str] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+) -> Iterator[Attempt]:
+    """
+    Lazily yield stored attempts in insertion order.
+
+    Filters are pushed down to the storage engine, and ``since``/``until``
+    select ``created_at`` in ``[since, until)``. Only one attempt is held in
+    memory at a time, so single-pass consumers should prefer this over
+    ``load_attempts``.
+    """
+
+    for item in attempt_store.iter_records(
+        student_id=student_id or None,
+        unit_id=unit_id or None,
+        quiz_type=quiz_type or None,
+        since=since,
+        until=until,
+    ):
+        yield _deserialize_attempt(item, student_id)
+
 
-    return attempts
+def _encode_page_cursor(key: Tuple[float, int]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode().rstrip("=")
+
+
+def _decode_page_cursor(cursor: str) -> Tuple[float, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, position = json.loads(raw)
+        return float(created_at), int(position)
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid cursor: {cursor!r}") from None
+
+
+def page_attempts(
+    student_id: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    summary: bool = False,
+    newest_first: bool = False,
+) -> Tuple[List[Attempt], Optional[str]]:
+    """
+    Return one page of attempts ordered by ``created_at`` and the cursor for
+    the next page (None on the last page).
+
+    Ordering, ``since``/``until`` and the cursor are applied by the storage
+    engine, so only the page's own attempts are read. ``summary`` leaves
+    out per-question results. Raises ValueError for a malformed cursor.
+    """
+
+    after = _decode_page_cursor(cursor) if cursor else None
+    rows = attempt_store.page_records(
+        student_id=student_id or None,
+        since=since,
+        until=until,
+        after=after,
+        limit=limit + 1,
+        descending=newest_first,
+    )
+    next_cursor = _encode_page_cursor(rows[limit - 1][0]) if len(rows) > limit else None
+    attempts = []
+    for _, item in rows[:limit]:
+        if summary:
+            item.pop("results", None)
+        attempts.append(_deserialize_attempt(item, student_id))
+    return attempts, next_cursor
+
+
+def load_attempts(student_id: Optional[str] = None) -> List[Attempt]:
+    # Copy so callers may reorder their list; the attempts themselves are shared.
+    return list(_load_attempts(student_id or None))
+
+
+@request_memoized
+@metrics.instrumented("load_attempts")
+def _load_attempts(student_id: Optional[str]) -> List[Attempt]:
+    return list(iter_attempts(student_id))
 
 
 def append_attempt(attempt: Attempt) -> None:
-    raw = _load_json(ATTEMPTS_PATH, [])
-    raw.append(attempt.to_dict())
-    _save_json(ATTEMPTS_PATH, raw)
+    append_attempts([attempt])
+
+
+@metrics.instrumented("append_attempts")
+def append_attempts(attempts: List[Attempt]) -> None:
+    """
+    Persist several attempts with a single write.
+    """
+
+    attempt_store.append_many([attempt.to_dict() for attempt in attempts])
+    request_memo.invalidate()
 
 
 def get_attempts_for_all_students() -> List[Attempt]:
@@ -246,7 +485,7 @@ def get_attempts_for_all_students() -> List[Attempt]:
     Load every attempt regardless of student id.
     """
 
-    return load_attempts(None)
+    return list(iter_attempts())
 
 
 def _average(scores: List[float]) -> float:
@@ -260,7 +499,7 @@ def _get_section_value(section: Dict[str, str], *keys: str) -> Optional[str]:
     return None
 
 
-def _mastery_scores_for_attempts(attempts: List[Attempt]) -> List[float]:
+def _mastery_scores_for_attempts(attempts: Iterable[Attempt]) -> List[float]:
     return [
         attempt.score_pct
         for attempt in attempts
@@ -273,114 +512,167 @@ def compute_student_mastery(student_id: str) -> float:
     Compute a student's mastery using mini quizzes and unit tests only.
     """
 
-    attempts = load_attempts(student_id)
-    mastery_scores = _mastery_scores_for_attempts(attempts)
+    mastery_scores = _mastery_scores_for_attempts(iter_attempts(student_id))
     return _average(mastery_scores)
 
 
-def compute_unit_mastery_for_student(student_id: str) -> Dict[str, float]:
+def compute_unit_mastery_for_student(
+    student_id: str, attempts: Optional[Iterable[Attempt]] = None
+) -> Dict[str, float]:
     """
-    Return unit-level mastery for a given student keyed by unit id.
+    Return unit-level mastery for a given student keyed by unit id. Pass the
+    student's ``attempts`` when the caller has already loaded them.
     """
 
-    attempts = load_attempts(student_id)
     mastery_by_unit: Dict[str, List[float]] = {}
-    for attempt in attempts:
+    for attempt in attempts if attempts is not None else iter_attempts(student_id):
         if attempt.unit_id and attempt.quiz_type in MASTERY_QUIZ_TYPES:
             mastery_by_unit.setdefault(attempt.unit_id, []).append(attempt.score_pct)
     return {unit_id: _average(scores) for unit_id, scores in mastery_by_unit.items()}
 
 
-def compute_teacher_student_summaries() -> List[TeacherStudentSummary]:
+class TeacherActivityView(AttemptView):
     """
-    Build teacher-facing metrics for every student in the system.
+    Per-student and per-unit activity totals behind the teacher dashboard.
+
+    Mastery is kept as score sums and counts so averages come out exactly as
+    if they were recomputed from the attempts.
     """
 
-    students = {student.student_id: student for student in get_all_students()}
-    attempts = get_attempts_for_all_students()
-    attempts_by_student: Dict[str, List[Attempt]] = {}
+    def empty_state(self) -> Dict[str, Dict[str, Any]]:
+        return {"students": {}, "units": {}}
+
+    def apply(self, record: Dict[str, Any]) -> None:
+        student_id = record.get("student_id") or ""
+        unit_id = record.get("unit_id", "")
+        quiz_type = record.get("quiz_type", "")
+        score_pct = float(record.get("score_pct", 0))
+        created_at = float(record.get("created_at", time.time()))
+        results = record.get("results", [])
+        used_hint = any(bool(r.get("used_hint", False)) for r in results)
+        is_mastery = quiz_type in MASTERY_QUIZ_TYPES
+
+        student = self.state["students"].setdefault(
+            student_id,
+            {
+                "attempt_count": 0,
+                "questions_answered": 0,
+                "hint_attempts": 0,
+                "last_created_at": None,
+                "mastery_sum": 0.0,
+                "mastery_count": 0,
+            },
+        )
+        student["attempt_count"] += 1
+        student["questions_answered"] += len(results)
+        student["hint_attempts"] += int(used_hint)
+        if student["last_created_at"] is None or created_at > student["last_created_at"]:
+            student["last_created_at"] = created_at
+        if is_mastery:
+            student["mastery_sum"] += score_pct
+            student["mastery_count"] += 1
+
+        if not unit_id:
+            return
+        unit = self.state["units"].setdefault(
+            unit_id,
+            {"attempt_count": 0, "hint_attempts": 0, "students": {}, "mastery": {}},
+        )
+        unit["attempt_count"] += 1
+        unit["hint_attempts"] += int(used_hint)
+        unit["students"][student_id] = unit["students"].get(student_id, 0) + 1
+        if is_mastery:
+            entry = unit["mastery"].setdefault(student_id, [0.0, 0])
+            entry[0] += score_pct
+            entry[1] += 1
 
-    for attempt in attempts:
-        attempts_by_student.setdefault(attempt.student_id, []).append(attempt)
-        if attempt.student_id not in students:
-            students[attempt.student_id] = StudentState(
-                student_id=attempt.student_id,
-                name=f"Student {attempt.student_id}",
-            )
 
-    summaries: List[TeacherStudentSummary] = []
-    for student_id, student in students.items():
-        student_attempts = attempts_by_student.get(student_id, [])
-        mastery_scores = _mastery_scores_for_attempts(student_attempts)
-        questions_answered = sum(len(a.results or []) for a in student_attempts)
-        attempt_count = len(student_attempts)
-        hint_attempts = sum(
-            1 for attempt in student_attempts if any(r.used_hint for r in attempt.results)
-        )
-        hint_rate = (hint_attempts / attempt_count) if attempt_count else None
-        last_activity = None
-        if student_attempts:
-            last_attempt = max(student_attempts, key=lambda a: a.created_at)
-            last_activity = (
-                datetime.utcfromtimestamp(last_attempt.created_at).isoformat() + "Z"
-            )
-        summaries.append(
-            TeacherStudentSummary(
-                student_id=student.student_id,
-                name=student.name,
-                overall_mastery=_average(mastery_scores),
-                questions_answered=questions_answered,
-                attempt_count=attempt_count,
-                last_activity_at=last_activity,
-                hint_usage_rate=hint_rate,
+teacher_activity = TeacherActivityView(
+    attempt_store, DATA_DIR / f"teacher_activity_{STORAGE_ENGINE}.snapshot.json"
+)
+
+
+def _rounded_mean(total: float, count: int) -> float:
+    # Matches _average over the individual scores.
+    return round(total / count) if count else 0.0
+
+
+@metrics.instrumented("teacher_student_summaries")
+def compute_teacher_student_summaries(
+    roster: Optional[List[StudentState]] = None,
+) -> List[TeacherStudentSummary]:
+    """
+    Build teacher-facing metrics for every student in the system.
+    """
+
+    if roster is None:
+        roster = get_all_students()
+    with teacher_activity.read() as state:
+        activity = state["students"]
+
+        names = {student.student_id: student.name for student in roster}
+        for student_id in activity:
+            names.setdefault(student_id, f"Student {student_id}")
+
+        summaries: List[TeacherStudentSummary] = []
+        for student_id, name in names.items():
+            row = activity.get(student_id)
+            attempt_count = row["attempt_count"] if row else 0
+            last_activity = None
+            if row and row["last_created_at"] is not None:
+                last_activity = (
+                    datetime.utcfromtimestamp(row["last_created_at"]).isoformat() + "Z"
+                )
+            summaries.append(
+                TeacherStudentSummary(
+                    student_id=student_id,
+                    name=name,
+                    overall_mastery=_rounded_mean(row["mastery_sum"], row["mastery_count"])
+                    if row
+                    else 0.0,
+                    questions_answered=row["questions_answered"] if row else 0,
+                    attempt_count=attempt_count,
+                    last_activity_at=last_activity,
+                    hint_usage_rate=(row["hint_attempts"] / attempt_count)
+                    if attempt_count
+                    else None,
+                )
             )
-        )
 
     summaries.sort(key=lambda summary: summary.name.lower())
     return summaries
 
 
+@metrics.instrumented("teacher_unit_summaries")
 def compute_teacher_unit_summaries() -> List[TeacherUnitSummary]:
     """
     Aggregate mastery and activity information per unit.
     """
 
-    units = load_units()
-    attempts = get_attempts_for_all_students()
-    attempts_by_unit: Dict[str, List[Attempt]] = {}
-    mastery_by_unit_student: Dict[str, Dict[str, List[float]]] = {}
-
-    for attempt in attempts:
-        if not attempt.unit_id:
-            continue
-        attempts_by_unit.setdefault(attempt.unit_id, []).append(attempt)
-        if attempt.quiz_type in MASTERY_QUIZ_TYPES:
-            mastery_by_unit_student.setdefault(attempt.unit_id, {}).setdefault(
-                attempt.student_id, []
-            ).append(attempt.score_pct)
-
-    summaries: List[TeacherUnitSummary] = []
-    for unit in units:
-        unit_attempts = attempts_by_unit.get(unit.id, [])
-        students_with_activity = {a.student_id for a in unit_attempts}
-        mastery_entries = mastery_by_unit_student.get(unit.id, {})
-        per_student_mastery = [
-            _average(scores) for scores in mastery_entries.values() if scores
-        ]
-        hint_attempts = sum(
-            1 for attempt in unit_attempts if any(r.used_hint for r in attempt.results)
-        )
-        hint_rate = (hint_attempts / len(unit_attempts)) if unit_attempts else None
-        summaries.append(
-            TeacherUnitSummary(
-                unit_id=unit.id,
-                unit_name=unit.title,
-                average_mastery=_average(per_student_mastery),
-                attempt_count=len(unit_attempts),
-                student_count=len(students_with_activity),
-                hint_usage_rate=hint_rate,
+    with teacher_activity.read() as state:
+        activity = state["units"]
+
+        summaries: List[TeacherUnitSummary] = []
+        for unit in load_units():
+            row = activity.get(unit.id)
+            attempt_count = row["attempt_count"] if row else 0
+            per_student_mastery = [
+                _rounded_mean(total, count)
+                for total, count in (row["mastery"].values() if row else [])
+                if count
+            ]
+            summaries.append(
+                TeacherUnitSummary(
+                    unit_id=unit.id,
+                    unit_name=unit.title,
+                    average_mastery=_average(per_student_mastery),
+                    attempt_count=attempt_count,
+                    student_count=len(row["students"]) if row else 0,
+                    hint_usage_rate=(row["hint_attempts"] / attempt_count)
+                    if attempt_count
+                    else None,
+                )
             )
-        )
 
     return summaries
 
@@ -502,7 +794,10 @@ def get_user_by_email(email: str) -> Optional[User]:
     normalized = (email or "").strip().lower()
     if not normalized:
         return None
-    raw = _load_json(USERS_PATH, [])
+    if sqlite_store:
+        raw = sqlite_store.users_by_email(normalized)
+    else:
+        raw = _load_json(USERS_PATH, [])
     for entry in raw:
         entry_email = (entry.get("email") or "").strip().lower()
         if entry_email != normalized:
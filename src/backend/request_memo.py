@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from flask import g, has_request_context
+
+T = TypeVar("T")
+
+
+def _memo() -> Optional[Dict[Hashable, Any]]:
+    if not has_request_context():
+        return None
+    memo = g.get("_request_memo")
+    if memo is None:
+        memo = g._request_memo = {}
+    return memo
+
+
+def _count(name: str) -> None:
+    setattr(g, name, g.get(name, 0) + 1)
+
+
+def memoized(key: Hashable, compute: Callable[[], T]) -> T:
+    """
+    Return ``compute()``, evaluated at most once per HTTP request for ``key``.
+
+    Outside a request nothing is cached, so scripts and background jobs
+    always see fresh data. Memoized values are shared by everything in the
+    request and must be treated as read-only.
+    """
+
+    memo = _memo()
+    if memo is None:
+        return compute()
+    if key in memo:
+        _count("_request_memo_hits")
+        return memo[key]
+    _count("_request_memo_misses")
+    value = memo[key] = compute()
+    return value
+
+
+def request_memoized(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator form of ``memoized`` keyed on the function and its arguments.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        key = (fn.__module__, fn.__qualname__, args, tuple(sorted(kwargs.items())))
+        return memoized(key, lambda: fn(*args, **kwargs))
+
+    return wrapper
+
+
+def invalidate() -> None:
+    """
+    Drop everything memoized in the current request; writers call this so
+    later reads in the same request see their changes.
+    """
+
+    if has_request_context():
+        g.pop("_request_memo", None)
+
+
+def memo_stats() -> Dict[str, int]:
+    if not has_request_context():
+        return {"hits": 0, "misses": 0}
+    return {
+        "hits": g.get("_request_memo_hits", 0),
+        "misses": g.get("_request_memo_misses", 0),
+    }
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import gzip
+from typing import Any, Dict, List
+
+from flask import Response
+from werkzeug.datastructures import Accept
+
+COMPRESSIBLE_MIMETYPES = ("application/json", "application/javascript", "text/")
+
+
+def columnar(records: List[Dict[str, Any]]) -> Any:
+    """
+    Encode a list of records that share the same keys column by column:
+
+        {"columnar": true, "length": 2, "keys": ["id", "name"],
+         "columns": [["a", "b"], ["Ann", "Bo"]]}
+
+    Key names are sent once instead of once per record. Lists whose records
+    do not all have the same keys are returned unchanged, so decoding never
+    has to invent missing fields.
+    """
+
+    if not records or not isinstance(records[0], dict):
+        return records
+    keys = list(records[0])
+    key_set = set(keys)
+    if any(not isinstance(record, dict) or record.keys() != key_set for record in records):
+        return records
+    return {
+        "columnar": True,
+        "length": len(records),
+        "keys": keys,
+        "columns": [[record[key] for record in records] for key in keys],
+    }
+
+
+def accepts_gzip(accept_encodings: Accept) -> bool:
+    """
+    True when ``Accept-Encoding`` allows gzip. An explicit ``gzip`` entry
+    wins over ``*``, and a quality of 0 (``gzip;q=0``) refuses it.
+    """
+
+    for value, quality in accept_encodings:
+        if value.lower() == "gzip":
+            return quality > 0
+    return accept_encodings["*"] > 0
+
+
+def _compressible(response: Response) -> bool:
+    mimetype = response.mimetype or ""
+    return any(mimetype.startswith(prefix) for prefix in COMPRESSIBLE_MIMETYPES)
+
+
+def gzip_response(response: Response, accepts_gzip: bool, min_bytes: int, level: int) -> Response:
+    """
+    Gzip a buffered response body of at least ``min_bytes`` when the client
+    accepts it. Streamed and already-encoded responses are left alone.
+    """
+
+    if (
+        level <= 0
+        or response.direct_passthrough
+        or response.is_streamed
+        or not _compressible(response)
+        or "Content-Encoding" in response.headers
+        or not 200 <= response.status_code < 300
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    if not accepts_gzip:
+        return response
+    body = response.get_data()
+    if len(body) < min_bytes:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=level, mtime=0))
+    response.headers["Content-Encoding"] = "gzip"
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # The compressed bytes are a different representation of the same
+        # content; If-None-Match uses weak comparison, so 304s still match.
+        response.set_etag(etag, weak=True)
+    return response
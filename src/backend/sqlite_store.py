@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS students (
+    student_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    email_key TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_users_email_key ON users (email_key);
+
+CREATE TABLE IF NOT EXISTS attempts (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    student_id TEXT NOT NULL,
+    quiz_id TEXT,
+    quiz_type TEXT,
+    unit_id TEXT,
+    section_id TEXT,
+    score_pct REAL,
+    created_at REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_attempts_student ON attempts (student_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_attempts_unit ON attempts (unit_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_attempts_quiz_type ON attempts (quiz_type, created_at);
+CREATE INDEX IF NOT EXISTS idx_attempts_created_at ON attempts (created_at);
+"""
+
+
+def _email_key(email: Optional[str]) -> str:
+    return (email or "").strip().lower()
+
+
+def _attempt_row(record: Dict[str, Any]):
+    return (
+        record.get("id", ""),
+        record.get("student_id") or "",
+        record.get("quiz_id"),
+        record.get("quiz_type"),
+        record.get("unit_id"),
+        record.get("section_id"),
+        record.get("score_pct"),
+        record.get("created_at"),
+        json.dumps(record, separators=(",", ":")),
+    )
+
+
+class SQLiteStore:
+    """
+    SQLite storage engine for students, users and attempts.
+
+    Rows keep the same JSON documents the flat-file engine stores, with the
+    columns that reads filter on pulled out and indexed. Each thread gets its
+    own connection; the database runs in WAL mode so readers never block the
+    single writer.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', ?)",
+                (uuid.uuid4().hex,),
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # Students -----------------------------------------------------------
+
+    def load_student(self, student_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            "SELECT data FROM students WHERE student_id = ?", (student_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def all_students(self) -> List[Dict[str, Any]]:
+        rows = self._connect().execute("SELECT data FROM students").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def student_ids(self) -> List[str]:
+        rows = self._connect().execute("SELECT student_id FROM students").fetchall()
+        return [row[0] for row in rows]
+
+    def save_student(self, data: Dict[str, Any]) -> None:
+        self.save_students([data])
+
+    def save_students(self, rows: Iterable[Dict[str, Any]]) -> None:
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO students (student_id, data) VALUES (?, ?)",
+                [(data["student_id"], json.dumps(data)) for data in rows],
+            )
+
+    # Users --------------------------------------------------------------
+
+    def users_by_email(self, email: str) -> List[Dict[str, Any]]:
+        rows = self._connect().execute(
+            "SELECT data FROM users WHERE email_key = ?", (_email_key(email),)
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def save_user(self, data: Dict[str, Any]) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO users (id, email_key, data) VALUES (?, ?, ?)",
+                (data["id"], _email_key(data.get("email")), json.dumps(data)),
+            )
+
+    # Attempts -----------------------------------------------------------
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self.append_many([record])
+
+    def append_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO attempts (id, student_id, quiz_id, quiz_type, unit_id,"
+                " section_id, score_pct, created_at, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [_attempt_row(record) for record in records],
+            )
+
+    def iter_records(
+        self,
+        student_id: Optional[str] = None,
+        unit_id: Optional[str] = None,
+        quiz_type: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield attempt records in insertion order, matching AttemptLog.
+        """
+
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (
+            ("student_id", student_id),
+            ("unit_id", unit_id),
+            ("quiz_type", quiz_type),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        # AttemptLog indexes a missing created_at as 0.
+        if since is not None:
+            clauses.append("IFNULL(created_at, 0) >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("IFNULL(created_at, 0) < ?")
+            params.append(until)
+        sql = "SELECT data FROM attempts"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY seq"
+        for row in self._connect().execute(sql, params):
+            yield json.loads(row[0])
+
+    def page_records(
+        self,
+        student_id: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        after: Optional[Tuple[float, int]] = None,
+        limit: int = 50,
+        descending: bool = False,
+    ) -> List[Tuple[Tuple[float, int], Dict[str, Any]]]:
+        """
+        Keyset page of attempts ordered by ``(created_at, seq)``, matching
+        AttemptLog.page_records.
+        """
+
+        clauses: List[str] = []
+        params: List[Any] = []
+        if student_id is not None:
+            clauses.append("student_id = ?")
+            params.append(student_id)
+        if since is not None:
+            clauses.append("IFNULL(created_at, 0) >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("IFNULL(created_at, 0) < ?")
+            params.append(until)
+        if after is not None:
+            clauses.append(f"(IFNULL(created_at, 0), seq) {'<' if descending else '>'} (?, ?)")
+            params.extend(after)
+        sql = "SELECT IFNULL(created_at, 0), seq, data FROM attempts"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        direction = "DESC" if descending else "ASC"
+        sql += f" ORDER BY IFNULL(created_at, 0) {direction}, seq {direction} LIMIT ?"
+        params.append(limit)
+        return [
+            ((float(created_at), seq), json.loads(data))
+            for created_at, seq, data in self._connect().execute(sql, params)
+        ]
+
+    def generation(self) -> str:
+        """
+        Identifier that changes whenever the attempts table is replaced.
+        """
+
+        row = self._connect().execute(
+            "SELECT value FROM meta WHERE key = 'generation'"
+        ).fetchone()
+        return row[0] if row else ""
+
+    def end_cursor(self) -> int:
+        row = self._connect().execute("SELECT MAX(seq) FROM attempts").fetchone()
+        return int(row[0] or 0)
+
+    def read_since(self, cursor: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yield ``(seq, record)`` for every attempt inserted after ``cursor``.
+        """
+
+        rows = self._connect().execute(
+            "SELECT seq, data FROM attempts WHERE seq > ? ORDER BY seq", (cursor,)
+        )
+        for seq, data in rows:
+            yield seq, json.loads(data)
+
+    # Import -------------------------------------------------------------
+
+    def import_json(
+        self,
+        students: Dict[str, Dict[str, Any]],
+        users: List[Dict[str, Any]],
+        attempts: Iterable[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """
+        Load the flat-file engine's data in one transaction, replacing any
+        existing rows.
+        """
+
+        attempt_rows = [_attempt_row(record) for record in attempts]
+        with self._connect() as conn:
+            conn.execute("DELETE FROM students")
+            conn.execute("DELETE FROM users")
+            conn.execute("DELETE FROM attempts")
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('generation', ?)",
+                (uuid.uuid4().hex,),
+            )
+            counts = {
+                "students": conn.executemany(
+                    "INSERT INTO students (student_id, data) VALUES (?, ?)",
+                    [(student_id, json.dumps(data)) for student_id, data in students.items()],
+                ).rowcount,
+                # Users without an id cannot be addressed and are skipped.
+                "users": conn.executemany(
+                    "INSERT INTO users (id, email_key, data) VALUES (?, ?, ?)",
+                    [
+                        (user["id"], _email_key(user.get("email")), json.dumps(user))
+                        for user in users
+                        if "id" in user
+                    ],
+                ).rowcount,
+                "attempts": conn.executemany(
+                    "INSERT INTO attempts (id, student_id, quiz_id, quiz_type, unit_id,"
+                    " section_id, score_pct, created_at, data)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    attempt_rows,
+                ).rowcount,
+            }
+        return counts
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from . import repository
+
+    parser = argparse.ArgumentParser(
+        description="Import the JSON data files into a SQLite database."
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=repository.SQLITE_PATH,
+        help="database to create or overwrite (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    store = SQLiteStore(args.db)
+    counts = store.import_json(
+        students=repository._load_json(repository.STUDENTS_PATH, {}),
+        users=repository._load_json(repository.USERS_PATH, []),
+        attempts=repository.attempt_log.iter_records(),
+    )
+    print(
+        f"Imported {counts['students']} students, {counts['users']} users and "
+        f"{counts['attempts']} attempts into {args.db}"
+    )
+
+
+if __name__ == "__main__":
+    main()
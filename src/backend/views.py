@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import abc
+import atexit
+import json
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+from .locking import atomic_write
+
+
+class AttemptView(abc.ABC):
+    """
+    An aggregate over the attempt store that is maintained incrementally.
+
+    The view remembers the store cursor it has consumed up to and, on every
+    ``refresh``, folds in only the attempts appended since then, so keeping it
+    current costs O(new results) no matter how long the history is. The state
+    and cursor are snapshotted to ``snapshot_path`` every ``save_every``
+    attempts and at exit, which lets a restarted process resume from the
+    snapshot instead of replaying the whole store.
+
+    Subclasses implement ``empty_state`` and ``apply``; their state must be
+    JSON-serializable. ``refresh`` mutates the state in place, so readers
+    must go through ``read`` rather than touching ``state`` directly.
+    """
+
+    def __init__(self, store, snapshot_path: Path, save_every: int = 500) -> None:
+        self.store = store
+        self.snapshot_path = snapshot_path
+        self.save_every = save_every
+        self.state: Any = self.empty_state()
+        self.cursor = 0
+        self.generation = ""
+        # Bumped whenever the state changes so callers can cache derived data.
+        self.version = 0
+        self._loaded = False
+        self._unsaved = 0
+        self._lock = threading.RLock()
+        atexit.register(self.save)
+
+    @abc.abstractmethod
+    def empty_state(self) -> Any:
+        """Return the state of a view over an empty store."""
+
+    @abc.abstractmethod
+    def apply(self, record: Dict[str, Any]) -> None:
+        """Fold one attempt record into ``self.state``."""
+
+    @contextmanager
+    def read(self) -> Iterator[Any]:
+        """
+        Bring the view up to date and yield its state with the view lock
+        held, so concurrent refreshes wait until the block exits. References
+        into the state must not be kept beyond the block.
+        """
+
+        with self._lock:
+            self.refresh()
+            yield self.state
+
+    def _reset(self, generation: str) -> None:
+        self.state = self.empty_state()
+        self.cursor = 0
+        self.generation = generation
+        self.version += 1
+
+    def _load_snapshot(self) -> None:
+        try:
+            with self.snapshot_path.open() as f:
+                snapshot = json.load(f)
+            self.state = snapshot["state"]
+            self.cursor = int(snapshot["cursor"])
+            self.generation = str(snapshot["generation"])
+            self.version += 1
+        except (FileNotFoundError, KeyError, TypeError, ValueError):
+            self._reset("")
+
+    def refresh(self) -> None:
+        with self._lock:
+            if not self._loaded:
+                self._load_snapshot()
+                self._loaded = True
+            generation = self.store.generation()
+            end = self.store.end_cursor()
+            if generation != self.generation or end < self.cursor:
+                self._reset(generation)
+            if end == self.cursor:
+                return
+            applied = 0
+            for cursor, record in self.store.read_since(self.cursor):
+                self.apply(record)
+                self.cursor = cursor
+                applied += 1
+            if applied:
+                self.version += 1
+                self._unsaved += applied
+                if self._unsaved >= self.save_every:
+                    self.save()
+
+    def rebuild(self) -> None:
+        """
+        Discard the current state and replay the whole store.
+        """
+
+        with self._lock:
+            self._loaded = True
+            self._reset(self.store.generation())
+            self.refresh()
+            self._unsaved += 1
+            self.save()
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._loaded or (not self._unsaved and self.snapshot_path.exists()):
+                return
+            atomic_write(
+                self.snapshot_path,
+                json.dumps(
+                    {
+                        "generation": self.generation,
+                        "cursor": self.cursor,
+                        "state": self.state,
+                    },
+                    separators=(",", ":"),
+                ),
+            )
+            self._unsaved = 0
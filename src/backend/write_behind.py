@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+
+class WriteBehindBuffer:
+    """
+    Collect dirty rows in memory and persist them in one group commit.
+
+    ``put`` only records the row, so a save costs O(1) in the request path.
+    A background thread flushes every ``interval`` seconds, or as soon as
+    ``max_dirty`` rows are waiting, and a final flush runs at interpreter
+    exit. Reads must consult ``get``/``pending`` first so they see rows that
+    have not reached storage yet.
+
+    An ``interval`` of 0 disables buffering; callers should then write
+    through.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[Dict[str, Any]]], None],
+        interval: float = 1.0,
+        max_dirty: int = 100,
+    ) -> None:
+        self._flush_rows = flush
+        self.interval = interval
+        self.max_dirty = max_dirty
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        # Rows taken by a flush that is still writing them; readers must
+        # keep seeing them until they are on disk.
+        self._inflight: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+        atexit.register(self.flush)
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    def put(self, key: str, row: Dict[str, Any]) -> None:
+        with self._lock:
+            self._dirty[key] = row
+            full = len(self._dirty) >= self.max_dirty
+        self._ensure_thread()
+        if full:
+            self._wake.set()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._dirty.get(key)
+            return row if row is not None else self._inflight.get(key)
+
+    def pending(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {**self._inflight, **self._dirty}
+
+    def flush(self) -> int:
+        """
+        Write every pending row now. Returns the number of rows written.
+        """
+
+        with self._flush_lock:
+            with self._lock:
+                rows = self._inflight = self._dirty
+                self._dirty = {}
+            if not rows:
+                return 0
+            try:
+                self._flush_rows(list(rows.values()))
+            except BaseException:
+                # Put the rows back unless a newer version arrived meanwhile.
+                with self._lock:
+                    for key, row in rows.items():
+                        self._dirty.setdefault(key, row)
+                    self._inflight = {}
+                raise
+            with self._lock:
+                self._inflight = {}
+            return len(rows)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            # Threads do not survive fork, so each worker process starts its own.
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name="write-behind-flush", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval if self.interval > 0 else None)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Rows stay queued; the next tick retries.
+                continue
@@ -1,11 +1,43 @@
 const API_BASE = "http://127.0.0.1:5000/api";
 
+// Lists requested with ?encoding=columnar arrive as
+// { columnar: true, length, keys, columns }; turn them back into records.
+function isColumnar(value) {
+  return Boolean(value) && value.columnar === true && Array.isArray(value.keys);
+}
+
+export function decodeColumnar(value) {
+  if (!isColumnar(value)) return value;
+  const { length, keys, columns } = value;
+  const records = new Array(length);
+  for (let row = 0; row < length; row += 1) {
+    const record = {};
+    for (let col = 0; col < keys.length; col += 1) {
+      record[keys[col]] = columns[col][row];
+    }
+    records[row] = record;
+  }
+  return records;
+}
+
+// Columnar lists appear either as the whole payload or as one of its
+// top-level fields.
+function decodePayload(payload) {
+  if (isColumnar(payload)) return decodeColumnar(payload);
+  if (payload && typeof payload === "object" && !Array.isArray(payload)) {
+    for (const key of Object.keys(payload)) {
+      payload[key] = decodeColumnar(payload[key]);
+    }
+  }
+  return payload;
+}
+
 async function handleResponse(res, path) {
   if (!res.ok) {
     const text = await res.text().catch(() => "");
     throw new Error(`Request to ${path} failed: ${res.status} ${text}`);
   }
-  return res.json();
+  return decodePayload(await res.json());
 }
 
 export async function apiGet(path) {
@@ -3,5 +3,28 @@ import { getCurrentStudentId } from "./studentClient";
 
 export async function fetchAttempts() {
   const id = getCurrentStudentId();
-  return apiGet(`/attempts/${id}`);
+  return apiGet(`/attempts/${id}?encoding=columnar`);
+}
+
+// One page of history ordered by created_at. Pass the returned next_cursor
+// back as `cursor` until it is null; `fields: "summary"` omits results.
+export async function fetchAttemptPage({
+  cursor,
+  limit = 50,
+  since,
+  until,
+  fields,
+  order = "desc",
+} = {}) {
+  const id = getCurrentStudentId();
+  const params = new URLSearchParams({
+    limit: String(limit),
+    order,
+    encoding: "columnar",
+  });
+  if (cursor) params.set("cursor", cursor);
+  if (since != null) params.set("since", String(since));
+  if (until != null) params.set("until", String(until));
+  if (fields) params.set("fields", fields);
+  return apiGet(`/attempts/${id}?${params}`);
 }
@@ -72,11 +72,11 @@ export type TeacherStudentDetailResponse = {
 };
 
 export async function fetchTeacherOverview(): Promise<TeacherOverviewResponse> {
-  return apiGet("/teacher/overview");
+  return apiGet("/teacher/overview?encoding=columnar");
 }
 
 export async function fetchTeacherStudentDetail(
   studentId: string
 ): Promise<TeacherStudentDetailResponse> {
-  return apiGet(`/teacher/students/${studentId}`);
+  return apiGet(`/teacher/students/${studentId}?encoding=columnar`);
 }
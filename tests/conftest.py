@@ -0,0 +1,16 @@
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+SEED_DATA_DIR = SRC_DIR / "backend" / "data"
+sys.path.insert(0, str(SRC_DIR))
+
+# Point the backend at a scratch copy of the seed data before any test
+# imports it, so test runs never touch src/backend/data.
+DATA_DIR = Path(tempfile.mkdtemp(prefix="bitbybit-test-"))
+for name in ("units.json", "questions.json", "quizzes.json", "users.json", "students.json"):
+    shutil.copy(SEED_DATA_DIR / name, DATA_DIR / name)
+os.environ["BITBYBIT_DATA_DIR"] = str(DATA_DIR)
@@ -0,0 +1,66 @@
+import pytest
+
+from backend.main import create_app
+
+
+@pytest.fixture
+def client():
+    return create_app().test_client()
+
+
+def _attempt(**overrides):
+    attempt = {
+        "student_id": "api-test-student",
+        "quiz_id": "mini-alg-1",
+        "quiz_type": "mini_quiz",
+        "unit_id": "algebra-1",
+        "score_pct": 50,
+        "results": [{"question_id": "q1", "correct": True, "chosen_answer": "2", "time_sec": 4}],
+    }
+    attempt.update(overrides)
+    return attempt
+
+
+def test_batch_accepts_well_formed_attempts(client):
+    response = client.post("/api/attempts/batch", json={"attempts": [_attempt(), _attempt(score_pct="75")]})
+
+    assert response.status_code == 201
+    assert [a["score_pct"] for a in response.get_json()["attempts"]] == [50.0, 75.0]
+
+
+@pytest.mark.parametrize(
+    "bad, error",
+    [
+        ("not an attempt", "invalid_attempt"),
+        (_attempt(results="q1"), "invalid_field_results"),
+        (_attempt(results={"question_id": "q1"}), "invalid_field_results"),
+        (_attempt(results=["q1"]), "invalid_field_results"),
+        (_attempt(results=[{"question_id": ["q1"], "correct": True, "chosen_answer": "2"}]), "invalid_field_question_id"),
+        (_attempt(results=[{"question_id": "q1", "correct": True, "chosen_answer": "2", "time_sec": "slow"}]), "invalid_field_time_sec"),
+        (_attempt(student_id={"id": 1}), "invalid_field_student_id"),
+        (_attempt(section_id=3), "invalid_field_section_id"),
+        (_attempt(score_pct=None), "invalid_field_score_pct"),
+        (_attempt(score_pct=True), "invalid_field_score_pct"),
+        (_attempt(created_at="yesterday"), "invalid_field_created_at"),
+    ],
+)
+def test_batch_rejects_malformed_attempt_with_its_index(client, bad, error):
+    response = client.post("/api/attempts/batch", json={"attempts": [_attempt(), bad]})
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": error, "index": 1}
+
+
+def test_batch_requires_a_list_of_attempts(client):
+    for body in ({}, {"attempts": []}, {"attempts": {"0": _attempt()}}, ["not", "an", "object"]):
+        response = client.post("/api/attempts/batch", json=body)
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "attempts_required"
+
+
+def test_single_attempt_rejects_malformed_fields(client):
+    assert client.post("/api/attempts", json=["not", "an", "object"]).status_code == 400
+    response = client.post("/api/attempts", json=_attempt(results=[None]))
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "invalid_field_results"}
@@ -0,0 +1,110 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from backend.ml.bkt import DEFAULT_PARAMS, MAX_GUESS, MAX_SLIP, Observations, fit_bkt_params
+from conftest import SRC_DIR
+
+TRUTH = {
+    "prior": np.array([0.2, 0.45]),
+    "learn": np.array([0.1, 0.25]),
+    "slip": np.array([0.08, 0.15]),
+    "guess": np.array([0.25, 0.12]),
+}
+
+
+def _simulate(n_sequences=4000, length=20, seed=17):
+    """Draw answers from a known BKT model, one skill per sequence."""
+
+    rng = np.random.default_rng(seed)
+    seq_skill = rng.integers(0, 2, n_sequences)
+    known = rng.random(n_sequences) < TRUTH["prior"][seq_skill]
+    correct = np.empty((n_sequences, length), dtype=bool)
+    for t in range(length):
+        p_correct = np.where(known, 1.0 - TRUTH["slip"][seq_skill], TRUTH["guess"][seq_skill])
+        correct[:, t] = rng.random(n_sequences) < p_correct
+        known |= rng.random(n_sequences) < TRUTH["learn"][seq_skill]
+    return Observations(
+        skill_ids=["skill-0", "skill-1"],
+        skill=np.repeat(seq_skill, length),
+        sequence=np.repeat(np.arange(n_sequences), length),
+        correct=correct.reshape(-1),
+    )
+
+
+def test_fit_recovers_known_parameters():
+    result = fit_bkt_params(_simulate(), max_iterations=200, tolerance=1e-7)
+
+    assert set(result.skills) == {"skill-0", "skill-1"}
+    for code, skill_id in enumerate(["skill-0", "skill-1"]):
+        params = result.skills[skill_id]
+        for name, expected in TRUTH.items():
+            assert abs(getattr(params, name) - expected[code]) < 0.05, (skill_id, name)
+        assert params.slip <= MAX_SLIP
+        assert params.guess <= MAX_GUESS
+
+
+def test_more_iterations_do_not_lower_likelihood():
+    obs = _simulate(n_sequences=500)
+    one = fit_bkt_params(obs, max_iterations=1)
+    many = fit_bkt_params(obs, max_iterations=30)
+
+    assert many.iterations > 1
+    assert many.log_likelihood >= one.log_likelihood
+
+
+def test_rows_are_fitted_in_per_sequence_order():
+    # Shuffling rows across sequences (but not within one) must not change the fit.
+    obs = _simulate(n_sequences=300)
+    order = np.argsort(np.random.default_rng(3).permutation(300)[obs.sequence], kind="stable")
+    shuffled = Observations(obs.skill_ids, obs.skill[order], obs.sequence[order], obs.correct[order])
+
+    expected = fit_bkt_params(obs, max_iterations=10)
+    actual = fit_bkt_params(shuffled, max_iterations=10)
+
+    for skill_id, params in expected.skills.items():
+        for name in TRUTH:
+            assert np.isclose(getattr(actual.skills[skill_id], name), getattr(params, name))
+
+
+def test_sparse_skills_keep_default_parameters():
+    obs = Observations(
+        skill_ids=["rare"],
+        skill=np.zeros(5, dtype=np.int64),
+        sequence=np.zeros(5, dtype=np.int64),
+        correct=np.array([False, True, True, True, True]),
+    )
+    result = fit_bkt_params(obs)
+
+    assert result.skills == {}
+    assert result.observations == {"rare": 5}
+    assert result.to_json()["default"]["prior"] == DEFAULT_PARAMS.prior
+
+
+def test_fit_of_no_observations_returns_defaults():
+    empty = Observations([], np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=bool))
+    result = fit_bkt_params(empty)
+
+    assert result.default == DEFAULT_PARAMS
+    assert result.skills == {}
+
+
+def _import_knowledge_tracing(mode):
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR), "BITBYBIT_KNOWLEDGE_TRACING": mode}
+    return subprocess.run(
+        [sys.executable, "-c", "from backend.ml import knowledge_tracing as kt; print(kt.KNOWLEDGE_TRACING_MODE)"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_knowledge_tracing_mode_is_validated_at_import():
+    assert _import_knowledge_tracing(" BKT ").stdout.strip() == "bkt"
+    assert _import_knowledge_tracing("").stdout.strip() == "rule"
+
+    typo = _import_knowledge_tracing("bk")
+    assert typo.returncode != 0
+    assert "Unknown BITBYBIT_KNOWLEDGE_TRACING mode: 'bk'" in typo.stderr
@@ -0,0 +1,50 @@
+import json
+import os
+
+from backend.catalog import CatalogCache
+
+
+def _load(path):
+    return json.loads(path.read_text())
+
+
+def test_cache_hits_until_the_file_changes(tmp_path):
+    path = tmp_path / "units.json"
+    path.write_text('["a"]')
+    cache = CatalogCache()
+
+    assert cache.get(path, _load, tuple) == ("a",)
+    assert cache.get(path, _load, tuple) == ("a",)
+    assert cache.stats()["hits"] == 1
+
+    path.write_text('["a", "b"]')
+    assert cache.get(path, _load, tuple) == ("a", "b")
+
+
+def test_write_during_load_is_not_masked(tmp_path):
+    path = tmp_path / "units.json"
+    path.write_text('["old"]')
+    stat = path.stat()
+    cache = CatalogCache()
+
+    def load_then_write(p):
+        data = _load(p)
+        p.write_text('["new"]')
+        os.utime(p, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        return data
+
+    assert cache.get(path, load_then_write, tuple) == ("old",)
+    assert cache.get(path, _load, tuple) == ("new",)
+
+
+def test_file_created_by_loader_is_cached(tmp_path):
+    path = tmp_path / "units.json"
+    cache = CatalogCache()
+
+    def create(p):
+        p.write_text("[]")
+        return []
+
+    assert cache.get(path, create, tuple) == ()
+    assert cache.get(path, _load, tuple) == ()
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
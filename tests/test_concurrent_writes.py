@@ -0,0 +1,137 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from conftest import SEED_DATA_DIR, SRC_DIR
+
+WORKERS = 3
+UPDATES_PER_WORKER = 15
+
+# Each worker repeatedly loads the same student, adds one skill entry and
+# saves it back, the same read-modify-write the attempt endpoints perform.
+STUDENT_WORKER = """
+import sys
+from backend.models import StudentState
+from backend.repository import load_student, save_student, student_transaction
+
+worker, updates = sys.argv[1], int(sys.argv[2])
+for i in range(updates):
+    with student_transaction():
+        student = load_student("student-1") or StudentState("student-1", "Student 1")
+        student.skill_mastery[f"{worker}-{i}"] = {"p_mastery": 0.5, "n_observations": 1}
+        if worker == "w0":
+            student.name = f"Renamed {i}"
+        save_student(student)
+"""
+
+ATTEMPT_WORKER = """
+import sys
+from backend.models import Attempt
+from backend.repository import append_attempt
+
+worker, updates = sys.argv[1], int(sys.argv[2])
+for i in range(updates):
+    append_attempt(
+        Attempt(
+            id=f"{worker}-{i}",
+            student_id="student-1",
+            quiz_id="mini-alg-1",
+            quiz_type="mini_quiz",
+            unit_id="algebra-1",
+            section_id=None,
+            score_pct=50.0,
+            created_at=float(i),
+        )
+    )
+"""
+
+
+COUNTER_WORKER = """
+import sys
+from pathlib import Path
+from backend.locking import locked
+from backend.repository import _load_json, _save_json
+
+path, updates = Path(sys.argv[3]), int(sys.argv[2])
+for _ in range(updates):
+    with locked(path):
+        data = _load_json(path, {"count": 0})
+        data["count"] += 1
+        _save_json(path, data)
+"""
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def worker_env(request, tmp_path):
+    for name in ("units.json", "questions.json", "quizzes.json", "users.json", "students.json"):
+        shutil.copy(SEED_DATA_DIR / name, tmp_path / name)
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith("BITBYBIT_STUDENT_FLUSH")
+    }
+    env.update(
+        BITBYBIT_DATA_DIR=str(tmp_path),
+        BITBYBIT_STORAGE=request.param,
+        PYTHONPATH=str(SRC_DIR),
+    )
+    return env
+
+
+def _run_workers(script, env, *args):
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", script, f"w{n}", str(UPDATES_PER_WORKER), *args],
+            env=env,
+            stderr=subprocess.PIPE,
+        )
+        for n in range(WORKERS)
+    ]
+    for proc in procs:
+        _, stderr = proc.communicate(timeout=120)
+        assert proc.returncode == 0, stderr.decode()
+
+
+def _read_back(env, expression):
+    out = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json\n"
+            "from backend.repository import *\n"
+            f"print(json.dumps({expression}))",
+        ],
+        env=env,
+        capture_output=True,
+        check=True,
+    )
+    return json.loads(out.stdout)
+
+
+def test_concurrent_student_updates_are_not_lost(worker_env):
+    _run_workers(STUDENT_WORKER, worker_env)
+
+    student = _read_back(worker_env, 'load_student("student-1").to_dict()')
+    expected = {f"w{n}-{i}" for n in range(WORKERS) for i in range(UPDATES_PER_WORKER)}
+    assert expected <= set(student["skill_mastery"])
+    assert student["name"] == f"Renamed {UPDATES_PER_WORKER - 1}"
+
+
+def test_concurrent_attempt_appends_are_not_lost(worker_env):
+    _run_workers(ATTEMPT_WORKER, worker_env)
+
+    ids = _read_back(worker_env, '[a.id for a in load_attempts("student-1")]')
+    expected = {f"w{n}-{i}" for n in range(WORKERS) for i in range(UPDATES_PER_WORKER)}
+    assert expected <= set(ids)
+    assert len(ids) == len(set(ids))
+
+
+def test_locked_json_read_modify_write_is_atomic(worker_env, tmp_path):
+    counter = tmp_path / "counter.json"
+    _run_workers(COUNTER_WORKER, worker_env, str(counter))
+
+    assert json.loads(counter.read_text()) == {"count": WORKERS * UPDATES_PER_WORKER}
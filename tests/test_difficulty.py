@@ -0,0 +1,78 @@
+import numpy as np
+
+from backend.ml.columnar import ResultColumns, estimate_question_difficulty_vectorized
+from backend.ml.difficulty import estimate_question_difficulty
+from backend.models import Attempt, AttemptQuestionResult, Question
+
+
+def _questions(count):
+    return {
+        f"q{i}": Question(
+            id=f"q{i}",
+            unit_id="unit",
+            section_id="section",
+            text=f"q{i}",
+            type="mcq",
+            options=["A", "B"],
+            correct_answer="A",
+            difficulty=("easy", "medium", "hard")[i % 3],
+            estimated_time_sec=30 + (i % 4) * 15,
+        )
+        for i in range(count)
+    }
+
+
+def _attempts(columns, per_attempt=10):
+    codes = columns.question_index.tolist()
+    correct = columns.correct.tolist()
+    time_sec = columns.time_sec.tolist()
+    return [
+        Attempt(
+            id=str(offset),
+            student_id="s",
+            quiz_id="quiz",
+            quiz_type="practice",
+            unit_id="unit",
+            section_id=None,
+            score_pct=0.0,
+            results=[
+                AttemptQuestionResult(columns.question_ids[codes[i]], correct[i], "A", time_sec[i])
+                for i in range(offset, min(offset + per_attempt, len(codes)))
+            ],
+        )
+        for offset in range(0, len(codes), per_attempt)
+    ]
+
+
+def test_vectorized_difficulty_matches_scalar_estimator():
+    rng = np.random.default_rng(11)
+    lookup = _questions(60)
+    # Leave a few catalog questions unanswered and answer one unknown id.
+    question_ids = list(lookup)[:55] + ["unknown"]
+    rows = 5000
+    time_sec = np.round(rng.gamma(2.0, 20.0, size=rows), 1)
+    time_sec[rng.random(rows) < 0.05] = 0.0
+    columns = ResultColumns(
+        question_ids=question_ids,
+        question_index=rng.integers(0, len(question_ids), size=rows).astype(np.int64),
+        correct=rng.random(rows) < 0.65,
+        time_sec=time_sec,
+    )
+
+    vectorized = estimate_question_difficulty_vectorized(columns, lookup)
+    reference = estimate_question_difficulty(_attempts(columns), lookup)
+
+    assert vectorized == reference
+    assert list(vectorized) == list(reference)
+
+
+def test_vectorized_difficulty_of_no_rows_matches_scalar_estimator():
+    lookup = _questions(3)
+    columns = ResultColumns(
+        question_ids=[],
+        question_index=np.empty(0, dtype=np.int64),
+        correct=np.empty(0, dtype=bool),
+        time_sec=np.empty(0),
+    )
+
+    assert estimate_question_difficulty_vectorized(columns, lookup) == estimate_question_difficulty([], lookup)
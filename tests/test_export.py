@@ -0,0 +1,114 @@
+import gzip
+import json
+
+import pytest
+
+from backend.main import create_app
+from backend.models import Attempt, AttemptQuestionResult, PackedResults
+from backend.repository import append_attempts
+
+TOKEN = "export-test-token"
+HEADERS = {"X-Admin-Token": TOKEN}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def attempts():
+    append_attempts(
+        [
+            Attempt(
+                id=f"export-{student}-{i}",
+                student_id=f"export-{student}",
+                quiz_id="mini-alg-1-1",
+                quiz_type="mini_quiz",
+                unit_id="algebra-1",
+                section_id="1.1",
+                score_pct=50.0,
+                created_at=1000.0 + i,
+                results=PackedResults(
+                    [
+                        AttemptQuestionResult("q1", True, "2", 5.0),
+                        AttemptQuestionResult("q2", False, 3, 7.5, True),
+                    ]
+                ),
+            )
+            for student, count in (("a", 3), ("b", 1))
+            for i in range(count)
+        ]
+    )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("BITBYBIT_ADMIN_TOKEN", TOKEN)
+    return create_app().test_client()
+
+
+def _lines(response):
+    body = response.get_data()
+    if response.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return [json.loads(line) for line in body.decode().splitlines()]
+
+
+def test_export_requires_the_admin_token_header(client):
+    assert client.get("/api/export/attempts").status_code == 403
+    assert client.get("/api/export/attempts", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    # Tokens in the query string would end up in access logs.
+    assert client.get(f"/api/export/attempts?admin_token={TOKEN}").status_code == 403
+
+
+def test_export_is_disabled_without_a_configured_token(monkeypatch):
+    monkeypatch.setenv("BITBYBIT_ADMIN_TOKEN", "")
+    client = create_app().test_client()
+
+    assert client.get("/api/export/attempts", headers={"X-Admin-Token": ""}).status_code == 403
+
+
+def test_export_streams_one_line_per_attempt_for_a_student(client):
+    response = client.get("/api/export/attempts?student_id=export-a", headers=HEADERS)
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "application/x-ndjson"
+    records = _lines(response)
+    assert [r["id"] for r in records] == ["export-a-0", "export-a-1", "export-a-2"]
+    assert records[0]["results"][1] == {
+        "question_id": "q2",
+        "correct": False,
+        "chosen_answer": 3,
+        "time_sec": 7.5,
+        "used_hint": True,
+    }
+
+
+def test_export_flattens_results_rows(client):
+    response = client.get(
+        "/api/export/attempts?student_id=export-a&rows=results&since=1001", headers=HEADERS
+    )
+
+    records = _lines(response)
+    assert len(records) == 4
+    assert [(r["attempt_id"], r["question_id"]) for r in records] == [
+        ("export-a-1", "q1"),
+        ("export-a-1", "q2"),
+        ("export-a-2", "q1"),
+        ("export-a-2", "q2"),
+    ]
+    assert "results" not in records[0]
+    assert records[0]["student_id"] == "export-a"
+
+
+def test_export_gzip_round_trips(client):
+    plain = client.get("/api/export/attempts?student_id=export-b", headers=HEADERS)
+    compressed = client.get(
+        "/api/export/attempts?student_id=export-b&gzip=1", headers=HEADERS
+    )
+
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert _lines(compressed) == _lines(plain) != []
+
+
+def test_export_rejects_bad_options(client):
+    for query in ("rows=everything", "since=yesterday"):
+        response = client.get(f"/api/export/attempts?{query}", headers=HEADERS)
+        assert response.status_code == 400
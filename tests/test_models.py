@@ -0,0 +1,47 @@
+from backend.models import Attempt, AttemptQuestionResult, PackedResults
+from backend.repository import _deserialize_attempt
+
+
+def _results():
+    return [
+        AttemptQuestionResult("q1", True, "2", 12.5, False),
+        AttemptQuestionResult("q2", False, "x", 30.0, True),
+        AttemptQuestionResult("q3", True, 3, 0.0, False),
+        AttemptQuestionResult("q4", False, None, 4.0, True),
+        AttemptQuestionResult("q5", True, True, 1.5, True),
+    ]
+
+
+def test_packed_results_round_trip():
+    results = _results()
+    packed = PackedResults(results)
+
+    assert len(packed) == len(results)
+    assert list(packed) == results
+    assert packed == results
+    assert packed[-1] == results[-1]
+    assert packed[1:3] == results[1:3]
+
+
+def test_packed_results_keep_non_string_answers():
+    packed = PackedResults(_results())
+
+    assert [r.chosen_answer for r in packed] == ["2", "x", 3, None, True]
+
+
+def test_attempt_with_non_string_answers_survives_storage_round_trip():
+    attempt = Attempt(
+        id="a1",
+        student_id="s1",
+        quiz_id="quiz",
+        quiz_type="practice",
+        unit_id="unit",
+        section_id=None,
+        score_pct=60.0,
+        created_at=1.0,
+        results=PackedResults(_results()),
+    )
+
+    restored = _deserialize_attempt(attempt.to_dict())
+
+    assert restored.to_dict() == attempt.to_dict()
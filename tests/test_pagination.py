@@ -0,0 +1,122 @@
+import base64
+
+import pytest
+
+from backend import repository
+from backend.attempt_log import AttemptLog
+from backend.sqlite_store import SQLiteStore
+
+# created_at per attempt, in append order: ties on 3.0 and 5.0, and one
+# attempt without a created_at, which sorts as 0.
+CREATED_AT = [5.0, 3.0, 3.0, None, 3.0, 1.0, 5.0, 2.0]
+
+
+def _record(attempt_id, created_at, student_id="s1"):
+    record = {
+        "id": attempt_id,
+        "student_id": student_id,
+        "quiz_id": "mini-alg-1",
+        "quiz_type": "mini_quiz",
+        "unit_id": "algebra-1",
+        "section_id": None,
+        "score_pct": 50.0,
+        "results": [{"question_id": "q1", "correct": True, "chosen_answer": "2", "time_sec": 1.0}],
+    }
+    if created_at is not None:
+        record["created_at"] = created_at
+    return record
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path, monkeypatch):
+    if request.param == "sqlite":
+        store = SQLiteStore(tmp_path / "bitbybit.sqlite3")
+    else:
+        store = AttemptLog(tmp_path / "attempts.jsonl")
+    store.append_many(_record(f"a{i}", created_at) for i, created_at in enumerate(CREATED_AT))
+    monkeypatch.setattr(repository, "attempt_store", store)
+    return store
+
+
+def _expected(newest_first=False, keep=lambda created_at: True):
+    keys = sorted(
+        ((created_at or 0.0, i) for i, created_at in enumerate(CREATED_AT) if keep(created_at or 0.0)),
+        reverse=newest_first,
+    )
+    return [f"a{i}" for _, i in keys]
+
+
+def _all_pages(limit=3, **options):
+    ids, cursor, pages = [], None, 0
+    while True:
+        attempts, cursor = repository.page_attempts("s1", limit=limit, cursor=cursor, **options)
+        ids.extend(a.id for a in attempts)
+        pages += 1
+        if cursor is None:
+            return ids, pages
+
+
+@pytest.mark.parametrize("newest_first", [False, True])
+def test_pages_walk_every_attempt_in_order(store, newest_first):
+    ids, pages = _all_pages(newest_first=newest_first)
+
+    assert ids == _expected(newest_first)
+    assert pages == 3
+
+
+@pytest.mark.parametrize("newest_first", [False, True])
+def test_page_size_one_breaks_ties_consistently(store, newest_first):
+    ids, _ = _all_pages(limit=1, newest_first=newest_first)
+
+    assert ids == _expected(newest_first)
+
+
+def test_cursor_is_stable_across_appends(store):
+    first, cursor = repository.page_attempts("s1", limit=4)
+    assert [a.id for a in first] == _expected()[:4]
+
+    # Before the cursor, tied with the last row returned, and after it.
+    store.append_many(
+        [_record("early", 0.5), _record("tied", first[-1].created_at), _record("late", 9.0)]
+    )
+    rest, cursor = repository.page_attempts("s1", limit=50, cursor=cursor)
+
+    assert cursor is None
+    rest_ids = [a.id for a in rest]
+    assert "early" not in rest_ids
+    assert rest_ids[-1] == "late"
+    assert set(rest_ids) == set(_expected()[4:]) | {"tied", "late"}
+    assert not set(rest_ids) & {a.id for a in first}
+
+
+@pytest.mark.parametrize("newest_first", [False, True])
+def test_since_and_until_combine_with_the_cursor(store, newest_first):
+    ids, _ = _all_pages(limit=1, since=2.0, until=5.0, newest_first=newest_first)
+
+    assert ids == _expected(newest_first, keep=lambda created_at: 2.0 <= created_at < 5.0)
+
+
+def test_until_keeps_attempts_without_created_at(store):
+    ids, _ = _all_pages(until=2.0)
+
+    assert ids == ["a3", "a5"]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        base64.urlsafe_b64encode(b"[1]").decode(),
+        base64.urlsafe_b64encode(b'{"a": 1}').decode(),
+        base64.urlsafe_b64encode(b'["x", 1]').decode(),
+    ],
+)
+def test_malformed_cursor_is_rejected(store, cursor):
+    with pytest.raises(ValueError):
+        repository.page_attempts("s1", limit=3, cursor=cursor)
+
+
+def test_since_treats_missing_created_at_as_zero(store):
+    ids, _ = _all_pages(since=0.0, until=2.0)
+
+    assert ids == ["a3", "a5"]
@@ -0,0 +1,129 @@
+import json
+import os
+
+import pytest
+
+from backend.main import create_app
+from backend.models import Attempt, AttemptQuestionResult, PackedResults
+from backend.payload_cache import PayloadCache
+from backend.repository import QUIZZES_PATH, append_attempt
+
+QUIZ_URL = "/api/quizzes/diag-alg-1"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("BITBYBIT_PAYLOAD_CACHE_SIZE", "2")
+    return create_app().test_client()
+
+
+@pytest.fixture
+def edit_quizzes():
+    """Rewrite quizzes.json through a callback and restore it afterwards."""
+
+    original = QUIZZES_PATH.read_bytes()
+    stat = QUIZZES_PATH.stat()
+
+    def edit(change):
+        quizzes = json.loads(original)
+        change(quizzes)
+        QUIZZES_PATH.write_text(json.dumps(quizzes))
+        # Make sure the mtime moves even on coarse-grained filesystems.
+        os.utime(QUIZZES_PATH, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    yield edit
+    QUIZZES_PATH.write_bytes(original)
+    os.utime(QUIZZES_PATH, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+def test_cached_payload_has_a_strong_etag(client):
+    response = client.get(QUIZ_URL)
+
+    assert response.status_code == 200
+    etag, weak = response.get_etag()
+    assert etag and not weak
+    assert response.get_json()["id"] == "diag-alg-1"
+    assert response.get_json()["questions"]
+
+
+def test_matching_if_none_match_gets_304(client):
+    etag = client.get(QUIZ_URL).get_etag()[0]
+
+    response = client.get(QUIZ_URL, headers={"If-None-Match": f'"{etag}"'})
+    assert response.status_code == 304
+    assert response.data == b""
+
+    response = client.get(QUIZ_URL, headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+
+
+def test_content_change_yields_a_new_etag(client, edit_quizzes):
+    before = client.get(QUIZ_URL)
+
+    def rename(quizzes):
+        next(q for q in quizzes if q["id"] == "diag-alg-1")["title"] = "Renamed diagnostic"
+
+    edit_quizzes(rename)
+    after = client.get(QUIZ_URL, headers={"If-None-Match": before.headers["ETag"]})
+
+    assert after.status_code == 200
+    assert after.get_etag()[0] != before.get_etag()[0]
+    assert after.get_json()["title"] == "Renamed diagnostic"
+
+
+def test_difficulty_change_keeps_the_etag_of_payloads_that_do_not_use_it(client):
+    # Quiz payloads carry the authored difficulty labels, not the estimated
+    # difficulty, so a new attempt must not invalidate clients' copies.
+    before = client.get(QUIZ_URL)
+    append_attempt(
+        Attempt(
+            id="payload-cache-test",
+            student_id="payload-cache-test-student",
+            quiz_id="diag-alg-1",
+            quiz_type="diagnostic",
+            unit_id="algebra-1",
+            section_id=None,
+            score_pct=0.0,
+            results=PackedResults(
+                [AttemptQuestionResult(q["id"], False, "x", 5.0) for q in before.get_json()["questions"]]
+            ),
+        )
+    )
+
+    after = client.get(QUIZ_URL, headers={"If-None-Match": before.headers["ETag"]})
+    assert after.status_code == 304
+
+
+def test_cache_is_bounded_and_evicts_least_recently_used(client):
+    def stats():
+        return client.get("/api/catalog/stats").get_json()["payloads"]
+
+    client.get("/api/units")
+    client.get("/api/units/algebra-1")
+    client.get("/api/units")  # hit; algebra-1 becomes least recently used
+    client.get(QUIZ_URL)  # evicts algebra-1
+    assert stats() == {"hits": 1, "misses": 3, "entries": 2}
+
+    client.get("/api/units")
+    assert stats()["hits"] == 2
+    client.get("/api/units/algebra-1")
+    assert stats() == {"hits": 2, "misses": 4, "entries": 2}
+
+
+def test_payload_cache_rebuilds_on_a_new_version():
+    cache = PayloadCache(max_entries=4)
+    builds = []
+
+    def build():
+        builds.append(None)
+        return b"body-%d" % len(builds)
+
+    first = cache.get("k", 1, build)
+    assert cache.get("k", 1, build) is first
+    second = cache.get("k", 2, build)
+
+    assert second.body == b"body-2"
+    assert second.etag != first.etag
+    assert cache.stats() == {"hits": 1, "misses": 2, "entries": 1}
+    assert cache.get("missing", 1, lambda: None) is None
+    assert cache.stats()["entries"] == 1
@@ -0,0 +1,43 @@
+from backend.ml import difficulty, recommendation
+from backend.models import Attempt, AttemptQuestionResult, PackedResults
+from backend.repository import append_attempt, load_units
+
+
+def _slots():
+    return {
+        slot.quiz_id: slot
+        for slots in recommendation._skill_slots(load_units()).values()
+        for slot in slots
+    }
+
+
+def test_quiz_difficulty_after_an_attempt_skips_the_full_recompute(monkeypatch):
+    slots = _slots()
+    slot = next(iter(slots.values()))
+    append_attempt(
+        Attempt(
+            id="recommendation-test",
+            student_id="recommendation-test-student",
+            quiz_id=slot.quiz_id,
+            quiz_type=slot.activity,
+            unit_id=slot.unit_id,
+            section_id=slot.section_id,
+            score_pct=0.0,
+            results=PackedResults(
+                [AttemptQuestionResult(qid, False, "x", 10.0) for qid in slot.question_ids]
+            ),
+        )
+    )
+
+    def full_recompute(*args):
+        raise AssertionError("rebuilt the whole question bank's difficulty")
+
+    with monkeypatch.context() as m:
+        m.setattr(difficulty, "_difficulty_from_stats", full_recompute)
+        averages = {quiz_id: recommendation._quiz_avg_difficulty(s) for quiz_id, s in slots.items()}
+
+    full = difficulty.current_question_difficulty()
+    for quiz_id, s in slots.items():
+        entries = [full[qid]["difficulty"] for qid in s.question_ids if qid in full]
+        expected = sum(entries) / len(entries) if entries else 0.5
+        assert averages[quiz_id] == expected
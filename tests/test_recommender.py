@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from backend import recommender
+from backend.models import SkillMastery, StudentState
+from backend.repository import load_questions
+
+
+def _linear_scan_pool(student, unit_id=None, section_id=None):
+    """Top-ten pool of the original implementation: score and sort every question."""
+
+    questions = list(load_questions().values())
+    if unit_id:
+        questions = [q for q in questions if q.unit_id == unit_id]
+    if section_id:
+        questions = [q for q in questions if q.section_id == section_id]
+
+    def score(q):
+        if not q.skill_ids:
+            base = 50.0
+        else:
+            vals = [
+                student.mastery_by_skill[s].pct if s in student.mastery_by_skill else 0.0
+                for s in q.skill_ids
+            ]
+            base = sum(vals) / len(vals)
+        return base - 10.0 if q.difficulty == student.preferred_difficulty else base
+
+    return [q.id for q in sorted(questions, key=score)[:10]]
+
+
+def _students():
+    rng = random.Random(5)
+    skills = sorted({s for q in load_questions().values() for s in q.skill_ids or ()})
+    yield StudentState(student_id="new", name="New")
+    for i in range(5):
+        yield StudentState(
+            student_id=f"s{i}",
+            name=f"S{i}",
+            preferred_difficulty=("easy", "medium", "hard")[i % 3],
+            mastery_by_skill={
+                s: SkillMastery(s, correct=rng.randint(0, 4), total=4)
+                for s in skills
+                if rng.random() < 0.7
+            },
+        )
+
+
+@pytest.mark.parametrize(
+    "unit_id, section_id",
+    [(None, None), ("algebra-1", None), ("quadratic-2", None), ("algebra-1", "1.2"), (None, "2.1")],
+)
+def test_candidate_pool_matches_linear_scan(monkeypatch, unit_id, section_id):
+    pools = []
+    monkeypatch.setattr(recommender.random, "choice", lambda pool: pools.append(pool) or pool[0])
+
+    for student in _students():
+        recommender.pick_next_question(student, unit_id, section_id)
+        assert [q.id for q in pools[-1]] == _linear_scan_pool(student, unit_id, section_id)
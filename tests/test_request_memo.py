@@ -0,0 +1,79 @@
+from flask import jsonify
+
+from backend.main import create_app
+from backend.models import Attempt, AttemptQuestionResult, PackedResults, StudentState
+from backend.repository import (
+    append_attempt,
+    attempt_store,
+    load_attempts,
+    load_student,
+    save_student,
+)
+from backend.request_memo import memo_stats
+
+
+def _attempt(attempt_id, student_id):
+    return Attempt(
+        id=attempt_id,
+        student_id=student_id,
+        quiz_id="mini-alg-1-1",
+        quiz_type="mini_quiz",
+        unit_id="algebra-1",
+        section_id=None,
+        score_pct=100.0,
+        results=PackedResults([AttemptQuestionResult("q1", True, "2", 3.0)]),
+    )
+
+
+def test_writes_invalidate_memoized_loads_in_the_same_request():
+    student_id = "memo-writer"
+    with create_app().test_request_context():
+        assert load_attempts(student_id) == []
+        assert load_attempts(student_id) == []
+        assert memo_stats() == {"hits": 1, "misses": 1}
+
+        append_attempt(_attempt("memo-writer-1", student_id))
+        assert [a.id for a in load_attempts(student_id)] == ["memo-writer-1"]
+
+        student = StudentState(student_id=student_id, name="Before")
+        save_student(student)
+        assert load_student(student_id).name == "Before"
+        student.name = "After"
+        save_student(student)
+        assert load_student(student_id).name == "After"
+
+
+def test_memo_does_not_outlive_the_request():
+    student_id = "memo-reader"
+    app = create_app()
+
+    @app.get("/test/memo/<student_id>")
+    def memo_probe(student_id):
+        first = load_attempts(student_id)
+        second = load_attempts(student_id)
+        return jsonify({"ids": [a.id for a in first], "same": first == second, **memo_stats()})
+
+    client = app.test_client()
+    assert client.get(f"/test/memo/{student_id}").get_json() == {
+        "ids": [],
+        "same": True,
+        "hits": 1,
+        "misses": 1,
+    }
+
+    # Write straight to storage: nothing invalidates a memo, so only a
+    # fresh one per request can see this attempt.
+    attempt_store.append_many([_attempt("memo-reader-1", student_id).to_dict()])
+    assert client.get(f"/test/memo/{student_id}").get_json() == {
+        "ids": ["memo-reader-1"],
+        "same": True,
+        "hits": 1,
+        "misses": 1,
+    }
+
+
+def test_nothing_is_memoized_outside_a_request():
+    student_id = "memo-script"
+    assert load_attempts(student_id) == []
+    attempt_store.append_many([_attempt("memo-script-1", student_id).to_dict()])
+    assert [a.id for a in load_attempts(student_id)] == ["memo-script-1"]
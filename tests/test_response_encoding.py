@@ -0,0 +1,123 @@
+import gzip
+
+import pytest
+from flask import Flask, Response
+from werkzeug.datastructures import Accept
+from werkzeug.http import parse_accept_header
+
+from backend.main import create_app
+from backend.response_encoding import accepts_gzip, columnar, gzip_response
+
+
+def _rows(columns):
+    """Decode a columnar payload the way the frontend's apiClient does."""
+
+    if not isinstance(columns, dict) or columns.get("columnar") is not True:
+        return columns
+    return [
+        {key: column[i] for key, column in zip(columns["keys"], columns["columns"])}
+        for i in range(columns["length"])
+    ]
+
+
+def test_columnar_round_trip():
+    records = [
+        {"id": "a", "name": "Ann", "score": 1.5, "tags": ["x"], "hint": None},
+        {"id": "b", "name": "Bo", "score": 0, "tags": [], "hint": True},
+    ]
+    encoded = columnar(records)
+
+    assert encoded["keys"] == ["id", "name", "score", "tags", "hint"]
+    assert encoded["columns"][0] == ["a", "b"]
+    assert _rows(encoded) == records
+
+
+@pytest.mark.parametrize(
+    "records",
+    [[], [{"id": "a"}, {"id": "b", "extra": 1}], [{"id": "a", "extra": 1}, {"id": "b"}], ["a", "b"]],
+)
+def test_columnar_leaves_irregular_lists_alone(records):
+    assert columnar(records) is records
+
+
+@pytest.mark.parametrize("path", ["/api/students", "/api/teacher/overview"])
+def test_columnar_api_payload_matches_row_payload(path):
+    client = create_app().test_client()
+    rows = client.get(path).get_json()
+    encoded = client.get(path, query_string={"encoding": "columnar"}).get_json()
+
+    assert encoded["students"]["columnar"] is True
+    assert {key: _rows(value) for key, value in encoded.items()} == rows
+
+
+def _gzip(body, accepts_gzip, min_bytes=100, mimetype="application/json", status=200):
+    with Flask(__name__).test_request_context():
+        response = Response(body, mimetype=mimetype, status=status)
+        response.set_etag("abc")
+        return gzip_response(response, accepts_gzip, min_bytes, level=6)
+
+
+def test_gzip_applies_when_accepted_and_large_enough():
+    body = b'{"data": "' + b"x" * 500 + b'"}'
+    response = _gzip(body, accepts_gzip=True)
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.get_data()) == body
+    assert "Accept-Encoding" in response.vary
+    # Same content, different bytes: the ETag is weakened.
+    assert response.get_etag() == ("abc", True)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"accepts_gzip": False},
+        {"accepts_gzip": True, "min_bytes": 10_000},
+        {"accepts_gzip": True, "mimetype": "image/png"},
+        {"accepts_gzip": True, "status": 404},
+    ],
+)
+def test_gzip_skipped(kwargs):
+    body = b"x" * 500
+    response = _gzip(body, **kwargs)
+
+    assert "Content-Encoding" not in response.headers
+    assert response.get_data() == body
+    assert response.get_etag() == ("abc", False)
+
+
+def test_api_gzip_negotiation(monkeypatch):
+    monkeypatch.setenv("BITBYBIT_GZIP_MIN_BYTES", "200")
+    client = create_app().test_client()
+
+    plain = client.get("/api/units")
+    assert len(plain.get_data()) > 200
+    assert "Content-Encoding" not in plain.headers
+    assert "Accept-Encoding" in plain.vary
+
+    compressed = client.get("/api/units", headers={"Accept-Encoding": "gzip, br"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed.get_data()) == plain.get_data()
+
+    refused = client.get("/api/units", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "Content-Encoding" not in refused.headers
+
+    small = client.get("/api/health", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in small.headers
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip", True),
+        ("br, gzip;q=0.5", True),
+        ("*", True),
+        ("", False),
+        ("br", False),
+        ("gzip;q=0", False),
+        ("gzip;q=0, *", False),
+        ("*;q=0", False),
+    ],
+)
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(parse_accept_header(header, Accept)) is expected
@@ -0,0 +1,40 @@
+from backend.sqlite_store import SQLiteStore
+
+
+def _attempt(attempt_id):
+    return {
+        "id": attempt_id,
+        "student_id": "s1",
+        "quiz_id": "mini-alg-1",
+        "quiz_type": "mini_quiz",
+        "unit_id": "algebra-1",
+        "section_id": None,
+        "score_pct": 50.0,
+        "created_at": 1.0,
+        "results": [],
+    }
+
+
+def test_import_json_counts_rows_actually_inserted(tmp_path):
+    store = SQLiteStore(tmp_path / "bitbybit.db")
+    counts = store.import_json(
+        students={"s1": {"student_id": "s1", "name": "Ann"}},
+        users=[
+            {"id": "u1", "email": "ann@example.com"},
+            {"email": "no-id@example.com"},
+            {"id": "u2", "email": "bo@example.com"},
+        ],
+        attempts=[_attempt("a1"), _attempt("a2")],
+    )
+
+    assert counts == {"students": 1, "users": 2, "attempts": 2}
+
+
+def test_iter_records_time_range_treats_missing_created_at_as_zero(tmp_path):
+    store = SQLiteStore(tmp_path / "bitbybit.db")
+    undated = _attempt("a1")
+    del undated["created_at"]
+    store.append_many([undated, _attempt("a2")])
+
+    assert [r["id"] for r in store.iter_records(since=0.0, until=1.0)] == ["a1"]
+    assert [r["id"] for r in store.iter_records(since=0.0)] == ["a1", "a2"]
@@ -0,0 +1,69 @@
+import threading
+
+from backend.models import Attempt, AttemptQuestionResult, PackedResults
+from backend.repository import (
+    append_attempts,
+    compute_teacher_student_summaries,
+    compute_teacher_unit_summaries,
+    teacher_activity,
+)
+
+
+def _attempts(prefix, count):
+    return [
+        Attempt(
+            id=f"{prefix}-{i}",
+            student_id=f"{prefix}-student-{i}",
+            quiz_id="mini-alg-1",
+            quiz_type="mini_quiz",
+            unit_id="algebra-1",
+            section_id=None,
+            score_pct=50.0,
+            created_at=float(i),
+            results=PackedResults([AttemptQuestionResult("q1", i % 2 == 0, "2", 5.0)]),
+        )
+        for i in range(count)
+    ]
+
+
+def _race(refresh, read, rounds=150):
+    """
+    Keep appending attempts and refreshing in one thread while another
+    thread reads; return the exceptions the reader raised.
+    """
+
+    stop = threading.Event()
+    errors = []
+
+    def writer():
+        batch = 0
+        while not stop.is_set():
+            append_attempts(_attempts(f"race-{batch}", 20))
+            refresh()
+            batch += 1
+
+    def reader():
+        try:
+            for _ in range(rounds):
+                read()
+        except Exception as exc:  # noqa: BLE001 - surfaced by the assertion
+            errors.append(exc)
+        finally:
+            stop.set()
+
+    threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_teacher_summaries_are_safe_during_concurrent_refresh():
+    append_attempts(_attempts("seed", 2000))
+
+    def read():
+        compute_teacher_student_summaries([])
+        compute_teacher_unit_summaries()
+
+    assert _race(teacher_activity.refresh, read) == []
@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+
+from backend.write_behind import WriteBehindBuffer
+
+
+def _slow_buffer():
+    """A buffer whose flush blocks until ``release`` is set."""
+
+    started = threading.Event()
+    release = threading.Event()
+    written = []
+
+    def write(rows):
+        started.set()
+        assert release.wait(5)
+        written.extend(rows)
+
+    # A long interval keeps the background thread from flushing on its own.
+    return WriteBehindBuffer(write, interval=3600), started, release, written
+
+
+def test_rows_stay_readable_while_a_flush_writes_them():
+    buffer, started, release, written = _slow_buffer()
+    buffer.put("s1", {"v": 1})
+
+    flusher = threading.Thread(target=buffer.flush)
+    flusher.start()
+    assert started.wait(5)
+    try:
+        assert buffer.get("s1") == {"v": 1}
+        assert buffer.pending() == {"s1": {"v": 1}}
+
+        # A newer write during the flush wins over the in-flight row.
+        buffer.put("s1", {"v": 2})
+        assert buffer.get("s1") == {"v": 2}
+    finally:
+        release.set()
+        flusher.join()
+
+    assert written == [{"v": 1}]
+    assert buffer.pending() == {"s1": {"v": 2}}
+
+
+def test_failed_flush_requeues_rows():
+    written = []
+
+    def fail_once(rows):
+        if not written:
+            written.append(None)
+            raise OSError("disk full")
+        written.extend(rows)
+
+    buffer = WriteBehindBuffer(fail_once, interval=3600)
+    buffer.put("s1", {"v": 1})
+
+    with pytest.raises(OSError):
+        buffer.flush()
+    assert buffer.get("s1") == {"v": 1}
+    assert buffer.pending() == {"s1": {"v": 1}}
+
+    assert buffer.flush() == 1
+    assert written == [None, {"v": 1}]
+    assert buffer.pending() == {}